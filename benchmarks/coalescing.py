@@ -0,0 +1,123 @@
+"""
+Throughput versus latency of single predictions with and without coalescing.
+
+Closed-loop load: every client thread sends one single prediction after the
+other through an in-process PredictionService for --seconds. For each client
+count and coalescing setting it reports throughput (predictions/s) and the
+p50/p99 latency a caller observes; --html draws the curves (one per setting,
+one point per client count).
+
+    python benchmarks/coalescing.py [--clients 1 4 16 64] [--waits-ms 0 1 5 20] [--size 64]
+                                    [--seconds 3] [--json out.json] [--html curves.html]
+
+A wait of 0 disables coalescing (every call scored on its own).
+"""
+
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from portal.ml import DISEASE_CSV, load_and_train_ml_model  # noqa: E402
+from portal.prediction_server import PredictionService  # noqa: E402
+
+
+def run_load(service, inputs, clients, seconds):
+    """Latencies in seconds of every prediction completed by `clients` threads within `seconds`"""
+    latencies = [[] for _ in range(clients)]
+    stop = threading.Event()
+
+    def client(index):
+        own = latencies[index]
+        i = index
+        while not stop.is_set():
+            start = time.perf_counter()
+            result = service.predict(inputs[i % len(inputs)])
+            own.append(time.perf_counter() - start)
+            if 'error' in result:
+                raise RuntimeError(result['error'])
+            i += clients
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return np.concatenate([np.asarray(own) for own in latencies])
+
+
+def measure(ml_models, inputs, clients_list, waits_ms, size, seconds, workers):
+    rows = []
+    for wait_ms in waits_ms:
+        setting = 'no coalescing' if wait_ms == 0 else f'wait {wait_ms:g} ms, up to {size}'
+        for clients in clients_list:
+            service = PredictionService(ml_models, workers=workers, coalesce_size=size if wait_ms else 1,
+                                        coalesce_wait=wait_ms / 1000)
+            try:
+                service.predict(inputs[0])  # warm up the pool threads
+                latencies = run_load(service, inputs, clients, seconds)
+                coalescing = service.stats()['coalescing']
+            finally:
+                service.shutdown()
+            rows.append({
+                'setting': setting,
+                'wait_ms': wait_ms,
+                'clients': clients,
+                'throughput_per_s': len(latencies) / seconds,
+                'p50_ms': float(np.percentile(latencies, 50)) * 1000,
+                'p99_ms': float(np.percentile(latencies, 99)) * 1000,
+                'mean_batch_size': coalescing['mean_batch_size'] if coalescing else 1.0,
+            })
+            row = rows[-1]
+            print(f"{setting:<24} {clients:>4} clients  {row['throughput_per_s']:9.1f}/s  "
+                  f"p50 {row['p50_ms']:8.2f} ms  p99 {row['p99_ms']:8.2f} ms  "
+                  f"batch {row['mean_batch_size']:5.1f}", file=sys.stderr)
+    return rows
+
+
+def write_curves(rows, path):
+    import plotly.express as px
+    fig = px.line(pd.DataFrame(rows), x='throughput_per_s', y='p99_ms', color='setting', markers=True,
+                  hover_data=['clients', 'p50_ms', 'mean_batch_size'], log_y=True,
+                  title="Single predictions: throughput vs p99 latency",
+                  labels={'throughput_per_s': 'Predictions per second', 'p99_ms': 'p99 latency (ms)'})
+    fig.write_html(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clients', nargs='+', type=int, default=[1, 4, 16, 64])
+    parser.add_argument('--waits-ms', nargs='+', type=float, default=[0, 1, 5, 20])
+    parser.add_argument('--size', type=int, default=64, help='largest coalesced batch')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=3)
+    parser.add_argument('--json', help='write the rows to this file')
+    parser.add_argument('--html', help='write the throughput/latency curves to this file')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings('ignore')
+    ml_models = load_and_train_ml_model()
+    inputs = pd.read_csv(DISEASE_CSV)[ml_models['feature_names']].to_dict('records')
+    rows = measure(ml_models, inputs, args.clients, args.waits_ms, args.size, args.seconds, args.workers)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2)
+    if args.html:
+        write_curves(rows, args.html)
+
+
+if __name__ == "__main__":
+    main()
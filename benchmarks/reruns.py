@@ -0,0 +1,136 @@
+"""
+Rerun cost of the interactive regions that run as fragments.
+
+For every interaction it reports:
+  * full: a whole-script rerun after the interaction (theme CSS, sidebar and the
+    complete page), which is what every click or keystroke cost before fragments
+  * fragment: a run of the fragment alone with the same inputs, which is what a
+    fragment-scoped rerun executes
+AppTest always reruns the whole script, so the fragment is timed on its own;
+that figure includes the fixed AppTest harness overhead and is an upper bound.
+
+    python benchmarks/reruns.py [--runs 10] [--json out.json]
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from portal.pages import PAGE_KEYS  # noqa: E402
+
+
+def _custom_chart_fragment():
+    import pandas as pd
+    from portal.ml import DISEASE_CSV
+    from portal.pages.monitoring import custom_chart_builder
+    custom_chart_builder(pd.read_csv(DISEASE_CSV))
+
+
+def _emergency_card_fragment():
+    import pandas as pd
+    from portal.pages.emergency_response import emergency_card
+    emergency_card(pd.Series({
+        'incident_id': 'EMG-001', 'type': 'Disease Outbreak', 'severity': 'High',
+        'location': 'Farm A - Pen 3', 'time': '2 hours ago', 'status': 'In Progress',
+    }))
+
+
+def _farmer_directory_fragment():
+    from portal.pages.farmer_network import farmer_directory
+    from portal.storage import load_data
+    farmer_directory(load_data("farmers_directory.json"))
+
+
+def _upload_disease_csv(at):
+    at.file_uploader[0].set_value(('disease.csv', (ROOT / 'disease.csv').read_bytes(), 'text/csv'))
+
+
+def _next_chart_type(at):
+    chart_type = [s for s in at.selectbox if s.label == "Chart Type"][0]
+    chart_type.select_index((chart_type.index + 1) % len(chart_type.options))
+
+
+def _view_details(at):
+    at.button(key='view_EMG-001').click()
+
+
+def _search_farmers(at):
+    search = [t for t in at.text_input if t.label == "Search by name or specialization"][0]
+    search.set_value('' if search.value else 'poultry')
+
+
+# (name, page key, setup, interaction, fragment)
+INTERACTIONS = [
+    ('monitoring: chart type', 'monitoring', _upload_disease_csv, _next_chart_type, _custom_chart_fragment),
+    ('emergency: view details', 'emergency_response', None, _view_details, _emergency_card_fragment),
+    ('network: farmer search', 'networking', None, _search_farmers, _farmer_directory_fragment),
+]
+
+
+def _open_page(key):
+    at = AppTest.from_file(str(ROOT / 'app.py'), default_timeout=120).run()
+    nav = [s for s in at.sidebar.selectbox if s.label == "Navigate to:"][0]
+    nav.select_index(PAGE_KEYS.index(key)).run()
+    return at
+
+
+def _timed_run(at):
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return elapsed
+
+
+def measure(runs):
+    report = {}
+    for name, page, setup, interact, fragment in INTERACTIONS:
+        at = _open_page(page)
+        if setup is not None:
+            setup(at)
+            at.run()
+        full = []
+        for _ in range(runs):
+            interact(at)
+            full.append(_timed_run(at))
+
+        fragment_at = AppTest.from_function(fragment, default_timeout=120)
+        fragment_at.run()  # warm imports and caches like the page run above
+        partial = [_timed_run(fragment_at) for _ in range(runs)]
+
+        report[name] = {
+            'full_rerun_ms': statistics.median(full) * 1000,
+            'fragment_rerun_ms': statistics.median(partial) * 1000,
+        }
+        report[name]['speedup'] = report[name]['full_rerun_ms'] / report[name]['fragment_rerun_ms']
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--json', help='write the report to this file')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    report = measure(args.runs)
+    for name, timings in report.items():
+        print(f"{name:<26} full {timings['full_rerun_ms']:7.1f} ms   "
+              f"fragment {timings['fragment_rerun_ms']:7.1f} ms   x{timings['speedup']:.1f}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
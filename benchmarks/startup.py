@@ -0,0 +1,100 @@
+"""
+Cold-start benchmark for app.py.
+
+Each run starts a fresh interpreter and measures:
+  * import time of the app module (paid by every new worker before the first byte)
+  * time to first render of the home page through Streamlit's AppTest
+It exits non-zero when the median of either exceeds its budget, or when a
+heavy library that only some pages need is loaded during startup.
+
+    python benchmarks/startup.py [--runs 5] [--max-import 2.5] [--max-first-render 4.0] [--json out.json]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Libraries that must stay out of the startup path. Streamlit itself imports
+# plotly.graph_objects to register its chart theme, so plotly.express is tracked instead.
+LAZY_MODULES = ['sklearn', 'plotly.express', 'matplotlib', 'seaborn', 'altair']
+
+IMPORT_PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import app
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {lazy!r} if m in sys.modules]}}))
+"""
+
+FIRST_RENDER_PROBE = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120)
+start = time.perf_counter()
+at.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {lazy!r} if m in sys.modules],
+                   'exception': [str(e.value) for e in at.exception]}}))
+"""
+
+
+def run_probe(code):
+    """Run a probe in a fresh interpreter and return its JSON report"""
+    completed = subprocess.run(
+        [sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def measure(runs):
+    import_reports = [run_probe(IMPORT_PROBE.format(root=str(ROOT), lazy=LAZY_MODULES)) for _ in range(runs)]
+    render_reports = [run_probe(FIRST_RENDER_PROBE.format(app=str(ROOT / 'app.py'), lazy=LAZY_MODULES)) for _ in range(runs)]
+    return {
+        'import_seconds': statistics.median(r['seconds'] for r in import_reports),
+        'first_render_seconds': statistics.median(r['seconds'] for r in render_reports),
+        'loaded_at_import': sorted(set().union(*(r['loaded'] for r in import_reports))),
+        'loaded_at_first_render': sorted(set().union(*(r['loaded'] for r in render_reports))),
+        'render_exceptions': sorted(set().union(*(r['exception'] for r in render_reports))),
+        'runs': runs,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--max-import', type=float, default=2.5, help='import budget in seconds')
+    parser.add_argument('--max-first-render', type=float, default=4.0, help='first render budget in seconds')
+    parser.add_argument('--json', help='write the report to this file')
+    args = parser.parse_args(argv)
+
+    report = measure(args.runs)
+    failures = []
+    if report['import_seconds'] > args.max_import:
+        failures.append(f"import took {report['import_seconds']:.2f}s (budget {args.max_import:.2f}s)")
+    if report['first_render_seconds'] > args.max_first_render:
+        failures.append(f"first render took {report['first_render_seconds']:.2f}s (budget {args.max_first_render:.2f}s)")
+    if report['loaded_at_first_render']:
+        failures.append(f"heavy modules loaded at startup: {', '.join(report['loaded_at_first_render'])}")
+    if report['render_exceptions']:
+        failures.append(f"home page raised: {report['render_exceptions']}")
+    report['failures'] = failures
+
+    print(f"import:       {report['import_seconds']:.3f}s (budget {args.max_import:.2f}s)")
+    print(f"first render: {report['first_render_seconds']:.3f}s (budget {args.max_first_render:.2f}s)")
+    print(f"lazy modules loaded at startup: {report['loaded_at_first_render'] or 'none'}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
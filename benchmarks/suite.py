@@ -0,0 +1,294 @@
+"""
+Benchmark suite for the portal's hot paths at several data-size tiers.
+
+Per tier (see synthetic_disease.TIERS) it times:
+  * ml.train              load_and_train_ml_model on the tier's synthetic disease.csv
+  * ml.predict_single     one predict_animal_health call
+  * ml.predict_batch      predict_animal_health_batch over up to 10k inputs
+  * risk.score            calculate_risk_score over one assessment per row
+  * storage.round_trip    save_data + load_data of a farmers collection
+  * farmers.search        filter_farmers with a search term over that collection
+  * export.records_csv    farmers directory CSV export
+  * export.compliance_csv compliance matrix CSV export
+  * chart.line            downsampled line chart of a minute-level series, serialized to JSON
+  * page.<key>            rerun of every page through AppTest, mock data scaled to the tier (up to
+                          mock_data.MAX_SCALE)
+Collections are capped at RECORD_CAP records so the 10m tier stays within memory.
+
+Results are written as JSON; --compare flags benchmarks whose median got slower
+than the baseline by more than --tolerance and exits non-zero.
+
+    python benchmarks/suite.py [--tiers 1k 100k] [--repeat 5] [--only ml. risk.] [--json out.json]
+    python benchmarks/suite.py --compare baseline.json [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from synthetic_disease import TIERS, tier_path  # noqa: E402
+
+from portal import storage  # noqa: E402
+from portal.charts import line_chart  # noqa: E402
+from portal.compliance import COMPLIANCE_ITEMS, STATUS_NAMES, ComplianceMatrix  # noqa: E402
+from portal.ml import load_and_train_ml_model, predict_animal_health, predict_animal_health_batch  # noqa: E402
+from portal.pages import PAGE_KEYS  # noqa: E402
+from portal.pages.data_export import compliance_csv, records_csv  # noqa: E402
+from portal.pages.farmer_network import filter_farmers  # noqa: E402
+from portal.risk import calculate_risk_score  # noqa: E402
+
+RECORD_CAP = 1_000_000
+BATCH_CAP = 10_000
+MIN_DELTA_S = 0.001  # ignore regressions smaller than this, whatever the ratio
+
+# Answer options of the risk assessment form, as scored by calculate_risk_score
+RISK_OPTIONS = {
+    'farm_size': ["Small (< 100 animals)", "Medium (100-500 animals)", "Large (> 500 animals)"],
+    'hygiene_practices': ["Poor", "Average", "Good", "Excellent"],
+    'vaccination_records': ["Outdated", "Partially updated", "Up to date"],
+    'waste_management': ["No proper system", "Minimal disposal", "Basic disposal", "Proper disposal system"],
+    'visitor_control': ["No controls", "Minimal controls", "Basic controls", "Strict protocols"],
+    'feed_storage': ["Poor storage", "Basic storage", "Adequate storage", "Proper storage"],
+    'water_quality': ["Never tested", "Rarely tested", "Tested occasionally", "Tested regularly"],
+    'disease_history': ["Multiple outbreaks", "Major outbreak", "Minor issues", "No diseases"],
+}
+SPECIALIZATIONS = ["Breeding", "Organic Farming", "Feed Production", "Disease Management",
+                   "Waste Management", "Technology Integration"]
+
+
+def timed(fn, repeat, warmup=True):
+    """Run fn repeat times and summarize the wall times"""
+    if warmup:
+        fn()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {'median_s': statistics.median(times), 'min_s': min(times), 'max_s': max(times), 'runs': repeat}
+
+
+def risk_assessments(rng, n):
+    columns = {field: rng.choice(options, size=n) for field, options in RISK_OPTIONS.items()}
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+def farmers_directory(rng, n):
+    locations = [f"District {i}" for i in range(1, 41)]
+    farm_types = ["Pig Farm", "Poultry Farm", "Mixed Farm"]
+    specialization_masks = rng.integers(0, 1 << len(SPECIALIZATIONS), size=n)
+    return {
+        f"farmer_{i:07d}": {
+            'farmer_name': f"Farmer {i}",
+            'farm_name': f"Farm {i}",
+            'location': locations[i % len(locations)],
+            'contact_phone': '',
+            'contact_email': '',
+            'farm_type': farm_types[i % len(farm_types)],
+            'farm_size': "Medium (100-500 animals)",
+            'specializations': [s for b, s in enumerate(SPECIALIZATIONS) if mask >> b & 1],
+            'additional_info': '',
+            'registration_date': '2025-09-01T00:00:00',
+            'verified': bool(i % 2),
+        }
+        for i, mask in enumerate(specialization_masks.tolist())
+    }
+
+
+def compliance_matrix(rng, farms):
+    statuses = rng.integers(0, len(STATUS_NAMES), size=(farms, len(COMPLIANCE_ITEMS)))
+    records = {
+        f"farm_{i:07d}": {'checklist': {item['id']: STATUS_NAMES[s] for item, s in zip(COMPLIANCE_ITEMS, row)}}
+        for i, row in enumerate(statuses.tolist())
+    }
+    return ComplianceMatrix.from_records(COMPLIANCE_ITEMS, records)
+
+
+def function_benchmarks(tier, repeat, selected):
+    """Direct-call benchmarks for one tier"""
+    rows = TIERS[tier]
+    records = min(rows, RECORD_CAP)
+    rng = np.random.default_rng(0)
+    results = {}
+
+    def run(name, fn, **kwargs):
+        if selected(name):
+            results[name] = timed(fn, repeat, **kwargs)
+            print(f"  {tier:>5} {name:<24} {results[name]['median_s'] * 1000:10.2f} ms", file=sys.stderr)
+
+    csv_path = tier_path(tier)
+    if any(selected(name) for name in ('ml.train', 'ml.predict_single', 'ml.predict_batch')):
+        models = {}
+
+        def train():
+            models.clear()
+            models.update(load_and_train_ml_model(str(csv_path)))
+
+        if selected('ml.train'):
+            run('ml.train', train, warmup=False)
+        else:
+            train()
+        if 'error' in models:
+            raise RuntimeError(models['error'])
+        inputs = pd.read_csv(csv_path, nrows=BATCH_CAP)[models['feature_names']].to_dict('records')
+        run('ml.predict_single', lambda: predict_animal_health(inputs[0], models))
+        run('ml.predict_batch', lambda: predict_animal_health_batch(inputs, models))
+
+    if selected('risk.score'):
+        assessments = risk_assessments(rng, records)
+        run('risk.score', lambda: [calculate_risk_score(a) for a in assessments])
+
+    if any(selected(name) for name in ('storage.round_trip', 'farmers.search', 'export.records_csv')):
+        farmers = farmers_directory(rng, records)
+        with tempfile.TemporaryDirectory() as data_dir:
+            data_dir_before, storage.DATA_DIR = storage.DATA_DIR, Path(data_dir)
+            try:
+                run('storage.round_trip', lambda: (storage.save_data("farmers_directory.json", farmers),
+                                                  storage.load_data("farmers_directory.json")))
+            finally:
+                storage.DATA_DIR = data_dir_before
+        run('farmers.search', lambda: filter_farmers(farmers, search_term="organic"))
+        run('export.records_csv', lambda: records_csv(farmers))
+
+    if selected('export.compliance_csv'):
+        matrix = compliance_matrix(rng, max(records // len(COMPLIANCE_ITEMS), 1))
+        run('export.compliance_csv', lambda: compliance_csv(matrix))
+
+    if selected('chart.line'):
+        series = pd.DataFrame({'Timestamp': pd.date_range('2025-01-01', periods=rows, freq='min'),
+                               'Temp_C': 30 + rng.normal(0, 1, rows).cumsum() / 100})
+        run('chart.line', lambda: line_chart(series, x='Timestamp', y='Temp_C').to_json())
+    return results
+
+
+def page_benchmarks(tier, repeat, selected):
+    """Rerun time of every page through AppTest, with mock datasets scaled to the tier"""
+    from streamlit.testing.v1 import AppTest
+
+    results = {}
+    scale = TIERS[tier] / 1000
+    with tempfile.TemporaryDirectory() as data_dir:
+        data_dir_before, storage.DATA_DIR = storage.DATA_DIR, Path(data_dir)
+        load_test_before = os.environ.get('PORTAL_LOAD_TEST')
+        os.environ['PORTAL_LOAD_TEST'] = '1'  # lets ?mock_scale size the mock datasets
+        try:
+            at = AppTest.from_file(str(ROOT / 'app.py'), default_timeout=600)
+            at.query_params['mock_scale'] = str(scale)
+            at.session_state['admin_logged_in'] = True
+            at.run()
+            for index, key in enumerate(PAGE_KEYS):
+                name = f'page.{key}'
+                if not selected(name):
+                    continue
+                nav = [s for s in at.sidebar.selectbox if s.label == "Navigate to:"][0]
+                nav.select_index(index).run()  # first visit imports the page and fills its caches
+
+                def rerun():
+                    at.run()
+                    if at.exception:
+                        raise RuntimeError(f"{key}: {at.exception[0].value}")
+
+                results[name] = timed(rerun, repeat, warmup=False)
+                print(f"  {tier:>5} {name:<24} {results[name]['median_s'] * 1000:10.2f} ms", file=sys.stderr)
+        finally:
+            storage.DATA_DIR = data_dir_before
+            if load_test_before is None:
+                os.environ.pop('PORTAL_LOAD_TEST', None)
+            else:
+                os.environ['PORTAL_LOAD_TEST'] = load_test_before
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(tiers, repeat, only=()):
+    def selected(name):
+        return not only or any(name.startswith(prefix) for prefix in only)
+
+    report = {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': repeat,
+        },
+        'results': {},
+    }
+    for tier in tiers:
+        results = function_benchmarks(tier, repeat, selected)
+        results.update(page_benchmarks(tier, repeat, selected))
+        report['results'].update({f"{tier}/{name}": stats for name, stats in results.items()})
+    return report
+
+
+def compare(report, baseline, tolerance):
+    """Rows of (benchmark, baseline median, current median, ratio, regressed)"""
+    rows = []
+    for key, stats in sorted(report['results'].items()):
+        if key not in baseline['results']:
+            continue
+        before = baseline['results'][key]['median_s']
+        after = stats['median_s']
+        ratio = after / before if before else float('inf')
+        regressed = ratio > 1 + tolerance and after - before > MIN_DELTA_S
+        rows.append((key, before, after, ratio, regressed))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tiers', nargs='+', choices=list(TIERS), default=['1k', '100k'])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--only', nargs='+', default=[], help='benchmark name prefixes, e.g. ml. page.home')
+    parser.add_argument('--json', help='write the report to this file')
+    parser.add_argument('--compare', help='baseline report to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown before flagging (0.25 = 25%%)')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings('ignore')
+    report = run_suite(args.tiers, args.repeat, args.only)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows = compare(report, baseline, args.tolerance)
+        for key, before, after, ratio, regressed in rows:
+            flag = 'REGRESSION' if regressed else ''
+            print(f"{key:<36} {before * 1000:10.2f} ms -> {after * 1000:10.2f} ms  x{ratio:5.2f} {flag}", file=sys.stderr)
+        regressions = [row for row in rows if row[-1]]
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+Synthetic, schema-compatible versions of disease.csv at benchmark scale.
+
+The generator learns marginal distributions from the shipped disease.csv
+(per animal type: numeric quantiles and disease mix; risk level given the
+disease) and samples new rows from them, vectorized and in fixed-size
+chunks, straight to CSV and Parquet through pyarrow. Every pen of every farm
+reports once per time step, so farm/pen counts and the time span are free
+parameters; disease prevalence can be overridden.
+
+    python benchmarks/synthetic_disease.py --tier 100k
+    python benchmarks/synthetic_disease.py --rows 2000000 --farms 40 --pens 25 --days 365 --prevalence 0.2
+"""
+
+import argparse
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE_CSV = ROOT / "disease.csv"
+OUTPUT_DIR = Path(__file__).resolve().parent / "data"
+
+TIERS = {'1k': 1_000, '100k': 100_000, '10m': 10_000_000}
+COLUMNS = ['Timestamp', 'Farm_ID', 'Pen_ID', 'Animal_Type', 'Age_Weeks', 'Weight_Kg',
+           'Temp_C', 'Humidity_%', 'Ammonia_ppm', 'Disease_Observed', 'Risk_Level']
+NUMERIC_COLUMNS = ['Age_Weeks', 'Weight_Kg', 'Temp_C', 'Humidity_%', 'Ammonia_ppm']
+TIMESTAMP_FORMAT = '%d-%m-%Y %H:%M'
+NO_DISEASE = 'None'
+QUANTILES = np.linspace(0, 1, 101)
+CHUNK_ROWS = 1_000_000
+
+
+def _decimals(values):
+    """Number of decimals the column is recorded with"""
+    text = pd.Series(values).astype(str)
+    fraction = text.str.partition('.')[2].str.rstrip('0')
+    return int(fraction.str.len().max())
+
+
+def learn_profile(csv_path=SOURCE_CSV):
+    """Marginal distributions of disease.csv, per animal type"""
+    df = pd.read_csv(csv_path, keep_default_na=False)
+    times = pd.to_datetime(df['Timestamp'], format=TIMESTAMP_FORMAT).sort_values()
+    animal_shares = df['Animal_Type'].value_counts(normalize=True)
+
+    animals = {}
+    for animal_type, rows in df.groupby('Animal_Type'):
+        diseases = rows['Disease_Observed'].value_counts(normalize=True)
+        animals[animal_type] = {
+            'share': float(animal_shares[animal_type]),
+            'quantiles': {column: np.quantile(rows[column], QUANTILES) for column in NUMERIC_COLUMNS},
+            'diseases': diseases.index.tolist(),
+            'disease_p': diseases.to_numpy(),
+        }
+    risk_given_disease = {}
+    for disease, rows in df.groupby('Disease_Observed'):
+        levels = rows['Risk_Level'].value_counts(normalize=True)
+        risk_given_disease[disease] = (levels.index.tolist(), levels.to_numpy())
+
+    return {
+        'animals': animals,
+        'risk_given_disease': risk_given_disease,
+        'decimals': {column: _decimals(df[column]) for column in NUMERIC_COLUMNS},
+        'start': times.iloc[0].to_pydatetime(),
+        'step': times.diff().median().to_pytimedelta(),
+    }
+
+
+def _disease_mix(profile, prevalence):
+    """Per animal type disease labels and probabilities, optionally rescaled to a target prevalence"""
+    mix = {}
+    for animal_type, animal in profile['animals'].items():
+        labels, p = list(animal['diseases']), animal['disease_p'].copy()
+        if prevalence is not None:
+            if NO_DISEASE not in labels:
+                labels, p = labels + [NO_DISEASE], np.append(p, 0.0)
+            sick = np.array([label != NO_DISEASE for label in labels])
+            if p[sick].sum() > 0:
+                p[sick] *= prevalence / p[sick].sum()
+                p[~sick] = 1 - prevalence
+        mix[animal_type] = (labels, p)
+    return mix
+
+
+def _sample_labels(rng, labels, p, size):
+    """Draw categorical labels by inverse CDF; returns label indices"""
+    cumulative = np.cumsum(p)
+    cumulative[-1] = 1.0
+    return np.searchsorted(cumulative, rng.random(size), side='right').clip(0, len(labels) - 1)
+
+
+def generate_chunk(profile, rng, start_row, size, farms, pens, start, step, disease_mix, pen_animals):
+    """pyarrow Table with rows [start_row, start_row + size)"""
+    total_pens = farms * pens
+    rows = np.arange(start_row, start_row + size, dtype=np.int64)
+    rounds, pen_slot = np.divmod(rows, total_pens)
+    farm_index, pen_index = np.divmod(pen_slot, pens)
+    animal_index = pen_animals[pen_slot]
+
+    animal_types = list(profile['animals'])
+    disease_labels = sorted({label for labels, _ in disease_mix.values() for label in labels})
+    risk_labels = sorted({level for levels, _ in profile['risk_given_disease'].values() for level in levels})
+    columns = {column: np.empty(size) for column in NUMERIC_COLUMNS}
+    disease = np.empty(size, dtype=np.int8)
+    for a, animal_type in enumerate(animal_types):
+        mask = animal_index == a
+        count = int(mask.sum())
+        if not count:
+            continue
+        quantiles = profile['animals'][animal_type]['quantiles']
+        for column in NUMERIC_COLUMNS:
+            columns[column][mask] = np.interp(rng.random(count), QUANTILES, quantiles[column])
+        labels, p = disease_mix[animal_type]
+        codes = np.array([disease_labels.index(label) for label in labels], dtype=np.int8)
+        disease[mask] = codes[_sample_labels(rng, labels, p, count)]
+
+    risk = np.empty(size, dtype=np.int8)
+    for code, label in enumerate(disease_labels):
+        mask = disease == code
+        levels, p = profile['risk_given_disease'].get(label, profile['risk_given_disease'][NO_DISEASE])
+        codes = np.array([risk_labels.index(level) for level in levels], dtype=np.int8)
+        risk[mask] = codes[_sample_labels(rng, levels, p, int(mask.sum()))]
+
+    # Every pen shares the timestamp of its round: format each distinct time once
+    first_round, last_round = int(rounds[0]), int(rounds[-1])
+    round_times = pd.date_range(start + first_round * step, periods=last_round - first_round + 1, freq=step)
+    time_labels = pa.array(round_times.strftime(TIMESTAMP_FORMAT).tolist())
+    farm_labels = pa.array([f"F{i}" for i in range(1, farms + 1)])
+    pen_labels = pa.array([f"P{i}" for i in range(1, pens + 1)])
+
+    table = {
+        'Timestamp': time_labels.take(pa.array(rounds - first_round)),
+        'Farm_ID': farm_labels.take(pa.array(farm_index)),
+        'Pen_ID': pen_labels.take(pa.array(pen_index)),
+        'Animal_Type': pa.array(animal_types).take(pa.array(animal_index)),
+    }
+    for column in NUMERIC_COLUMNS:
+        decimals = profile['decimals'][column]
+        values = np.round(columns[column], decimals)
+        table[column] = pa.array(values.astype(np.int64) if decimals == 0 else values)
+    table['Disease_Observed'] = pa.array(disease_labels).take(pa.array(disease))
+    table['Risk_Level'] = pa.array(risk_labels).take(pa.array(risk))
+    return pa.table(table)
+
+
+def default_farms(rows):
+    """Farm count growing with the square root of the row count, so fleet size and history both scale"""
+    return max(2, int(np.sqrt(rows / 300)))
+
+
+def _assign_animals(rng, shares, total_pens):
+    """Animal type index per pen, proportional to the learned shares with every type present"""
+    counts = np.maximum(np.round(shares * total_pens).astype(int), 1 if total_pens >= len(shares) else 0)
+    counts[np.argmax(counts)] += total_pens - counts.sum()
+    return rng.permutation(np.repeat(np.arange(len(shares)), counts))
+
+
+def generate(rows, out_stem, farms=2, pens=6, days=None, prevalence=None, seed=42,
+             formats=('csv', 'parquet'), profile=None, chunk_rows=CHUNK_ROWS):
+    """Write `rows` synthetic rows to <out_stem>.csv and/or .parquet; returns the written paths"""
+    profile = profile or learn_profile()
+    total_pens = farms * pens
+    rounds = -(-rows // total_pens)
+    step = timedelta(days=days) / rounds if days else profile['step']
+    disease_mix = _disease_mix(profile, prevalence)
+
+    seeds = np.random.SeedSequence(seed)
+    animal_types = list(profile['animals'])
+    shares = np.array([profile['animals'][a]['share'] for a in animal_types])
+    pen_animals = _assign_animals(np.random.default_rng(seeds.spawn(1)[0]), shares, total_pens)
+
+    out_stem = Path(out_stem)
+    out_stem.parent.mkdir(parents=True, exist_ok=True)
+    paths = {fmt: out_stem.with_suffix(f'.{fmt}') for fmt in formats}
+    csv_file = csv_writer = parquet_writer = None
+    try:
+        if 'csv' in paths:
+            csv_file = open(paths['csv'], 'wb')
+            csv_file.write((','.join(COLUMNS) + '\n').encode())
+        chunk_seeds = seeds.spawn(-(-rows // chunk_rows))
+        for index, chunk_start in enumerate(range(0, rows, chunk_rows)):
+            size = min(chunk_rows, rows - chunk_start)
+            table = generate_chunk(profile, np.random.default_rng(chunk_seeds[index]), chunk_start, size,
+                                   farms, pens, profile['start'], step, disease_mix, pen_animals)
+            if csv_file is not None:
+                if csv_writer is None:
+                    options = pa_csv.WriteOptions(include_header=False, quoting_style='none')
+                    csv_writer = pa_csv.CSVWriter(csv_file, table.schema, write_options=options)
+                csv_writer.write_table(table)
+            if 'parquet' in paths:
+                if parquet_writer is None:
+                    parquet_writer = pq.ParquetWriter(paths['parquet'], table.schema, compression='zstd')
+                parquet_writer.write_table(table)
+    finally:
+        if csv_writer is not None:
+            csv_writer.close()
+        if csv_file is not None:
+            csv_file.close()
+        if parquet_writer is not None:
+            parquet_writer.close()
+    return paths
+
+
+def tier_path(tier, fmt='csv'):
+    """Path of a benchmark tier dataset, generated on first use"""
+    path = OUTPUT_DIR / f"disease_{tier}.{fmt}"
+    if not path.exists():
+        rows = TIERS[tier]
+        generate(rows, path.with_suffix(''), farms=default_farms(rows), formats=(fmt,))
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    size = parser.add_mutually_exclusive_group(required=True)
+    size.add_argument('--tier', choices=list(TIERS))
+    size.add_argument('--rows', type=int)
+    parser.add_argument('--farms', type=int, default=None, help='default: scaled with the row count')
+    parser.add_argument('--pens', type=int, default=6, help='pens per farm')
+    parser.add_argument('--days', type=float, default=None, help='time span (default: the source sampling step)')
+    parser.add_argument('--prevalence', type=float, default=None, help='fraction of rows with a disease')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--format', nargs='+', choices=['csv', 'parquet'], default=['csv', 'parquet'])
+    parser.add_argument('--out', help='output path without extension')
+    args = parser.parse_args(argv)
+
+    if args.prevalence is not None and not 0 <= args.prevalence <= 1:
+        parser.error('--prevalence must be between 0 and 1')
+    rows = TIERS[args.tier] if args.tier else args.rows
+    farms = args.farms or default_farms(rows)
+    out = args.out or OUTPUT_DIR / f"disease_{args.tier or rows}"
+
+    start = time.perf_counter()
+    paths = generate(rows, out, farms=farms, pens=args.pens, days=args.days,
+                     prevalence=args.prevalence, seed=args.seed, formats=args.format)
+    elapsed = time.perf_counter() - start
+    for path in paths.values():
+        print(f"{path}  {path.stat().st_size / 1e6:.1f} MB")
+    print(f"{rows:,} rows in {elapsed:.1f}s ({rows / elapsed:,.0f} rows/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
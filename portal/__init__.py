@@ -0,0 +1,4 @@
+"""
+Shared services for the Digital Farm Management Portal.
+Everything in this package is importable without a running Streamlit session.
+"""
@@ -0,0 +1,340 @@
+"""
+Streaming anomaly detection.
+Every series (a pen's sensor, a farm's sensor, the incident stream) has its
+own detector that is updated one point at a time with constant work per
+point: an EWMA mean/variance, a rolling median/MAD over a fixed window and a
+seasonal EWMA baseline per phase (hour of day, day of week). A point is
+scored against the baselines as they were before it arrived, then folded in.
+Detector state is a small JSON document, persisted so a restart resumes
+where it stopped instead of replaying history; points at or before a
+series' last timestamp are ignored, so feeding overlapping data is safe.
+"""
+
+import math
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from portal.storage import load_data, save_data
+
+STATE_FILE = "anomaly_state.json"
+MAX_ANOMALIES = 500  # flagged points kept for display
+HISTORY_LENGTH = 240  # scored points kept per series
+PERSISTED_HISTORY = 60  # of which are saved with the state
+FARM_BUCKET = 60  # seconds per point of a farm series
+SEASON_WARMUP = 5  # points per phase before its seasonal baseline is used
+MAD_SCALE = 1.4826  # MAD of a normal distribution is 0.6745 sigma
+
+# Detector settings per kind of series; resolution is the smallest meaningful change of a value
+PROFILES = {
+    'sensor': {'alpha': 0.05, 'window': 31, 'season_period': 3600, 'season_length': 24, 'threshold': 3.5,
+               'warmup': 20, 'resolution': 0.01},
+    'incidents': {'alpha': 0.1, 'window': 21, 'season_period': 86400, 'season_length': 7, 'threshold': 3.0,
+                  'warmup': 10, 'resolution': 1.0},
+}
+# Reading precision of each sensor, overriding the sensor profile's resolution
+RESOLUTION = {'Temp_C': 0.1, 'Humidity_%': 0.1, 'Ammonia_ppm': 1.0, 'Weight_Kg': 0.1}
+
+
+def _z(value, center, scale, floor):
+    """Deviation in units of scale, floored so a flat or quantized series only flags real jumps"""
+    return (value - center) / max(scale, floor)
+
+
+class SeriesDetector:
+    """Online baselines and scores for one series"""
+
+    def __init__(self, alpha, window, season_period, season_length, threshold, warmup, resolution=0.01):
+        self.alpha = alpha
+        self.window = window
+        self.season_period = season_period
+        self.season_length = season_length
+        self.threshold = threshold
+        self.warmup = warmup
+        self.resolution = resolution
+        self.step = None  # smallest non-zero change between consecutive values
+        self.count = 0
+        self.last_timestamp = None
+        self.mean = None
+        self.variance = 0.0
+        self.recent = deque(maxlen=window)
+        self.ordered = []  # self.recent, sorted
+        self.seasonal = [[0, 0.0, 0.0] for _ in range(season_length)]  # count, mean, variance per phase
+
+    def _fold(self, mean, variance, count, value):
+        """EWMA mean and variance after adding the count-th value
+
+        The weight starts at 1/count (a plain running mean) and settles at
+        alpha, so early points do not leave a zero-variance baseline behind.
+        """
+        if count == 1:
+            return value, 0.0
+        weight = max(self.alpha, 1 / count)
+        delta = value - mean
+        return mean + weight * delta, (1 - weight) * (variance + weight * delta * delta)
+
+    def _phase(self, timestamp):
+        return (timestamp // (self.season_period * 10**9)) % self.season_length
+
+    def scores(self, timestamp, value):
+        """z-scores of a point against the current baselines (None while a baseline is warming up)
+
+        Every spread is floored at the resolution and at the smallest change
+        the series has made so far (its own quantization step), so a stable
+        quantized series, say integer humidity where the MAD is mostly 0,
+        does not flag single steps; the rolling MAD is additionally floored
+        at the EWMA standard deviation.
+        """
+        if self.count < self.warmup:
+            return {'ewma': None, 'robust': None, 'seasonal': None}
+        floor = max(self.resolution, self.step or 0.0)
+        std = math.sqrt(self.variance)
+        median = self.ordered[len(self.ordered) // 2]
+        mad = float(np.median(np.abs(np.asarray(self.ordered) - median))) * MAD_SCALE
+        seasonal = None
+        phase_count, phase_mean, phase_variance = self.seasonal[self._phase(timestamp)]
+        if phase_count >= SEASON_WARMUP:
+            seasonal = _z(value, phase_mean, math.sqrt(phase_variance), floor)
+        return {'ewma': _z(value, self.mean, std, floor), 'robust': _z(value, median, mad, max(std, floor)),
+                'seasonal': seasonal}
+
+    def update(self, timestamp, value):
+        """Score one point, then fold it into the baselines; None when the point is not newer than the last"""
+        if self.last_timestamp is not None and timestamp <= self.last_timestamp:
+            return None
+        scores = self.scores(timestamp, value)
+        baseline = self.mean
+        if self.recent and value != self.recent[-1]:
+            change = abs(value - self.recent[-1])
+            self.step = change if self.step is None else min(self.step, change)
+        self.last_timestamp = timestamp
+        self.count += 1
+
+        self.mean, self.variance = self._fold(self.mean, self.variance, self.count, value)
+
+        if len(self.recent) == self.window:
+            del self.ordered[bisect_left(self.ordered, self.recent[0])]
+        self.recent.append(value)
+        insort(self.ordered, value)
+
+        phase = self.seasonal[self._phase(timestamp)]
+        phase[0] += 1
+        phase[1], phase[2] = self._fold(phase[1], phase[2], phase[0], value)
+
+        fired = [name for name, score in scores.items() if score is not None and abs(score) > self.threshold]
+        known = [abs(score) for score in scores.values() if score is not None]
+        return {
+            'timestamp': timestamp,
+            'value': value,
+            'baseline': baseline,
+            'score': max(known) if known else 0.0,
+            'anomaly': bool(fired),
+            'detectors': fired,
+            **{f'{name}_z': score for name, score in scores.items()},
+        }
+
+    def to_state(self):
+        return {
+            'settings': [self.alpha, self.window, self.season_period, self.season_length, self.threshold,
+                         self.warmup, self.resolution],
+            'count': self.count,
+            'step': self.step,
+            'last_timestamp': self.last_timestamp,
+            'mean': self.mean,
+            'variance': self.variance,
+            'recent': list(self.recent),
+            'seasonal': self.seasonal,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        detector = cls(*state['settings'])
+        detector.count = state['count']
+        detector.step = state.get('step')
+        detector.last_timestamp = state['last_timestamp']
+        detector.mean = state['mean']
+        detector.variance = state['variance']
+        detector.recent.extend(state['recent'])
+        detector.ordered = sorted(detector.recent)
+        if len(state['seasonal']) == detector.season_length:
+            detector.seasonal = state['seasonal']
+        return detector
+
+
+def series_key(kind, *parts):
+    """Stable string key of a series, e.g. series_key('pen', 'Farm_A', 'Pen_1', 'Temp_C')"""
+    return ':'.join([kind, *map(str, parts)])
+
+
+class AnomalyEngine:
+    """Thread-safe detectors of many series, with their recent scores and flagged points"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._detectors = {}
+        self._history = {}
+        self.anomalies = deque(maxlen=MAX_ANOMALIES)
+        self.points = 0
+        self._dirty = False
+        self._saved = 0.0
+        self._farm_lock = threading.Lock()
+        self._farm_pending = {}  # farm: readings of its newest, possibly incomplete bucket
+        self._farm_latest = {}  # farm: {(feature, pen): latest value}
+
+    def update(self, key, timestamp, value, profile='sensor', resolution=None):
+        """Feed one point (timestamp in nanoseconds) of a series; returns its result or None when skipped
+
+        resolution, when given, overrides the profile's for a new series.
+        """
+        if value is None or not math.isfinite(value):
+            return None
+        with self._lock:
+            detector = self._detectors.get(key)
+            if detector is None:
+                settings = PROFILES[profile] if resolution is None else {**PROFILES[profile], 'resolution': resolution}
+                detector = self._detectors[key] = SeriesDetector(**settings)
+            result = detector.update(int(timestamp), float(value))
+            if result is None:
+                return None
+            self.points += 1
+            self._dirty = True
+            self._history.setdefault(key, deque(maxlen=HISTORY_LENGTH)).append(result)
+            if result['anomaly']:
+                self.anomalies.append({'series': key, **result})
+            return result
+
+    def update_series(self, key, timestamps, values, profile='sensor', resolution=None):
+        """Feed points in order; returns the results of the points that were new"""
+        results = [self.update(key, timestamp, value, profile, resolution)
+                   for timestamp, value in zip(timestamps, values)]
+        return [result for result in results if result is not None]
+
+    def last_timestamp(self, key):
+        detector = self._detectors.get(key)
+        return detector.last_timestamp if detector is not None else None
+
+    def observe_readings(self, readings, results=None):
+        """Feed gateway readings into their pen and farm series; signature fits IngestGateway.subscribe"""
+        from portal.timeseries import FEATURES
+        pens = {}
+        for reading in readings:
+            pens.setdefault((reading['Farm_ID'], reading['Pen_ID']), []).append(reading)
+        batches = {}
+        for key, pen_readings in pens.items():
+            times = pd.to_datetime([r['Timestamp'] for r in pen_readings], format='ISO8601').as_unit('ns').asi8
+            values = np.array([[r.get(f, np.nan) for f in FEATURES] for r in pen_readings], dtype=float)
+            order = np.argsort(times, kind='stable')
+            batches[key] = (times[order], values[order])
+        self._observe(batches, FEATURES)
+
+    def observe_store(self, store):
+        """Catch up with the readings a TimeSeriesStore received since each pen series was last fed"""
+        batches = {}
+        for farm_id, pen_id in store.pens():
+            seen = [self.last_timestamp(series_key('pen', farm_id, pen_id, f)) for f in store.features]
+            times, values = store.window(farm_id, pen_id, after=None if None in seen else min(seen))
+            if len(times):
+                order = np.argsort(times, kind='stable')
+                batches[(farm_id, pen_id)] = (times[order], values[order])
+        self._observe(batches, store.features)
+
+    def _observe(self, batches, features):
+        """Feed {(farm, pen): (times, values)} into the pen series, and bucketed per farm into the farm series"""
+        farms = {}
+        for (farm_id, pen_id), (times, values) in batches.items():
+            for column, feature in enumerate(features):
+                self.update_series(series_key('pen', farm_id, pen_id, feature), times, values[:, column],
+                                   resolution=RESOLUTION.get(feature))
+            farms.setdefault(farm_id, []).append(
+                pd.DataFrame(values, columns=list(features)).assign(pen=pen_id, time=times))
+        with self._farm_lock:
+            for farm_id, parts in farms.items():
+                self._observe_farm(farm_id, parts, features)
+
+    def _observe_farm(self, farm_id, parts, features):
+        """Feed a farm's series one point per FARM_BUCKET: the mean over its pens of each pen's latest value
+
+        Every pen counts in every bucket (with its last known value), so the
+        farm baseline does not jump with the set of pens that happened to
+        report. The newest bucket is held back until a later reading shows
+        that it is complete.
+        """
+        pending = self._farm_pending.pop(farm_id, None)
+        rows = pd.concat(parts if pending is None else [pending, *parts], ignore_index=True)
+        bucket_ns = FARM_BUCKET * 10**9
+        rows['bucket'] = rows['time'] // bucket_ns * bucket_ns
+        newest = rows['bucket'].max()
+        self._farm_pending[farm_id] = rows[rows['bucket'] == newest].drop(columns='bucket')
+        rows = rows[rows['bucket'] < newest]
+        if rows.empty:
+            return
+        latest = rows.sort_values('time', kind='stable').groupby(['bucket', 'pen'])[list(features)].last()
+        wide = latest.unstack('pen')  # columns (feature, pen)
+        carried = self._farm_latest.setdefault(farm_id, {})
+        if carried:
+            previous = pd.DataFrame([list(carried.values())], columns=pd.MultiIndex.from_tuples(list(carried)),
+                                    index=[-1])
+            wide = pd.concat([previous, wide]).ffill().iloc[1:]
+        for column, value in wide.ffill().iloc[-1].items():
+            if not np.isnan(value):
+                carried[column] = value
+        for feature in features:
+            means = wide[feature].ffill().mean(axis=1)
+            self.update_series(series_key('farm', farm_id, feature), means.index.to_numpy(dtype=np.int64),
+                               means.to_numpy(dtype=float), resolution=RESOLUTION.get(feature))
+
+    def history(self, key):
+        """Recent results of a series as a DataFrame, oldest first"""
+        with self._lock:
+            rows = list(self._history.get(key, ()))
+        frame = pd.DataFrame(rows, columns=['timestamp', 'value', 'baseline', 'score', 'anomaly', 'detectors',
+                                            'ewma_z', 'robust_z', 'seasonal_z'])
+        frame['timestamp'] = pd.to_datetime(frame['timestamp'])
+        return frame
+
+    def recent_anomalies(self, prefix=''):
+        """Flagged points of the series whose key starts with prefix, newest first"""
+        with self._lock:
+            rows = [a for a in reversed(self.anomalies) if a['series'].startswith(prefix)]
+        frame = pd.DataFrame(rows, columns=['series', 'timestamp', 'value', 'baseline', 'score', 'detectors'])
+        frame['timestamp'] = pd.to_datetime(frame['timestamp'])
+        return frame
+
+    # ---- Persistence ----
+    def to_state(self):
+        with self._lock:
+            return {
+                'detectors': {key: detector.to_state() for key, detector in self._detectors.items()},
+                'history': {key: list(results)[-PERSISTED_HISTORY:] for key, results in self._history.items()},
+                'anomalies': list(self.anomalies),
+            }
+
+    @classmethod
+    def from_state(cls, state):
+        engine = cls()
+        for key, detector_state in state.get('detectors', {}).items():
+            try:
+                engine._detectors[key] = SeriesDetector.from_state(detector_state)
+            except (KeyError, TypeError, ValueError):
+                pass  # state of an older format: that series starts over
+        for key, results in state.get('history', {}).items():
+            engine._history[key] = deque(results, maxlen=HISTORY_LENGTH)
+        engine.anomalies.extend(state.get('anomalies', []))
+        return engine
+
+    @classmethod
+    def load(cls, filename=STATE_FILE):
+        return cls.from_state(load_data(filename))
+
+    def save(self, filename=STATE_FILE, interval=0):
+        """Persist the detector state if it changed, at most once per interval seconds"""
+        if not self._dirty or time.monotonic() - self._saved < interval:
+            return False
+        self._dirty = False
+        self._saved = time.monotonic()
+        save_data(filename, self.to_state())
+        return True
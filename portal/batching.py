@@ -0,0 +1,118 @@
+"""
+Micro-batching of concurrent requests.
+Callers submit single items and get a future back; a collector thread groups
+whatever arrives within max_wait seconds (or until max_batch_size items are
+queued) and hands the group to one vectorized call, then resolves every
+caller's future with its own result. Lone requests pay at most max_wait of
+extra latency; under load, per-call overhead is shared by the whole batch.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT = 0.005  # seconds
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """Coalesces submit() calls into process_batch(items) -> results, one result per item
+
+    Batches run on `executor` when given, so several can be scored at once;
+    otherwise on the collector thread itself.
+    """
+
+    def __init__(self, process_batch, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_wait=DEFAULT_MAX_WAIT,
+                 executor=None, name='micro-batcher'):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.executor = executor
+        self.batches = 0
+        self.items = 0
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._collect, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, item):
+        """Queue one item; the returned future resolves to its result"""
+        if self._closed:
+            raise RuntimeError("MicroBatcher is closed")
+        future = Future()
+        self._queue.put((item, future))
+        return future
+
+    async def submit_async(self, item):
+        """submit() for asyncio callers"""
+        return await asyncio.wrap_future(self.submit(item))
+
+    def stats(self):
+        return {
+            'batches': self.batches,
+            'items': self.items,
+            'mean_batch_size': self.items / self.batches if self.batches else 0.0,
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000,
+        }
+
+    def _collect(self):
+        stopping = False
+        while not stopping:
+            entry = self._queue.get()
+            if entry is _STOP:
+                break
+            batch = [entry]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                try:
+                    entry = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+            self.batches += 1
+            self.items += len(batch)
+            if self.executor is not None:
+                self.executor.submit(self._run, batch)
+            else:
+                self._run(batch)
+
+    def _run(self, batch):
+        batch = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        try:
+            results = self.process_batch([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"process_batch returned {len(results)} results for {len(batch)} items")
+        except BaseException as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def close(self):
+        """Score what is already queued, then stop the collector thread"""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_STOP)
+            self._thread.join()
+            # Items that raced the close: fail them rather than leave callers waiting
+            while True:
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is not _STOP and entry[1].set_running_or_notify_cancel():
+                    entry[1].set_exception(RuntimeError("MicroBatcher is closed"))
@@ -0,0 +1,152 @@
+"""
+Chart builders that keep the browser payload bounded.
+Line charts above MAX_LINE_POINTS rows are downsampled with
+Largest-Triangle-Three-Buckets (LTTB), which keeps the visual shape (peaks,
+dips, trend changes) of the series; very long series are first reduced by
+min/max bucketing so LTTB never walks millions of rows. Scatter charts above
+WEBGL_THRESHOLD rows are drawn with WebGL (scattergl) and sampled down to
+MAX_SCATTER_POINTS. Bar charts and histograms are aggregated here and only
+the totals or bin counts are sent; drawn from a sample, they are scaled up to
+the full row count and titled as estimates. Chart titles note when rows were
+dropped.
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+MAX_LINE_POINTS = 2000
+MAX_SCATTER_POINTS = 50_000
+WEBGL_THRESHOLD = 1000
+MINMAX_FACTOR = 4  # min/max pre-reduction keeps MINMAX_FACTOR * n_out points for LTTB
+MAX_HISTOGRAM_BINS = 200
+
+
+def _fill_missing(y):
+    """y as floats, missing values replaced by the mean of the others"""
+    y = np.asarray(y, dtype=float)
+    missing = ~np.isfinite(y)
+    if not missing.any():
+        return y
+    return np.where(missing, y[~missing].mean() if not missing.all() else 0.0, y)
+
+
+def minmax_indices(y, buckets):
+    """Row positions of the minimum and maximum of y in each of `buckets` equal slices, in order"""
+    n = len(y)
+    if n <= 2 * buckets:
+        return np.arange(n)
+    bucket = np.arange(n) * buckets // n
+    grouped = pd.Series(_fill_missing(y)).groupby(bucket)
+    picks = [grouped.idxmin().dropna(), grouped.idxmax().dropna(), [0, n - 1]]
+    return np.unique(np.concatenate(picks).astype(np.int64))
+
+
+def lttb_indices(x, y, n_out):
+    """Row positions kept by Largest-Triangle-Three-Buckets, including the first and last row"""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = _fill_missing(y)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)  # n_out - 2 buckets between the end points
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        following = slice(end, edges[i + 2]) if i + 2 < len(edges) else slice(n - 1, n)
+        next_x, next_y = x[following].mean(), y[following].mean()
+        # Twice the area of the triangle (previous point, candidate, mean of the next bucket)
+        area = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                      - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+    return selected
+
+
+def _numeric_axis(values):
+    """x values usable for triangle areas: numbers or datetimes when increasing, else row positions"""
+    series = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        numeric = series.astype('int64').to_numpy(dtype=float)
+    elif pd.api.types.is_numeric_dtype(series):
+        numeric = series.to_numpy(dtype=float)
+    else:
+        return np.arange(len(series), dtype=float)
+    if np.isnan(numeric).any() or (np.diff(numeric) < 0).any():
+        return np.arange(len(series), dtype=float)
+    return numeric
+
+
+def downsample(frame, x, y, max_points=MAX_LINE_POINTS):
+    """Rows of frame that draw y over x like the full frame does, at most max_points of them"""
+    if len(frame) <= max_points:
+        return frame
+    values = frame[y].to_numpy(dtype=float)
+    positions = np.arange(len(frame))
+    if len(frame) > MINMAX_FACTOR * max_points:
+        positions = minmax_indices(values, MINMAX_FACTOR * max_points // 2)
+    x_values = _numeric_axis(frame[x].to_numpy()[positions])
+    kept = positions[lttb_indices(x_values, values[positions], max_points)]
+    return frame.iloc[kept]
+
+
+def _title(title, shown, total):
+    if shown == total:
+        return title
+    return f"{title or ''} ({shown:,} of {total:,} points)".strip()
+
+
+def line_chart(frame, x, y, max_points=MAX_LINE_POINTS, **kwargs):
+    """px.line of y over x, downsampled (and drawn with WebGL) above max_points rows"""
+    shown = downsample(frame, x, y, max_points)
+    render_mode = 'webgl' if len(shown) > WEBGL_THRESHOLD else 'svg'
+    kwargs['title'] = _title(kwargs.get('title'), len(shown), len(frame))
+    return px.line(shown, x=x, y=y, render_mode=render_mode, **kwargs)
+
+
+def scatter_chart(frame, x, y, max_points=MAX_SCATTER_POINTS, **kwargs):
+    """px.scatter of y against x, with WebGL above WEBGL_THRESHOLD rows and a fixed sample above max_points"""
+    shown = frame
+    if len(frame) > max_points:
+        rows = np.sort(np.random.default_rng(0).choice(len(frame), size=max_points, replace=False))
+        shown = frame.iloc[rows]
+    render_mode = 'webgl' if len(shown) > WEBGL_THRESHOLD else 'svg'
+    kwargs['title'] = _title(kwargs.get('title'), len(shown), len(frame))
+    return px.scatter(shown, x=x, y=y, render_mode=render_mode, **kwargs)
+
+
+def _estimate_title(title, shown, total):
+    if shown >= total:
+        return title
+    return f"{title or ''} (estimated from {shown:,} of {total:,} rows)".strip()
+
+
+def bar_chart(frame, x, y, total_rows=None, **kwargs):
+    """px.bar of the sum of y per x value; with total_rows, frame is a uniform sample and the sums are scaled up"""
+    total_rows = total_rows or len(frame)
+    totals = frame.groupby(x, sort=False, dropna=True)[y].sum().reset_index()
+    if len(frame) and total_rows > len(frame):
+        totals[y] *= total_rows / len(frame)
+    kwargs['title'] = _estimate_title(kwargs.get('title'), len(frame), total_rows)
+    return px.bar(totals, x=x, y=y, **kwargs)
+
+
+def histogram_chart(frame, column, total_rows=None, max_bins=MAX_HISTOGRAM_BINS, **kwargs):
+    """Histogram of a numeric column from np.histogram counts; with total_rows, counts are scaled up from a sample"""
+    total_rows = total_rows or len(frame)
+    values = frame[column].to_numpy(dtype=float)
+    values = values[np.isfinite(values)]
+    edges = np.histogram_bin_edges(values, bins='auto') if len(values) else np.array([0.0, 1.0])
+    if len(edges) > max_bins + 1:
+        edges = np.histogram_bin_edges(values, bins=max_bins)
+    counts, edges = np.histogram(values, bins=edges)
+    counts = counts.astype(float)
+    if len(frame) and total_rows > len(frame):
+        counts *= total_rows / len(frame)
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges), name=column))
+    fig.update_layout(title=_estimate_title(kwargs.get('title'), len(frame), total_rows), xaxis_title=column,
+                      yaxis_title='count', bargap=0)
+    return fig
@@ -0,0 +1,149 @@
+"""
+Compliance state as a farms x checklist-items matrix of status codes.
+Statuses are updated in place; every summary is a NumPy reduction.
+"""
+
+import threading
+
+import numpy as np
+
+PENDING, SUBMITTED, VERIFIED = 0, 1, 2
+STATUS_NAMES = ['Pending', 'Submitted', 'Verified']
+STATUS_CODES = {name: code for code, name in enumerate(STATUS_NAMES)}
+
+# Compliance checklist
+COMPLIANCE_ITEMS = [
+    {'id': 'vaccination_certificate', 'title': 'Vaccination Certificate', 'required': True},
+    {'id': 'waste_disposal_permit', 'title': 'Waste Disposal Permit', 'required': True},
+    {'id': 'water_quality_report', 'title': 'Water Quality Test Report', 'required': True},
+    {'id': 'feed_safety_certificate', 'title': 'Feed Safety Certificate', 'required': True},
+    {'id': 'biosecurity_plan', 'title': 'Biosecurity Management Plan', 'required': True},
+    {'id': 'worker_training_records', 'title': 'Worker Training Records', 'required': False},
+    {'id': 'insurance_policy', 'title': 'Farm Insurance Policy', 'required': False},
+    {'id': 'emergency_response_plan', 'title': 'Emergency Response Plan', 'required': False}
+]
+
+
+class ComplianceMatrix:
+    """Status codes for every (farm, checklist item) pair in one int8 array"""
+
+    def __init__(self, checklist_items, capacity=256):
+        self.items = list(checklist_items)
+        self._columns = {item['id']: i for i, item in enumerate(self.items)}
+        self.required = np.array([item['required'] for item in self.items], dtype=bool)
+        self._lock = threading.Lock()
+        self._rows = {}
+        self._farm_ids = []
+        self._last_updated = []
+        self._status = np.zeros((capacity, len(self.items)), dtype=np.int8)
+        self.version = 0
+
+    @classmethod
+    def from_records(cls, checklist_items, compliance_data):
+        """Build the matrix from stored compliance records"""
+        matrix = cls(checklist_items, capacity=max(256, len(compliance_data)))
+        for farm_id, farm_data in compliance_data.items():
+            row = matrix._row(farm_id)
+            for item_id, status in farm_data.get('checklist', {}).items():
+                if item_id in matrix._columns:
+                    matrix._status[row, matrix._columns[item_id]] = STATUS_CODES.get(status, PENDING)
+            matrix._last_updated[row] = farm_data.get('last_updated', '')
+        return matrix
+
+    def __len__(self):
+        return len(self._farm_ids)
+
+    def __contains__(self, farm_id):
+        return farm_id in self._rows
+
+    @property
+    def farm_ids(self):
+        return list(self._farm_ids)
+
+    @property
+    def status(self):
+        """Read-only view of the status codes of all farms"""
+        view = self._status[:len(self._farm_ids)]
+        view.flags.writeable = False
+        return view
+
+    def _row(self, farm_id):
+        row = self._rows.get(farm_id)
+        if row is None:
+            row = len(self._farm_ids)
+            if row == len(self._status):
+                grown = np.zeros((2 * len(self._status), len(self.items)), dtype=np.int8)
+                grown[:row] = self._status
+                self._status = grown
+            self._rows[farm_id] = row
+            self._farm_ids.append(farm_id)
+            self._last_updated.append('')
+        return row
+
+    def set_status(self, farm_id, item_id, status, timestamp=''):
+        """Set the status ('Pending', 'Submitted' or 'Verified') of one item in place"""
+        try:
+            column = self._columns[item_id]
+        except KeyError:
+            raise ValueError(f"Unknown checklist item '{item_id}'. Valid options: {list(self._columns)}") from None
+        with self._lock:
+            row = self._row(farm_id)
+            self._status[row, column] = STATUS_CODES[status]
+            if timestamp:
+                self._last_updated[row] = timestamp
+            self.version += 1
+
+    def farm_statuses(self, farm_id):
+        """Status name per checklist item id for one farm"""
+        row = self._rows.get(farm_id)
+        codes = np.zeros(len(self.items), dtype=np.int8) if row is None else self._status[row]
+        return {item['id']: STATUS_NAMES[code] for item, code in zip(self.items, codes)}
+
+    def farm_summary(self, farm_id):
+        """Verified and submitted counts for one farm"""
+        row = self._rows.get(farm_id)
+        if row is None:
+            return {'verified': 0, 'submitted': 0, 'total': len(self.items)}
+        codes = self._status[row]
+        return {
+            'verified': int(np.count_nonzero(codes == VERIFIED)),
+            'submitted': int(np.count_nonzero(codes == SUBMITTED)),
+            'total': len(self.items),
+        }
+
+    def completion_rates(self, required_only=False):
+        """Percentage of verified items per farm"""
+        status = self.status
+        if required_only:
+            status = status[:, self.required]
+        if status.shape[1] == 0:
+            return np.zeros(len(status))
+        return np.count_nonzero(status == VERIFIED, axis=1) * (100 / status.shape[1])
+
+    def fleet_average(self, required_only=False):
+        """Mean completion rate over all farms"""
+        rates = self.completion_rates(required_only)
+        return float(rates.mean()) if len(rates) else 0
+
+    def fully_compliant_count(self, required_only=False):
+        """Number of farms with every (required) item verified"""
+        status = self.status[:, self.required] if required_only else self.status
+        return int(np.count_nonzero((status == VERIFIED).all(axis=1)))
+
+    def farms_with_verified(self):
+        """Number of farms with at least one verified item"""
+        return int(np.count_nonzero((self.status == VERIFIED).any(axis=1)))
+
+    def export_rows(self):
+        """Long-format columns (farm_id, compliance_item, status, last_updated) for CSV export"""
+        status = self.status
+        rows, columns = np.indices(status.shape).reshape(2, -1)
+        farm_ids = np.array(self._farm_ids, dtype=object)
+        item_ids = np.array([item['id'] for item in self.items], dtype=object)
+        last_updated = np.array(self._last_updated, dtype=object)
+        return {
+            'farm_id': farm_ids[rows],
+            'compliance_item': item_ids[columns],
+            'status': np.array(STATUS_NAMES, dtype=object)[status.ravel()],
+            'last_updated': last_updated[rows],
+        }
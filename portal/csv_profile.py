@@ -0,0 +1,206 @@
+"""
+Streaming parse and profile of uploaded CSV files.
+The upload is hashed once, then read in chunks: column types are inferred
+from the first rows and applied to every chunk, numeric summary statistics
+are merged chunk by chunk (one pass, constant memory), and a uniform
+reservoir sample of the rows is kept for interactive charts. The full frame
+is kept only while it stays under FULL_FRAME_ROWS rows, so arbitrarily large
+farm logs profile in bounded memory.
+"""
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+CHUNK_ROWS = 100_000
+INFERENCE_ROWS = 10_000
+RESERVOIR_SIZE = 20_000
+FULL_FRAME_ROWS = 1_000_000
+HASH_BLOCK = 1024 * 1024
+
+
+def file_digest(fileobj):
+    """sha256 of a binary file object's content, read in blocks; leaves it rewound"""
+    fileobj.seek(0)
+    digest = hashlib.sha256()
+    for block in iter(lambda: fileobj.read(HASH_BLOCK), b''):
+        digest.update(block)
+    fileobj.seek(0)
+    return digest.hexdigest()
+
+
+class NumericSummary:
+    """Count, mean, variance, min, max and missing values of numeric columns, merged chunk by chunk"""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        size = len(self.columns)
+        self.count = np.zeros(size)
+        self.mean = np.zeros(size)
+        self.m2 = np.zeros(size)  # sum of squared deviations from the mean
+        self.min = np.full(size, np.inf)
+        self.max = np.full(size, -np.inf)
+        self.missing = np.zeros(size, dtype=np.int64)
+
+    def add(self, chunk):
+        values = chunk[self.columns].to_numpy(dtype=float)
+        present = ~np.isnan(values)
+        count = present.sum(axis=0)
+        self.missing += len(values) - count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, np.nansum(values, axis=0) / np.maximum(count, 1), 0.0)
+            m2 = np.nansum((values - mean) ** 2, axis=0)
+        # Chan et al. pairwise merge of (count, mean, M2)
+        total = self.count + count
+        delta = mean - self.mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(total > 0, count / np.maximum(total, 1), 0.0)
+        self.mean = self.mean + delta * weight
+        self.m2 = self.m2 + m2 + delta ** 2 * self.count * weight
+        self.count = total
+        if len(values):
+            self.min = np.fmin(self.min, np.nanmin(np.where(present, values, np.inf), axis=0))
+            self.max = np.fmax(self.max, np.nanmax(np.where(present, values, -np.inf), axis=0))
+
+    def describe(self, sample=None):
+        """DataFrame shaped like DataFrame.describe(); quartiles come from the sample when given"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.sqrt(np.where(self.count > 1, self.m2 / np.maximum(self.count - 1, 1), np.nan))
+        rows = {
+            'count': self.count,
+            'mean': np.where(self.count > 0, self.mean, np.nan),
+            'std': std,
+            'min': np.where(self.count > 0, self.min, np.nan),
+        }
+        if sample is not None and len(sample):
+            quartiles = sample[self.columns].astype(float).quantile([0.25, 0.5, 0.75])
+            rows.update({'25%': quartiles.loc[0.25].to_numpy(), '50%': quartiles.loc[0.5].to_numpy(),
+                         '75%': quartiles.loc[0.75].to_numpy()})
+        rows['max'] = np.where(self.count > 0, self.max, np.nan)
+        return pd.DataFrame(rows, index=self.columns).T
+
+
+class Reservoir:
+    """Uniform sample of `size` rows of a stream of DataFrame chunks (algorithm R, vectorized per chunk)"""
+
+    def __init__(self, size, seed=0):
+        self.size = size
+        self.seen = 0
+        self.slots = np.full(size, -1, dtype=np.int64)  # stream row number held by each slot
+        self._rng = np.random.default_rng(seed)
+        self._candidates = []
+        self._candidate_rows = 0
+
+    def add(self, chunk):
+        rows = np.arange(self.seen, self.seen + len(chunk))
+        self.seen += len(chunk)
+        filling = rows < self.size
+        self.slots[rows[filling]] = rows[filling]
+        later = rows[~filling]
+        targets = self._rng.integers(0, later + 1) if len(later) else later
+        replacing = targets < self.size
+        # Within a chunk a later row wins a slot, exactly like the one-at-a-time algorithm
+        winners = pd.Series(later[replacing]).groupby(targets[replacing]).last()
+        self.slots[winners.index.to_numpy()] = winners.to_numpy()
+        taken = filling.copy()
+        taken[~filling] = replacing
+        if taken.any():
+            self._candidates.append(chunk[taken].set_axis(rows[taken]))
+            self._candidate_rows += int(taken.sum())
+        if self._candidate_rows > 4 * self.size:
+            self._compact()
+
+    def _compact(self):
+        held = pd.concat(self._candidates)
+        held = held[held.index.isin(self.slots)]
+        self._candidates, self._candidate_rows = [held], len(held)
+
+    def sample(self):
+        """The sampled rows in stream order, indexed by row number"""
+        if not self._candidates:
+            return pd.DataFrame()
+        self._compact()
+        return self._candidates[0].sort_index()
+
+
+def infer_dtypes(fileobj, rows=INFERENCE_ROWS):
+    """Column dtypes from the first rows: numeric columns as float64, everything else as text"""
+    fileobj.seek(0)
+    head = pd.read_csv(fileobj, nrows=rows)
+    fileobj.seek(0)
+    return {column: 'float64' if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+            else 'object' for column, dtype in head.dtypes.items()}
+
+
+class _UnexpectedValue(Exception):
+    """A numeric column (judged by the first rows) holds text further down"""
+
+
+def _chunks(fileobj, dtypes, chunk_rows, coerce=False):
+    """Chunks read with the inferred dtypes, or as text with numeric columns coerced (bad values missing)"""
+    fileobj.seek(0)
+    if not coerce:
+        reader = pd.read_csv(fileobj, dtype=dtypes, chunksize=chunk_rows)
+        while True:
+            try:
+                chunk = next(reader)
+            except StopIteration:
+                return
+            except ValueError as e:
+                raise _UnexpectedValue(str(e)) from e
+            yield chunk
+    numeric = [column for column, dtype in dtypes.items() if dtype == 'float64']
+    for chunk in pd.read_csv(fileobj, dtype=object, chunksize=chunk_rows):
+        for column in numeric:
+            chunk[column] = pd.to_numeric(chunk[column], errors='coerce')
+        yield chunk
+
+
+def profile_csv(fileobj, chunk_rows=CHUNK_ROWS, reservoir_size=RESERVOIR_SIZE, full_frame_rows=FULL_FRAME_ROWS):
+    """Parse a CSV file object in one streaming pass
+
+    Returns a dict with rows, columns, dtypes, head (first rows), summary
+    (describe()-style numeric statistics; quartiles from the sample when the
+    file is larger than it), sample (reservoir sample of the rows), sampled
+    (whether sample is only part of the file) and frame (all rows, or None
+    beyond full_frame_rows). When a numeric column turns out to hold text,
+    the file is read a second time with those values treated as missing.
+    """
+    dtypes = infer_dtypes(fileobj)
+    try:
+        return _profile(_chunks(fileobj, dtypes, chunk_rows), dtypes, reservoir_size, full_frame_rows)
+    except _UnexpectedValue:
+        return _profile(_chunks(fileobj, dtypes, chunk_rows, coerce=True), dtypes, reservoir_size,
+                        full_frame_rows)
+    finally:
+        fileobj.seek(0)
+
+
+def _profile(chunks, dtypes, reservoir_size, full_frame_rows):
+    numeric = [column for column, dtype in dtypes.items() if dtype == 'float64']
+    summary = NumericSummary(numeric)
+    reservoir = Reservoir(reservoir_size)
+    kept, head = [], None
+    for chunk in chunks:
+        if head is None:
+            head = chunk.head()
+        summary.add(chunk)
+        reservoir.add(chunk)
+        if kept is not None:
+            kept.append(chunk)
+            if reservoir.seen > full_frame_rows:
+                kept = None
+    rows = reservoir.seen
+    frame = pd.concat(kept, ignore_index=True) if kept else None
+    sample = frame if frame is not None and rows <= reservoir_size else reservoir.sample().reset_index(drop=True)
+    return {
+        'rows': rows,
+        'columns': list(dtypes),
+        'dtypes': dtypes,
+        'head': head if head is not None else pd.DataFrame(columns=list(dtypes)),
+        'summary': summary.describe(frame if frame is not None else sample) if numeric else None,
+        'sample': sample,
+        'sampled': rows > len(sample),
+        'frame': frame,
+    }
@@ -0,0 +1,157 @@
+"""
+Background processing of stored compliance documents.
+A worker pool validates file types by magic bytes, extracts basic metadata
+and renders image thumbnails/previews with Pillow. Results are cached on
+disk by content hash, so admin pages never need to read the original file.
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+THUMBNAIL_SIZE = (160, 160)
+PREVIEW_SIZE = (1024, 1024)
+SNIFF_BYTES = 16
+
+# (prefix, detected type); DOCX files are ZIP containers and legacy DOC files are OLE2 compound documents
+MAGIC_NUMBERS = [
+    (b'%PDF-', 'pdf'),
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'\xff\xd8\xff', 'jpeg'),
+    (b'PK\x03\x04', 'docx'),
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', 'doc'),
+]
+EXTENSION_TYPES = {'pdf': 'pdf', 'png': 'png', 'jpg': 'jpeg', 'jpeg': 'jpeg', 'docx': 'docx', 'doc': 'doc'}
+
+_PDF_PAGE = re.compile(rb'/Type\s*/Page(?!s)')
+
+
+def sniff_type(header):
+    """Detected file type from the leading bytes, or None"""
+    for prefix, file_type in MAGIC_NUMBERS:
+        if header.startswith(prefix):
+            return file_type
+    return None
+
+
+def _pdf_metadata(path):
+    """Page count and version of a PDF, scanned in chunks"""
+    pages = 0
+    tail = b''
+    with open(path, 'rb') as f:
+        version = f.read(8)[5:].decode('ascii', 'replace').strip()
+        f.seek(0)
+        while True:
+            chunk = f.read(1024 * 1024)
+            if not chunk:
+                break
+            data = tail + chunk
+            # Markers starting in the last few bytes are counted with the next chunk
+            keep = max(len(data) - 16, 0)
+            pages += sum(1 for match in _PDF_PAGE.finditer(data) if match.start() < keep)
+            tail = data[keep:]
+        pages += len(_PDF_PAGE.findall(tail))
+    return {'page_count': pages, 'pdf_version': version}
+
+
+def _save_atomic(image, path, **kwargs):
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    os.close(fd)
+    image.save(tmp_path, format='JPEG', **kwargs)
+    os.replace(tmp_path, path)
+
+
+class DocumentProcessor:
+    """Runs document processing jobs on a thread pool, cached by content hash"""
+
+    def __init__(self, document_store, cache_dir, max_workers=2):
+        self.document_store = document_store
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='doc-pipeline')
+        self._lock = threading.Lock()
+        self._results = {}
+        self._pending = {}
+
+    def _result_path(self, digest):
+        return self.cache_dir / f"{digest}.json"
+
+    def thumbnail_path(self, digest):
+        return self.cache_dir / f"{digest}_thumb.jpg"
+
+    def preview_path(self, digest):
+        return self.cache_dir / f"{digest}_preview.jpg"
+
+    def submit(self, digest, filename=''):
+        """Queue a stored document for processing; returns a Future (or None when already cached)"""
+        if self.result(digest) is not None:
+            return None
+        with self._lock:
+            future = self._pending.get(digest)
+            if future is None:
+                future = self._executor.submit(self._process, digest, filename)
+                self._pending[digest] = future
+                future.add_done_callback(lambda _: self._pending.pop(digest, None))
+            return future
+
+    def result(self, digest):
+        """Cached processing result, or None while unprocessed"""
+        with self._lock:
+            result = self._results.get(digest)
+        if result is None and self._result_path(digest).exists():
+            with open(self._result_path(digest), encoding='utf-8') as f:
+                result = json.load(f)
+            with self._lock:
+                self._results[digest] = result
+        return result
+
+    def is_pending(self, digest):
+        with self._lock:
+            return digest in self._pending
+
+    def _process(self, digest, filename):
+        path = self.document_store.blob_path(digest)
+        result = {'digest': digest, 'size': None, 'detected_type': None, 'valid': False}
+        try:
+            result['size'] = path.stat().st_size
+            with open(path, 'rb') as f:
+                detected = sniff_type(f.read(SNIFF_BYTES))
+            extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+            result['detected_type'] = detected
+            result['valid'] = detected is not None and EXTENSION_TYPES.get(extension, detected) == detected
+            if detected in ('png', 'jpeg'):
+                result.update(self._process_image(digest, path))
+            elif detected == 'pdf':
+                result.update(_pdf_metadata(path))
+        except Exception as e:
+            result['valid'] = False
+            result['error'] = str(e)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        os.replace(tmp_path, self._result_path(digest))
+        with self._lock:
+            self._results[digest] = result
+        return result
+
+    def _process_image(self, digest, path):
+        with Image.open(path) as image:
+            metadata = {'width': image.width, 'height': image.height, 'format': image.format, 'mode': image.mode}
+            # Let the JPEG decoder downscale while decoding instead of inflating the full image
+            image.draft('RGB', PREVIEW_SIZE)
+            preview = image.convert('RGB')
+            preview.thumbnail(PREVIEW_SIZE)
+            _save_atomic(preview, self.preview_path(digest), quality=85)
+            preview.thumbnail(THUMBNAIL_SIZE)
+            _save_atomic(preview, self.thumbnail_path(digest), quality=80)
+        return metadata
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
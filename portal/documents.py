@@ -0,0 +1,125 @@
+"""
+Content-addressed, deduplicating store for uploaded documents.
+Blobs are kept once per SHA-256 digest with a reference count, so the same
+certificate uploaded by many farms costs a single copy on disk.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class DocumentStore:
+    """Blob directory plus a JSON index of {digest: metadata}"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.blobs_dir = self.root / "blobs"
+        self.index_path = self.root / "index.json"
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    def _load_index(self):
+        if self.index_path.exists():
+            with open(self.index_path, encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def _save_index(self):
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def blob_path(self, digest):
+        return self.blobs_dir / digest[:2] / digest
+
+    def __contains__(self, digest):
+        return digest in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def metadata(self, digest):
+        """Index entry of a blob, or None"""
+        with self._lock:
+            entry = self._index.get(digest)
+            return dict(entry) if entry else None
+
+    def put(self, stream, filename='', content_type=''):
+        """Stream a file-like object into the store and take one reference
+
+        The data is hashed while it is written to a temporary file in chunks;
+        when the digest is already stored the temporary copy is discarded.
+        Returns the index entry, including its 'digest'.
+        """
+        hasher = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.blobs_dir, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                while True:
+                    chunk = stream.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            digest = hasher.hexdigest()
+            with self._lock:
+                entry = self._index.get(digest)
+                if entry is None:
+                    path = self.blob_path(digest)
+                    path.parent.mkdir(exist_ok=True)
+                    os.replace(tmp_path, path)
+                    tmp_path = None
+                    entry = self._index[digest] = {
+                        'size': size,
+                        'filename': filename,
+                        'content_type': content_type,
+                        'created': datetime.now().isoformat(),
+                        'refcount': 0,
+                    }
+                entry['refcount'] += 1
+                self._save_index()
+                return dict(entry, digest=digest)
+        finally:
+            if tmp_path is not None:
+                os.remove(tmp_path)
+
+    def retain(self, digest):
+        """Take another reference to a stored blob"""
+        with self._lock:
+            self._index[digest]['refcount'] += 1
+            self._save_index()
+
+    def release(self, digest):
+        """Drop one reference; the blob is deleted with its last reference"""
+        with self._lock:
+            entry = self._index.get(digest)
+            if entry is None:
+                return
+            entry['refcount'] -= 1
+            if entry['refcount'] <= 0:
+                del self._index[digest]
+                self.blob_path(digest).unlink(missing_ok=True)
+            self._save_index()
+
+    def open(self, digest):
+        """Open a stored blob for reading"""
+        return open(self.blob_path(digest), 'rb')
+
+    def stats(self):
+        """Blob count, stored bytes and bytes saved by deduplication"""
+        with self._lock:
+            entries = list(self._index.values())
+        stored = sum(entry['size'] for entry in entries)
+        referenced = sum(entry['size'] * entry['refcount'] for entry in entries)
+        return {'blobs': len(entries), 'stored_bytes': stored, 'deduplicated_bytes': referenced - stored}
@@ -0,0 +1,78 @@
+"""
+Process-wide cache of built Plotly figures.
+Entries are keyed by (chart id, data version, theme), so a chart is built
+and validated once per version of its data; later reruns in any session get
+the finished figure back from a dictionary lookup. The cache is bounded by
+the estimated size of the figures' data (least recently used entries are
+dropped first).
+Cached figures are shared and must not be modified.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def data_version(source):
+    """Version token of a rollup or matrix: its identity plus its change counter"""
+    return (id(source), source.version)
+
+
+def estimated_bytes(value):
+    """Rough in-memory size of a figure's plotly JSON dict: array buffers, strings and 8 bytes per number"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes if value.dtype != object else sum(estimated_bytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(len(key) + estimated_bytes(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(estimated_bytes(item) for item in value)
+    if isinstance(value, str):
+        return len(value)
+    return 8
+
+
+class FigureCache:
+    """LRU cache of built figures, bounded by their estimated total size"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def stats(self):
+        """(hits, misses) since the cache was created"""
+        return self.hits, self.misses
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_build(self, key, build):
+        """The cached figure of key, or build()'s figure, cached and returned"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        figure = build()
+        size = estimated_bytes(figure.to_plotly_json())
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (size, figure)
+                self.bytes += size
+                while self.bytes > self.max_bytes and len(self._entries) > 1:
+                    _, (old_size, _) = self._entries.popitem(last=False)
+                    self.bytes -= old_size
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
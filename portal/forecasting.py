@@ -0,0 +1,205 @@
+"""
+Per-farm forecasts of daily risk and incidents.
+disease.csv is rolled up into one daily series per farm: a risk score (the
+mean of Low/Medium/High as 20/50/80), the number of readings with a disease
+observed, and the mean temperature, humidity and ammonia. Each target is
+modelled as a linear regression on the three sensors plus simple exponential
+smoothing of the regression residuals; future sensor values are their own
+smoothed levels. Forecasts come with prediction intervals from the one-step
+residual spread.
+
+Fitted parameters are cached per farm. New days are folded in incrementally
+(the smoothing recursion runs over them only) and a farm is refitted from
+scratch when refit_every new days have accumulated or its history changed.
+Farms are fitted in parallel on a thread pool; forecasting from cached
+parameters is a few arithmetic operations per day ahead.
+"""
+
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from portal.storage import load_data, save_data
+from portal.telemetry import count, timed
+
+STATE_FILE = "forecast_params.json"
+RISK_POINTS = {'Low': 20, 'Medium': 50, 'High': 80}
+TARGETS = ('risk_score', 'incidents')
+EXOGENOUS = ('Temp_C', 'Humidity_%', 'Ammonia_ppm')
+TARGET_BOUNDS = {'risk_score': (0, 100), 'incidents': (0, None)}
+ALPHAS = np.linspace(0.05, 0.95, 19)  # smoothing weights tried on a full fit
+EXOGENOUS_ALPHA = 0.3
+REFIT_EVERY = 7  # new days folded in incrementally before a full refit
+INTERVAL_Z = 1.2816  # 80% prediction interval
+
+
+def farm_daily_series(df):
+    """{farm: daily DataFrame of the targets and mean sensor values} from all disease.csv rows, healthy ones included"""
+    days = pd.to_datetime(df['Timestamp'], dayfirst=True, format='mixed').dt.floor('D')
+    rows = pd.DataFrame({
+        'Farm_ID': df['Farm_ID'].to_numpy(),
+        'Date': days.to_numpy(),
+        'risk_score': df['Risk_Level'].map(RISK_POINTS).to_numpy(),
+        'incidents': (df['Disease_Observed'].fillna('None') != 'None').astype(int).to_numpy(),
+        **{name: df[name].to_numpy() for name in EXOGENOUS},
+    })
+    daily = rows.groupby(['Farm_ID', 'Date']).agg(
+        risk_score=('risk_score', 'mean'), incidents=('incidents', 'sum'),
+        **{name: (name, 'mean') for name in EXOGENOUS})
+    series = {}
+    for farm_id, frame in daily.groupby(level='Farm_ID'):
+        frame = frame.droplevel('Farm_ID').asfreq('D')  # days without readings
+        frame['incidents'] = frame['incidents'].fillna(0)
+        series[farm_id] = frame.ffill()
+    return series
+
+
+def _digest(frame):
+    return hashlib.sha1(np.ascontiguousarray(frame[[*TARGETS, *EXOGENOUS]].to_numpy(dtype=float)).tobytes()).hexdigest()
+
+
+def _design(frame):
+    return np.column_stack([np.ones(len(frame)), frame[list(EXOGENOUS)].to_numpy(dtype=float)])
+
+
+def fit_target(frame, target):
+    """Full fit of one target: regression coefficients, then the best smoothing weight by one-step error"""
+    X = _design(frame)
+    y = frame[target].to_numpy(dtype=float)
+    if len(y) > X.shape[1] + 2:
+        beta = np.linalg.lstsq(X, y, rcond=None)[0]
+    else:
+        beta = np.zeros(X.shape[1])  # too little history to regress: smoothing alone
+    residuals = y - X @ beta
+    levels = np.zeros(len(ALPHAS))
+    sse = np.zeros(len(ALPHAS))
+    for residual in residuals:  # all candidate weights at once
+        error = residual - levels
+        sse += error * error
+        levels += ALPHAS * error
+    best = int(np.argmin(sse))
+    return {'beta': beta.tolist(), 'alpha': float(ALPHAS[best]), 'level': float(levels[best]),
+            'sse': float(sse[best]), 'n': len(y)}
+
+
+def fold_target(params, frame, target):
+    """Params after running the smoothing recursion over new rows, keeping beta and alpha"""
+    params = dict(params)
+    beta = np.asarray(params['beta'])
+    residuals = frame[target].to_numpy(dtype=float) - _design(frame) @ beta
+    for residual in residuals:
+        error = residual - params['level']
+        params['sse'] += error * error
+        params['level'] += params['alpha'] * error
+    params['n'] += len(residuals)
+    return params
+
+
+def _exogenous_levels(frame, levels=None):
+    """Smoothed level of each sensor, continuing from `levels` when given"""
+    levels = dict(levels or {})
+    for name in EXOGENOUS:
+        for value in frame[name].to_numpy(dtype=float):
+            previous = levels.get(name)
+            levels[name] = value if previous is None else previous + EXOGENOUS_ALPHA * (value - previous)
+    return levels
+
+
+def refresh_farm(frame, previous=None, refit_every=REFIT_EVERY):
+    """(params, mode) of one farm, mode being 'cached', 'incremental' or 'fit'"""
+    frame = frame.dropna(subset=[*TARGETS, *EXOGENOUS])
+    if previous is not None:
+        last_date = pd.Timestamp(previous['last_date'])
+        history, new = frame[frame.index <= last_date], frame[frame.index > last_date]
+        unchanged = len(history) == previous['days'] and _digest(history) == previous['digest']
+        if unchanged and new.empty:
+            return previous, 'cached'
+        if unchanged and previous['days_since_fit'] + len(new) < refit_every:
+            params = {
+                **previous,
+                'targets': {t: fold_target(previous['targets'][t], new, t) for t in TARGETS},
+                'exogenous': _exogenous_levels(new, previous['exogenous']),
+                'last_date': new.index[-1].isoformat(),
+                'days': len(frame),
+                'digest': _digest(frame),
+                'days_since_fit': previous['days_since_fit'] + len(new),
+            }
+            return params, 'incremental'
+    params = {
+        'targets': {t: fit_target(frame, t) for t in TARGETS},
+        'exogenous': _exogenous_levels(frame),
+        'last_date': frame.index[-1].isoformat(),
+        'days': len(frame),
+        'digest': _digest(frame),
+        'days_since_fit': 0,
+    }
+    return params, 'fit'
+
+
+def forecast_from(params, target, horizon):
+    """Point forecasts and interval bounds for days 1..horizon after the last observed day"""
+    fitted = params['targets'][target]
+    x = np.array([1.0, *(params['exogenous'][name] for name in EXOGENOUS)])
+    mean = float(x @ np.asarray(fitted['beta'])) + fitted['level']
+    sigma = np.sqrt(fitted['sse'] / max(fitted['n'], 1))
+    steps = np.arange(1, horizon + 1)
+    spread = INTERVAL_Z * sigma * np.sqrt(1 + (steps - 1) * fitted['alpha'] ** 2)
+    low, high = TARGET_BOUNDS[target]
+    return pd.DataFrame({
+        'Day': [f'Day +{i}' for i in steps],
+        'Date': pd.Timestamp(params['last_date']) + pd.to_timedelta(steps, unit='D'),
+        'forecast': np.clip(np.full(horizon, mean), low, high),
+        'lower': np.clip(mean - spread, low, high),
+        'upper': np.clip(mean + spread, low, high),
+    })
+
+
+class Forecaster:
+    """Cached per-farm forecast parameters, refreshed in parallel when the data changes"""
+
+    def __init__(self, workers=4, refit_every=REFIT_EVERY, state_file=STATE_FILE):
+        self.refit_every = refit_every
+        self.state_file = state_file
+        self.version = None
+        self.modes = {'cached': 0, 'incremental': 0, 'fit': 0}
+        self._lock = threading.Lock()
+        self._params = load_data(state_file) if state_file else {}
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='forecast')
+
+    def farms(self):
+        return sorted(self._params)
+
+    @timed("forecast.update")
+    def update(self, series):
+        """Refresh the parameters of every farm in {farm: daily frame}; returns {farm: mode}"""
+        farms = sorted(series)
+        futures = [self._executor.submit(refresh_farm, series[farm], self._params.get(farm), self.refit_every)
+                   for farm in farms]
+        modes = {}
+        with self._lock:
+            for farm, future in zip(farms, futures):
+                self._params[farm], modes[farm] = future.result()
+                self.modes[modes[farm]] += 1
+            if self.state_file and any(mode != 'cached' for mode in modes.values()):
+                save_data(self.state_file, self._params)
+        count("forecast.refits", sum(mode == 'fit' for mode in modes.values()))
+        return modes
+
+    def refresh(self, version, build_series):
+        """update(build_series()) once per data version"""
+        if version != self.version:
+            self.update(build_series())
+            self.version = version
+
+    def forecast(self, farm_id, target='risk_score', horizon=7):
+        """DataFrame of Day, Date, forecast, lower and upper; empty for an unknown farm"""
+        params = self._params.get(farm_id)
+        if params is None:
+            return pd.DataFrame(columns=['Day', 'Date', 'forecast', 'lower', 'upper'])
+        return forecast_from(params, target, horizon)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,78 @@
+"""
+Multilingual support.
+"""
+
+import streamlit as st
+
+LANGUAGES = {
+    "English": {
+        "app_title": "Digital Farm Management Portal",
+        "welcome": "Welcome to Digital Farm Management Portal",
+        "description": "Comprehensive biosecurity and disease prevention solution for pig and poultry farmers",
+        "home": "Home",
+        "risk_assessment": "Risk Assessment",
+        "training": "Training Modules",
+        "compliance": "Compliance Tracking",
+        "alerts": "Alerts & Notifications",
+        "monitoring": "Monitoring Dashboard",
+        "networking": "Farmer Network",
+        "data_export": "Data Export",
+        "ml_predictor": "Animal Health Predictor",
+        "emergency_response": "Emergency Response",
+        "smart_analytics": "Smart Analytics",  
+        "protection_hub": "Protection Hub",
+        "performance_review": "Performance Review",
+        "language": "Language",
+        "farm_type": "Farm Type",
+        "pig": "Pig",
+        "poultry": "Poultry",
+        "submit": "Submit",
+        "save": "Save",
+        "download": "Download",
+        "upload": "Upload",
+        "view_details": "View Details",
+        "mark_completed": "Mark as Completed",
+        "in_progress": "In Progress",
+        "completed": "Completed",
+        "pending": "Pending",
+        "verified": "Verified",
+        "low_risk": "Low Risk",
+        "medium_risk": "Medium Risk",
+        "high_risk": "High Risk"
+    },
+    "हिंदी": {
+        "app_title": "डिजिटल फार्म प्रबंधन पोर्टल",
+        "welcome": "डिजिटल फार्म प्रबंधन पोर्टल में आपका स्वागत है",
+        "description": "सुअर और मुर्गी पालन किसानों के लिए व्यापक जैव सुरक्षा और रोग निवारण समाधान",
+        "home": "होम",
+        "risk_assessment": "जोखिम मूल्यांकन",
+        "training": "प्रशिक्षण मॉड्यूल",
+        "compliance": "अनुपालन ट्रैकिंग",
+        "alerts": "अलर्ट और सूचनाएं",
+        "monitoring": "निगरानी डैशबोर्ड",
+        "networking": "किसान नेटवर्क",
+        "data_export": "डेटा निर्यात",
+        "language": "भाषा",
+        "farm_type": "फार्म प्रकार",
+        "pig": "सुअर",
+        "poultry": "मुर्गी पालन",
+        "submit": "जमा करें",
+        "save": "सेव करें",
+        "download": "डाउनलोड",
+        "upload": "अपलोड",
+        "view_details": "विवरण देखें",
+        "mark_completed": "पूर्ण के रूप में चिह्नित करें",
+        "in_progress": "प्रगति में",
+        "completed": "पूर्ण",
+        "pending": "लंबित",
+        "verified": "सत्यापित",
+        "low_risk": "कम जोखिम",
+        "medium_risk": "मध्यम जोखिम",
+        "high_risk": "उच्च जोखिम"
+    }
+}
+
+def get_text(key):
+    """Get text based on selected language, always return a string."""
+    value = LANGUAGES.get(st.session_state.language, LANGUAGES["English"]).get(key)
+    return value if value is not None else str(key)
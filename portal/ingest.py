@@ -0,0 +1,406 @@
+"""
+Asyncio ingestion gateway for streaming sensor readings.
+Sensors connect over TCP or a Unix socket and send one reading per line,
+either a JSON object or a CSV row in disease.csv column order (a header line
+may redefine the order for that connection). Readings are validated against
+the model's feature_names, buffered per (Farm_ID, Pen_ID), scored in batches
+off the event loop and appended with their predictions to a daily JSON-lines
+log under data/readings/. Rejected lines are answered with
+{"line": n, "error": ...}; accepted ones are not acknowledged.
+
+Scored readings also go into a TimeSeriesStore of per-pen ring buffers,
+spilled to data/timeseries/ every --spill-s seconds for other processes.
+The portal can instead run the gateway in-process (PORTAL_INGEST_TCP or
+PORTAL_INGEST_UNIX) and read its windows straight from memory.
+
+Backpressure: connections feed a bounded queue. While scoring or persisting
+falls behind, the queue fills up, handlers stop reading their sockets, and
+the kernel's flow control slows the senders down.
+
+    python -m portal.ingest --tcp 127.0.0.1:8700
+    python -m portal.ingest --unix /tmp/portal-ingest.sock [--batch-size 256] [--flush-ms 500] [--spill-s 30]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import threading
+import time
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+from portal.ml import CATEGORICAL_FEATURES, NUMERIC_FEATURES
+from portal.storage import DATA_DIR
+from portal.telemetry import count, span
+from portal.timeseries import SPILL_INTERVAL, TIMESERIES_DIR, TimeSeriesStore, prune_segments
+
+logger = logging.getLogger(__name__)
+
+READINGS_DIR = DATA_DIR / "readings"
+CSV_COLUMNS = ['Timestamp', 'Farm_ID', 'Pen_ID', 'Animal_Type', 'Age_Weeks', 'Weight_Kg',
+               'Temp_C', 'Humidity_%', 'Ammonia_ppm']
+TIMESTAMP_FORMATS = ('%d-%m-%Y %H:%M', '%d-%m-%Y %H:%M:%S')
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_FLUSH_INTERVAL = 0.5  # seconds a reading may wait for its batch to fill
+DEFAULT_QUEUE_SIZE = 10_000
+MAX_LINE_BYTES = 64 * 1024
+TAIL_BLOCK = 64 * 1024  # bytes read at a time when tailing a readings log
+
+
+def parse_timestamp(value):
+    """ISO or disease.csv style timestamp as an ISO string; raises ValueError"""
+    value = str(value).strip()
+    try:
+        return datetime.fromisoformat(value).isoformat()
+    except ValueError:
+        pass
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).isoformat()
+        except ValueError:
+            pass
+    raise ValueError(f"Unrecognised timestamp '{value}'")
+
+
+def parse_reading(text, columns, feature_names):
+    """(reading, None) for a valid JSON or CSV line, else (None, error message)"""
+    if text.startswith('{'):
+        try:
+            raw = json.loads(text)
+        except ValueError as e:
+            return None, f"Invalid JSON: {e}"
+        if not isinstance(raw, dict):
+            return None, "Expected a JSON object"
+    else:
+        values = [value.strip() for value in text.split(',')]
+        if len(values) < len(columns):
+            return None, f"Expected {len(columns)} CSV fields ({', '.join(columns)}), got {len(values)}"
+        raw = dict(zip(columns, values))
+
+    missing = [name for name in feature_names if raw.get(name) in (None, '')]
+    if missing:
+        return None, f"Missing inputs: {missing}"
+    reading = {}
+    for name in feature_names:
+        if name in NUMERIC_FEATURES:
+            try:
+                value = float(raw[name])
+            except (TypeError, ValueError):
+                return None, f"Non-numeric {name} '{raw[name]}'"
+            if not math.isfinite(value):
+                return None, f"Non-finite {name}"
+            reading[name] = value
+        elif name in CATEGORICAL_FEATURES:
+            reading[name] = str(raw[name]).strip()
+        else:
+            reading[name] = raw[name]
+    try:
+        reading['Timestamp'] = parse_timestamp(raw['Timestamp']) if raw.get('Timestamp') else datetime.now().isoformat()
+    except ValueError as e:
+        return None, str(e)
+    return reading, None
+
+
+def _csv_header(text, feature_names):
+    """Column order from a CSV header line, or None when the line is data"""
+    names = [name.strip() for name in text.split(',')]
+    return names if set(feature_names) <= set(names) else None
+
+
+class IngestGateway:
+    """Validates, buffers, scores and persists streamed readings
+
+    score_batch(inputs) -> results is called from a worker thread with the
+    model inputs of one batch; see PredictionService.predict_batch.
+    Subscribers are called on the event loop with (readings, results) after
+    each batch is persisted. A batch that fails to score or persist is
+    logged and dropped (counted as failed) and the gateway carries on.
+    """
+
+    def __init__(self, score_batch, feature_names, batch_size=DEFAULT_BATCH_SIZE,
+                 flush_interval=DEFAULT_FLUSH_INTERVAL, queue_size=DEFAULT_QUEUE_SIZE, readings_dir=READINGS_DIR):
+        self.score_batch = score_batch
+        self.feature_names = list(feature_names)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.readings_dir = Path(readings_dir)
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.counts = {'connections': 0, 'accepted': 0, 'rejected': 0, 'scored': 0, 'failed': 0, 'batches': 0}
+        self._buffers = {}
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self._subscribers = []
+
+    def subscribe(self, callback):
+        self._subscribers.append(callback)
+
+    def stats(self):
+        return {**self.counts, 'queued': self.queue.qsize(), 'buffered': self._buffered,
+                'pens_buffered': len(self._buffers)}
+
+    async def handle_connection(self, reader, writer):
+        """Read one sensor connection until EOF"""
+        self.counts['connections'] += 1
+        columns = CSV_COLUMNS
+        line_number = 0
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(json.dumps({'line': line_number + 1, 'error': "Line too long"}).encode() + b'\n')
+                    break
+                if not line:
+                    break
+                line_number += 1
+                text = line.decode('utf-8', 'replace').strip()
+                if not text:
+                    continue
+                if not text.startswith('{'):
+                    header = _csv_header(text, self.feature_names)
+                    if header is not None:
+                        columns = header
+                        continue
+                reading, error = parse_reading(text, columns, self.feature_names)
+                if error is not None:
+                    self.counts['rejected'] += 1
+                    writer.write(json.dumps({'line': line_number, 'error': error}).encode() + b'\n')
+                    await writer.drain()
+                    continue
+                self.counts['accepted'] += 1
+                await self.queue.put(reading)  # waits while the gateway is saturated
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def run_batcher(self):
+        """Move queued readings into per-pen buffers and flush them by size or age"""
+        while True:
+            try:
+                reading = await asyncio.wait_for(self.queue.get(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                reading = None
+            if reading is not None:
+                self._buffers.setdefault((reading['Farm_ID'], reading['Pen_ID']), []).append(reading)
+                self._buffered += 1
+            if self._buffered >= self.batch_size or (
+                    self._buffered and time.monotonic() - self._last_flush >= self.flush_interval):
+                await self.flush()
+
+    async def flush(self):
+        """Score and persist everything buffered
+
+        Failures are logged and counted rather than raised: a dead batcher
+        would let the queue fill up and block every connected sensor.
+        """
+        buffers, self._buffers, self._buffered = self._buffers, {}, 0
+        self._last_flush = time.monotonic()
+        readings = [reading for pen_readings in buffers.values() for reading in pen_readings]
+        if not readings:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(None, self._score_and_persist, readings)
+        except Exception:
+            logger.exception("Dropped a batch of %d readings that could not be scored or persisted", len(readings))
+            count("ingest.errors")
+            self.counts['failed'] += len(readings)
+            return
+        self.counts['scored'] += len(readings)
+        self.counts['batches'] += 1
+        for callback in self._subscribers:
+            try:
+                callback(readings, results)
+            except Exception:
+                logger.exception("Ingest subscriber %r failed", callback)
+                count("ingest.errors")
+
+    def _score_and_persist(self, readings):
+        with span("ingest.score"):
+            results = self.score_batch([{name: r[name] for name in self.feature_names} for r in readings])
+        received = datetime.now().isoformat()
+        lines = []
+        for reading, result in zip(readings, results):
+            record = {**reading, 'received_at': received}
+            if 'error' in result:
+                record['error'] = result['error']
+            else:
+                record.update(result['predictions'])
+            lines.append(json.dumps(record))
+        with span("ingest.persist"):
+            self.readings_dir.mkdir(parents=True, exist_ok=True)
+            path = self.readings_dir / f"readings-{datetime.now():%Y%m%d}.jsonl"
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+        count("ingest.readings", len(readings))
+        return results
+
+    async def serve(self, host=None, port=None, path=None):
+        """Start the socket server (TCP, or Unix when path is given) and the batcher"""
+        if path is not None:
+            server = await asyncio.start_unix_server(self.handle_connection, path=path, limit=MAX_LINE_BYTES)
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE_BYTES)
+        self._batcher_task = asyncio.create_task(self.run_batcher())
+        return server
+
+
+def _tail_lines(path, limit):
+    """The last `limit` non-empty lines of a file, read backwards in blocks from its end"""
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        blocks, newlines = [], 0
+        while position > 0 and newlines <= limit:
+            size = min(TAIL_BLOCK, position)
+            position -= size
+            f.seek(position)
+            blocks.append(f.read(size))
+            newlines += blocks[-1].count(b'\n')
+    lines = [line for line in b''.join(reversed(blocks)).split(b'\n') if line.strip()]
+    if position > 0:
+        lines = lines[1:]  # the first line may be cut by the block boundary
+    return [line.decode('utf-8', 'replace') for line in lines[-limit:]]
+
+
+def read_recent(limit=200, readings_dir=READINGS_DIR):
+    """The latest persisted readings with their predictions, newest last
+
+    Only the end of the newest daily logs is read, so the cost does not grow
+    with the day's traffic.
+    """
+    files = sorted(Path(readings_dir).glob("readings-*.jsonl"))
+    recent = []
+    for path in reversed(files[-2:]):  # today's log may still be short just after midnight
+        recent = _tail_lines(path, limit - len(recent)) + recent
+        if len(recent) >= limit:
+            break
+    records = []
+    for line in recent:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            pass  # a line still being appended
+    return records
+
+
+async def spill_periodically(store, interval=SPILL_INTERVAL, directory=TIMESERIES_DIR, anomaly_engine=None):
+    """Spill the store's new readings to a segment every `interval` seconds, off the event loop
+
+    The state of anomaly_engine, when given, is saved on the same schedule.
+    """
+    loop = asyncio.get_running_loop()
+
+    def spill():
+        with span("ingest.spill"):
+            store.spill(directory)
+            prune_segments(directory)
+            if anomaly_engine is not None:
+                anomaly_engine.save()
+
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            await loop.run_in_executor(None, spill)
+    finally:
+        await loop.run_in_executor(None, spill)
+
+
+def start_background_spill(store, anomaly_engine=None, spill_interval=SPILL_INTERVAL):
+    """Run spill_periodically on its own event loop in a daemon thread, for processes without a gateway"""
+    threading.Thread(target=asyncio.run, args=(spill_periodically(store, spill_interval,
+                                                                  anomaly_engine=anomaly_engine),),
+                     name='timeseries-spill', daemon=True).start()
+
+
+def start_background_gateway(score_batch, feature_names, store, host=None, port=None, path=None,
+                             spill_interval=SPILL_INTERVAL, anomaly_engine=None):
+    """Run a gateway feeding `store` (and anomaly_engine) on its own event loop in a daemon thread
+
+    Returns the gateway; raises OSError when the address cannot be bound.
+    """
+    gateway = IngestGateway(score_batch, feature_names)
+    gateway.subscribe(store.append_readings)
+    if anomaly_engine is not None:
+        gateway.subscribe(anomaly_engine.observe_readings)
+    started = threading.Event()
+    failure = []
+
+    async def run():
+        try:
+            server = await gateway.serve(host, port, path)
+        except OSError as e:
+            failure.append(e)
+            return
+        finally:
+            started.set()
+        async with server:
+            await spill_periodically(store, spill_interval, anomaly_engine=anomaly_engine)
+
+    threading.Thread(target=asyncio.run, args=(run(),), name='ingest-gateway', daemon=True).start()
+    started.wait()
+    if failure:
+        raise failure[0]
+    return gateway
+
+
+async def _run(args):
+    from portal.prediction_server import PredictionService
+
+    service = PredictionService(workers=args.workers, coalesce_size=1)
+    if 'error' in service.ml_models:
+        raise SystemExit(f"Model loading failed: {service.ml_models['error']}")
+    gateway = IngestGateway(service.predict_batch, service.ml_models['feature_names'], batch_size=args.batch_size,
+                            flush_interval=args.flush_ms / 1000, queue_size=args.queue_size,
+                            readings_dir=args.readings_dir)
+    store = TimeSeriesStore()
+    gateway.subscribe(store.append_readings)
+    if args.unix:
+        server = await gateway.serve(path=args.unix)
+        where = args.unix
+    else:
+        host, _, port = args.tcp.rpartition(':')
+        server = await gateway.serve(host or '127.0.0.1', int(port))
+        where = args.tcp
+    print(f"Ingesting sensor readings on {where} (batches of {args.batch_size}, logs in {args.readings_dir})")
+    spiller = asyncio.create_task(spill_periodically(store, args.spill_s))
+    try:
+        async with server:
+            while True:
+                await asyncio.sleep(args.report_s)
+                print(json.dumps(gateway.stats()))
+    finally:
+        await gateway.flush()
+        spiller.cancel()
+        await asyncio.gather(spiller, return_exceptions=True)
+        service.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Asyncio ingestion gateway for streaming sensor readings")
+    where = parser.add_mutually_exclusive_group()
+    where.add_argument('--tcp', default='127.0.0.1:8700', help='host:port to listen on')
+    where.add_argument('--unix', help='Unix socket path to listen on')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--flush-ms', type=float, default=DEFAULT_FLUSH_INTERVAL * 1000)
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--readings-dir', default=str(READINGS_DIR))
+    parser.add_argument('--spill-s', type=float, default=SPILL_INTERVAL,
+                        help='seconds between time-series segment spills')
+    parser.add_argument('--report-s', type=float, default=30, help='seconds between stats lines')
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings('ignore', category=UserWarning, module='sklearn')
+    try:
+        asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
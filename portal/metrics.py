@@ -0,0 +1,218 @@
+"""
+Prometheus text exposition of the portal telemetry.
+Renders the spans, counters, cache statistics, active sessions, model details
+and process memory kept in portal/telemetry.py, either served by a small HTTP
+thread or rewritten periodically to a file for the node_exporter textfile
+collector. The Streamlit app starts whichever is configured:
+
+    PORTAL_METRICS_PORT=9464 streamlit run app.py          # http://127.0.0.1:9464/metrics
+    PORTAL_METRICS_FILE=/var/lib/node_exporter/portal.prom streamlit run app.py
+"""
+
+import logging
+import os
+import resource
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from portal.telemetry import BUCKETS, COUNTERS, SESSIONS, TIMINGS, cache_stats, get_info
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+FILE_INTERVAL = 15  # seconds between file rewrites
+
+# Spans with a dedicated histogram: span name -> (metric, label, label value); page.* spans are handled below
+SPAN_METRICS = {
+    'rerun': ('portal_rerun_seconds', None, None),
+    'ml.predict': ('portal_prediction_seconds', 'mode', 'single'),
+    'ml.predict_batch': ('portal_prediction_seconds', 'mode', 'batch'),
+    'storage.load': ('portal_storage_seconds', 'operation', 'read'),
+    'storage.save': ('portal_storage_seconds', 'operation', 'write'),
+}
+HELP = {
+    'portal_rerun_seconds': "Full script rerun time",
+    'portal_page_render_seconds': "Page render time",
+    'portal_prediction_seconds': "Prediction call time; batch calls score many inputs",
+    'portal_storage_seconds': "JSON collection read and write time",
+    'portal_span_seconds': "Time spent in other instrumented sections",
+}
+
+
+def _span_metric(name):
+    """(metric, labels) a span is exported under"""
+    if name in SPAN_METRICS:
+        metric, label, value = SPAN_METRICS[name]
+        return metric, {label: value} if label else {}
+    if name.startswith('page.'):
+        return 'portal_page_render_seconds', {'page': name[len('page.'):]}
+    return 'portal_span_seconds', {'span': name}
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _memory():
+    """(current, peak) resident set size in bytes; current is None where /proc is unavailable"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak *= 1 if sys.platform == 'darwin' else 1024  # bytes on macOS, kilobytes elsewhere
+    try:
+        with open('/proc/self/statm') as f:
+            current = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        current = None
+    return current, peak
+
+
+def render():
+    """Current metrics in the Prometheus text exposition format"""
+    lines = []
+
+    def family(metric, kind, help_text, samples):
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for suffix, labels, value in samples:
+            lines.append(f"{metric}{suffix}{_labels(labels)} {_number(value)}")
+
+    # Span histograms
+    histograms = {}
+    for name in TIMINGS.names():
+        snapshot = TIMINGS.snapshot(name)
+        metric, labels = _span_metric(name)
+        samples = histograms.setdefault(metric, [])
+        cumulative = 0
+        for bound, bucket in zip(BUCKETS + (float('inf'),), snapshot['buckets']):
+            cumulative += bucket
+            le = '+Inf' if bound == float('inf') else repr(bound)
+            samples.append(('_bucket', {**labels, 'le': le}, cumulative))
+        samples.append(('_sum', labels, snapshot['total']))
+        samples.append(('_count', labels, snapshot['count']))
+    for metric, samples in histograms.items():
+        family(metric, 'histogram', HELP[metric], samples)
+
+    # Predictions
+    counters = COUNTERS.snapshot()
+    family('portal_predictions_total', 'counter', "Sensor inputs scored, single and batch",
+           [('', {}, counters.get('ml.predictions', 0))])
+
+    # Caches
+    caches = cache_stats()
+    family('portal_cache_hits_total', 'counter', "Cache lookups served from the cache",
+           [('', {'cache': name}, hits) for name, (hits, _) in caches.items()])
+    family('portal_cache_misses_total', 'counter', "Cache lookups that built the value",
+           [('', {'cache': name}, misses) for name, (_, misses) in caches.items()])
+    family('portal_cache_hit_ratio', 'gauge', "Share of cache lookups served from the cache",
+           [('', {'cache': name}, hits / (hits + misses)) for name, (hits, misses) in caches.items()
+            if hits + misses])
+
+    # Sessions
+    family('portal_active_sessions', 'gauge', "Browser sessions with a rerun in the last five minutes",
+           [('', {}, SESSIONS.active())])
+
+    # Model
+    model = get_info("model")
+    if model:
+        family('portal_model_info', 'gauge', "Loaded prediction model; version is a hash of its training data",
+               [('', {'version': model['version'], 'trained_at': model['trained_at']}, 1)])
+        family('portal_model_training_seconds', 'gauge', "Duration of the last model training",
+               [('', {}, model['training_seconds'])])
+        family('portal_model_training_samples', 'gauge', "Rows the loaded model was trained on",
+               [('', {}, model['samples'])])
+
+    # Process memory
+    current, peak = _memory()
+    if current is not None:
+        family('portal_process_resident_memory_bytes', 'gauge', "Resident memory of the portal process",
+               [('', {}, current)])
+    family('portal_process_max_resident_memory_bytes', 'gauge', "Peak resident memory of the portal process",
+           [('', {}, peak)])
+
+    return '\n'.join(lines) + '\n'
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        body = render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_http_exporter(port, host='127.0.0.1'):
+    """Serve /metrics from a daemon thread; returns the server (call shutdown() to stop)"""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True).start()
+    return server
+
+
+class FileExporter:
+    """Rewrites the exposition to a file every `interval` seconds from a daemon thread"""
+
+    def __init__(self, path, interval=FILE_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='metrics-file', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def write(self):
+        """Write the current metrics atomically, so scrapers never read a partial file"""
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(render())
+        os.replace(tmp_path, self.path)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.write()
+            except OSError:
+                pass  # e.g. the directory is gone; try again next interval
+            self._stop.wait(self.interval)
+
+    def shutdown(self):
+        self._stop.set()
+        self._thread.join()
+
+
+def start_from_environment(environ=os.environ):
+    """Start the exporters configured by PORTAL_METRICS_PORT / PORTAL_METRICS_FILE; returns those that started
+
+    A port that is already bound (another server process, or a socket still
+    in TIME_WAIT) is logged and skipped rather than raised, so the app runs
+    without the HTTP exporter.
+    """
+    exporters = []
+    if environ.get('PORTAL_METRICS_PORT'):
+        try:
+            exporters.append(start_http_exporter(int(environ['PORTAL_METRICS_PORT']),
+                                                 environ.get('PORTAL_METRICS_HOST', '127.0.0.1')))
+        except OSError as e:
+            logger.warning("Metrics exporter not started on port %s: %s", environ['PORTAL_METRICS_PORT'], e)
+    if environ.get('PORTAL_METRICS_FILE'):
+        exporters.append(FileExporter(environ['PORTAL_METRICS_FILE']).start())
+    return exporters
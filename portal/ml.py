@@ -0,0 +1,251 @@
+"""
+Animal health prediction models trained on disease.csv.
+scikit-learn is imported on first training, not at import time.
+"""
+
+import hashlib
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from portal.telemetry import count, set_info, timed
+
+DISEASE_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "disease.csv")
+
+
+def dataset_version(csv_path):
+    """Short content hash of the training data, identifying the models trained on it"""
+    digest = hashlib.sha256()
+    with open(csv_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()[:12]
+
+
+@timed("ml.train")
+def load_and_train_ml_model(csv_path=DISEASE_CSV):
+    """Load the dataset and train the ML models for animal health prediction"""
+    from sklearn.preprocessing import StandardScaler, LabelEncoder
+    from sklearn.ensemble import RandomForestClassifier
+    
+    try:
+        started = time.perf_counter()
+        
+        # Load the disease dataset
+        df = pd.read_csv(csv_path)
+        
+        # Clean the data - remove rows with missing Disease_Observed values
+        df_clean = df.dropna(subset=['Disease_Observed']).copy()
+        
+        # Encode categorical features
+        encoders = {}
+        cat_features = ['Animal_Type', 'Farm_ID', 'Pen_ID']
+        
+        for col in cat_features:
+            if col in df_clean.columns:
+                le = LabelEncoder()
+                df_clean[col + '_encoded'] = le.fit_transform(df_clean[col])
+                encoders[col] = le
+        
+        # Encode target variables
+        disease_encoder = LabelEncoder()
+        df_clean['Disease_Observed_encoded'] = disease_encoder.fit_transform(df_clean['Disease_Observed'])
+        
+        risk_encoder = LabelEncoder()
+        df_clean['Risk_Level_encoded'] = risk_encoder.fit_transform(df_clean['Risk_Level'])
+        
+        # Prepare features
+        feature_cols = ['Animal_Type_encoded','Farm_ID_encoded','Pen_ID_encoded','Age_Weeks','Weight_Kg','Temp_C','Humidity_%','Ammonia_ppm']
+        X = df_clean[feature_cols]
+        y_disease = df_clean['Disease_Observed_encoded']
+        y_risk = df_clean['Risk_Level_encoded']
+        
+        # Scale features
+        scaler = StandardScaler()
+        X_scaled = scaler.fit_transform(X)
+        
+        # Train models
+        disease_model = RandomForestClassifier(n_estimators=100, random_state=42)
+        disease_model.fit(X_scaled, y_disease)
+        
+        risk_model = RandomForestClassifier(n_estimators=100, random_state=42)
+        risk_model.fit(X_scaled, y_risk)
+        
+        version = dataset_version(csv_path)
+        trained_at = datetime.now().isoformat(timespec='seconds')
+        training_seconds = time.perf_counter() - started
+        set_info("model", version=version, trained_at=trained_at, training_seconds=training_seconds,
+                 samples=len(df_clean))
+        
+        return {
+            'disease_model': disease_model,
+            'risk_model': risk_model,
+            'scaler': scaler,
+            'encoders': encoders,
+            'disease_encoder': disease_encoder,
+            'risk_encoder': risk_encoder,
+            'feature_names': ['Animal_Type','Farm_ID','Pen_ID','Age_Weeks','Weight_Kg','Temp_C','Humidity_%','Ammonia_ppm'],
+            'dataset': df_clean,
+            'accuracy': {
+                'disease': disease_model.score(X_scaled, y_disease),
+                'risk': risk_model.score(X_scaled, y_risk)
+            },
+            'version': version,
+            'trained_at': trained_at,
+            'training_seconds': training_seconds
+        }
+    except Exception as e:
+        return {'error': str(e)}
+
+
+@timed("ml.predict")
+def predict_animal_health(sensor_input, ml_models):
+    """Predict animal disease and risk level based on sensor input"""
+    count("ml.predictions")
+    try:
+        if 'error' in ml_models:
+            return {"error": f"Model loading failed: {ml_models['error']}"}
+        
+        # Check for required inputs
+        required_inputs = ml_models['feature_names']
+        missing = [key for key in required_inputs if key not in sensor_input]
+        if missing:
+            return {"error": f"Missing inputs: {missing}"}
+        
+        # Encode categorical inputs
+        input_data = []
+        
+        # Animal_Type
+        try:
+            animal_encoded = ml_models['encoders']['Animal_Type'].transform([sensor_input['Animal_Type']])[0]
+            input_data.append(animal_encoded)
+        except ValueError:
+            return {"error": f"Invalid Animal_Type '{sensor_input['Animal_Type']}'. Valid options: {list(ml_models['encoders']['Animal_Type'].classes_)}"}
+        
+        # Farm_ID
+        try:
+            farm_encoded = ml_models['encoders']['Farm_ID'].transform([sensor_input['Farm_ID']])[0]
+            input_data.append(farm_encoded)
+        except ValueError:
+            return {"error": f"Invalid Farm_ID '{sensor_input['Farm_ID']}'. Valid options: {list(ml_models['encoders']['Farm_ID'].classes_)}"}
+        
+        # Pen_ID
+        try:
+            pen_encoded = ml_models['encoders']['Pen_ID'].transform([sensor_input['Pen_ID']])[0]
+            input_data.append(pen_encoded)
+        except ValueError:
+            return {"error": f"Invalid Pen_ID '{sensor_input['Pen_ID']}'. Valid options: {list(ml_models['encoders']['Pen_ID'].classes_)}"}
+        
+        # Add numeric features
+        numeric_features = ['Age_Weeks','Weight_Kg','Temp_C','Humidity_%','Ammonia_ppm']
+        for feature in numeric_features:
+            input_data.append(sensor_input[feature])
+        
+        # Scale the input
+        input_scaled = ml_models['scaler'].transform([input_data])
+        
+        # Make predictions
+        disease_pred = ml_models['disease_model'].predict(input_scaled)[0]
+        risk_pred = ml_models['risk_model'].predict(input_scaled)[0]
+        
+        # Get probabilities
+        disease_proba = ml_models['disease_model'].predict_proba(input_scaled)[0]
+        risk_proba = ml_models['risk_model'].predict_proba(input_scaled)[0]
+        
+        # Decode predictions
+        disease_name = ml_models['disease_encoder'].inverse_transform([disease_pred])[0]
+        risk_name = ml_models['risk_encoder'].inverse_transform([risk_pred])[0]
+        
+        return {
+            "success": True,
+            "predictions": {
+                "disease": disease_name,
+                "risk_level": risk_name,
+                "disease_confidence": f"{max(disease_proba):.1%}",
+                "risk_confidence": f"{max(risk_proba):.1%}"
+            },
+            "input_data": sensor_input
+        }
+        
+    except Exception as e:
+        return {"error": f"Prediction error: {str(e)}"}
+
+
+CATEGORICAL_FEATURES = ['Animal_Type', 'Farm_ID', 'Pen_ID']
+NUMERIC_FEATURES = ['Age_Weeks', 'Weight_Kg', 'Temp_C', 'Humidity_%', 'Ammonia_ppm']
+
+
+@timed("ml.predict_batch")
+def predict_animal_health_batch(sensor_inputs, ml_models):
+    """Predict many sensor inputs at once
+
+    Encoding, scaling and both forests run once over the whole batch.
+    Returns one result per input, shaped like predict_animal_health's.
+    """
+    sensor_inputs = list(sensor_inputs)
+    count("ml.predictions", len(sensor_inputs))
+    if 'error' in ml_models:
+        return [{"error": f"Model loading failed: {ml_models['error']}"} for _ in sensor_inputs]
+    if not sensor_inputs:
+        return []
+    
+    try:
+        frame = pd.DataFrame.from_records(sensor_inputs)
+        results = [None] * len(frame)
+        
+        def reject(rows, message):
+            for row in np.flatnonzero(rows):
+                if results[row] is None:
+                    results[row] = {"error": message(row)}
+        
+        # Check for required inputs
+        required_inputs = ml_models['feature_names']
+        for column in required_inputs:
+            if column not in frame:
+                frame[column] = np.nan
+        missing = frame[required_inputs].isna().to_numpy()
+        reject(missing.any(axis=1), lambda row: f"Missing inputs: {[k for k, m in zip(required_inputs, missing[row]) if m]}")
+        
+        # Encode categorical inputs
+        features = np.zeros((len(frame), len(CATEGORICAL_FEATURES) + len(NUMERIC_FEATURES)))
+        for i, column in enumerate(CATEGORICAL_FEATURES):
+            encoder = ml_models['encoders'][column]
+            values = frame[column].to_numpy(dtype=object)
+            known = np.isin(values, encoder.classes_)
+            reject(~known & ~missing.any(axis=1), lambda row: (
+                f"Invalid {column} '{values[row]}'. Valid options: {list(encoder.classes_)}"))
+            features[known, i] = encoder.transform(values[known])
+        
+        # Add numeric features
+        numeric = frame[NUMERIC_FEATURES].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        reject(~np.isfinite(numeric).all(axis=1),
+               lambda row: "Prediction error: non-numeric or non-finite sensor value")
+        features[:, len(CATEGORICAL_FEATURES):] = numeric
+        
+        valid = np.array([result is None for result in results])
+        if valid.any():
+            input_scaled = ml_models['scaler'].transform(features[valid])
+            disease_proba = ml_models['disease_model'].predict_proba(input_scaled)
+            risk_proba = ml_models['risk_model'].predict_proba(input_scaled)
+            disease_names = ml_models['disease_encoder'].inverse_transform(
+                ml_models['disease_model'].classes_[disease_proba.argmax(axis=1)])
+            risk_names = ml_models['risk_encoder'].inverse_transform(
+                ml_models['risk_model'].classes_[risk_proba.argmax(axis=1)])
+            for i, row in enumerate(np.flatnonzero(valid)):
+                results[row] = {
+                    "success": True,
+                    "predictions": {
+                        "disease": disease_names[i],
+                        "risk_level": risk_names[i],
+                        "disease_confidence": f"{disease_proba[i].max():.1%}",
+                        "risk_confidence": f"{risk_proba[i].max():.1%}"
+                    },
+                    "input_data": sensor_inputs[row]
+                }
+        return results
+    
+    except Exception as e:
+        return [{"error": f"Prediction error: {str(e)}"} for _ in sensor_inputs]
@@ -0,0 +1,147 @@
+"""
+Seeded mock datasets for the demo dashboards.
+Every dataset is drawn from its own np.random.Generator derived from
+(seed, dataset name), built on first request and memoized by
+(dataset, size, seed), so charts stay stable across reruns and sessions.
+Generators are fully vectorized and scale to millions of rows for load tests.
+"""
+
+import threading
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SEED = 42
+MAX_CACHED = 32
+
+
+def _frequency(size):
+    """Daily rows up to a century; finer sensor-style steps beyond, keeping timestamps in range"""
+    for freq, per_year in (('D', 365), ('h', 24 * 365), ('min', 24 * 60 * 365)):
+        if size <= 100 * per_year:
+            return freq
+    return 's'
+
+
+def incident_timeseries(rng, size):
+    """Daily incidents, severity and cost ending today"""
+    dates = pd.date_range(end=pd.Timestamp.today().normalize(), periods=size, freq=_frequency(size))
+    seasonal = np.round(np.sin(np.linspace(0, 6.28, size)) * 3)
+    data = pd.DataFrame({
+        'date': dates,
+        'incidents': (rng.poisson(lam=5, size=size) + seasonal).clip(0),
+        'severity': rng.choice(np.arange(1, 6, dtype=np.int8), size=size, p=[0.3, 0.25, 0.2, 0.15, 0.1]),
+        'cost': rng.normal(loc=2000, scale=700, size=size).clip(100, None)
+    })
+    data['cumulative'] = data['incidents'].cumsum()
+    return data
+
+
+def entities(rng, size):
+    """Monitored units with risk, compliance and location"""
+    return pd.DataFrame({
+        'entity': [f"Unit-{i:03d}" for i in range(1, size + 1)],
+        'risk_score': np.round(rng.beta(2, 5, size=size) * 100, 1),
+        'last_incident_days': rng.integers(0, 180, size=size),
+        'compliance_pct': np.round(rng.uniform(60, 100, size=size), 1),
+        'location_lat': rng.uniform(12.8, 13.1, size=size),
+        'location_lon': rng.uniform(77.5, 77.8, size=size)
+    })
+
+
+def daily_trends(rng, size):
+    """Daily disease cases, temperature and mortality from 2025-01-01"""
+    dates = pd.date_range(start='2025-01-01', periods=size, freq=_frequency(size))
+    day = np.asarray((dates - dates[0]) / pd.Timedelta(days=1))
+    return pd.DataFrame({
+        'Date': dates,
+        'Disease_Cases': rng.poisson(3, size),
+        'Temperature': 25 + 5 * np.sin(day * 2 * np.pi / 365) + rng.normal(0, 2, size),
+        'Mortality_Rate': rng.uniform(0.1, 2.0, size)
+    })
+
+
+def team_performance(rng, size):
+    """Incidents resolved, response time and quality per response team"""
+    return pd.DataFrame({
+        'team': [f'Team {i}' for i in range(1, size + 1)],
+        'resolved': rng.integers(20, 100, size),
+        'response_time': rng.uniform(1, 24, size),
+        'quality_score': rng.uniform(75, 98, size)
+    })
+
+
+def monthly_scores(rng, size):
+    """Monthly performance score from January 2025"""
+    months = pd.period_range('2025-01', periods=size, freq='M')
+    return pd.DataFrame({
+        'Month': months.strftime('%b' if size <= 12 else '%b %Y'),
+        'Score': rng.uniform(75, 95, size)
+    })
+
+
+DATASETS = {
+    'incident_timeseries': incident_timeseries,
+    'entities': entities,
+    'daily_trends': daily_trends,
+    'team_performance': team_performance,
+    'monthly_scores': monthly_scores,
+}
+# Datasets whose row count is a volume; the others have a fixed number of teams or months
+SCALABLE_DATASETS = {'incident_timeseries', 'entities', 'daily_trends'}
+MAX_SCALE = 1000  # largest load-test multiplier of a volume dataset
+
+
+def make_rng(name, seed=DEFAULT_SEED):
+    """Generator for one dataset; independent of other datasets and of access order"""
+    return np.random.default_rng([seed, zlib.crc32(name.encode())])
+
+
+class MockDataService:
+    """Lazily built, memoized mock datasets
+
+    Results are shared between callers and must be treated as read-only.
+    The least recently used datasets are dropped beyond max_cached entries,
+    so load tests with very large sizes do not pin every variant in memory.
+    """
+
+    def __init__(self, seed=DEFAULT_SEED, max_cached=MAX_CACHED):
+        self.seed = seed
+        self.max_cached = max_cached
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name, size, seed=None):
+        """Dataset `name` with `size` rows for `seed` (the service seed by default)"""
+        try:
+            generator = DATASETS[name]
+        except KeyError:
+            raise ValueError(f"Unknown mock dataset '{name}'. Valid options: {list(DATASETS)}") from None
+        seed = self.seed if seed is None else seed
+        key = (name, int(size), seed)
+        with self._lock:
+            if key in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            self.misses += 1
+        # Built outside the lock so large datasets do not block other readers
+        data = generator(make_rng(name, seed), int(size))
+        with self._lock:
+            data = self._cache.setdefault(key, data)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+        return data
+
+    def stats(self):
+        """(hits, misses) since the service was created"""
+        return self.hits, self.misses
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,282 @@
+"""
+Memory-mapped model artifacts shared by every worker process.
+Trained models are published as one joblib file per model version; workers
+load it with mmap_mode='r', so all processes on a host map the same physical
+pages read-only instead of each holding a private copy. scikit-learn trees
+copy their nodes into private memory when unpickled, so the forests are
+stored as FlatForest node arrays, which stay memory-mapped.
+
+Reload protocol: the CURRENT file in the artifact directory names the active
+artifact and is replaced atomically by publish(). Every ModelHandle re-reads
+it at most every check_interval seconds and swaps in the new models on
+change; callers that already hold the previous models finish with them.
+Workers only train a model when nothing has been published yet, under a
+lock file so concurrent workers train once; a new version (for example after
+disease.csv changed) is published explicitly:
+
+    python -m portal.model_store publish [--csv disease.csv]   # train and publish
+    python -m portal.model_store status
+"""
+
+import argparse
+import fcntl
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+from portal.telemetry import set_info
+
+MODELS_DIR = Path(__file__).resolve().parent.parent / "models"
+CURRENT = "CURRENT"
+PUBLISH_LOCK = ".publish.lock"
+CHECK_INTERVAL = 5  # seconds between checks for a newly published version
+KEEP_VERSIONS = 3
+FOREST_KEYS = ('disease_model', 'risk_model')
+
+
+class FlatForest:
+    """Read-only random forest classifier over flat node arrays
+
+    The nodes of all trees are concatenated into shared arrays (children,
+    split feature, threshold and class fractions), with child indices made
+    global. predict_proba accumulates the trees in order exactly like
+    RandomForestClassifier, so predictions are identical.
+    """
+
+    def __init__(self, roots, left, right, feature, threshold, value, classes, feature_importances):
+        self.roots = roots
+        self.left = left
+        self.right = right
+        self.feature = feature
+        self.threshold = threshold
+        self.value = value
+        self.classes_ = classes
+        self.feature_importances_ = feature_importances
+
+    @classmethod
+    def from_sklearn(cls, forest):
+        roots, lefts, rights, features, thresholds, values = [], [], [], [], [], []
+        offset = 0
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            left, right = tree.children_left.astype(np.int64), tree.children_right.astype(np.int64)
+            internal = left >= 0
+            left[internal] += offset
+            right[internal] += offset
+            roots.append(offset)
+            lefts.append(left)
+            rights.append(right)
+            features.append(tree.feature.astype(np.int64))
+            thresholds.append(tree.threshold)
+            value = tree.value[:, 0, :]
+            values.append(value / value.sum(axis=1, keepdims=True))  # scikit-learn < 1.4 stores weighted counts
+            offset += tree.node_count
+        return cls(
+            roots=np.array(roots, dtype=np.int64),
+            left=np.concatenate(lefts),
+            right=np.concatenate(rights),
+            feature=np.concatenate(features),
+            threshold=np.concatenate(thresholds),
+            value=np.ascontiguousarray(np.concatenate(values)),
+            classes=np.asarray(forest.classes_),
+            feature_importances=np.asarray(forest.feature_importances_),
+        )
+
+    @property
+    def n_estimators(self):
+        return len(self.roots)
+
+    def apply(self, X):
+        """Leaf index of every sample in every tree, shape (n_samples, n_estimators)"""
+        X = np.ascontiguousarray(X, dtype=np.float32)  # trees split on float32 features, like scikit-learn
+        n_samples, n_features = X.shape
+        nodes = np.tile(self.roots, n_samples)
+        # Flat offset of each (sample, tree) pair's sample row in X; pairs drop out on reaching a leaf
+        row_offsets = np.repeat(np.arange(n_samples, dtype=np.int64) * n_features, self.n_estimators)
+        active = np.arange(len(nodes))
+        flat_X = X.ravel()
+        while active.size:
+            current = nodes[active]
+            left = self.left[current]
+            internal = left >= 0
+            active, current, left = active[internal], current[internal], left[internal]
+            go_left = flat_X[row_offsets[active] + self.feature[current]] <= self.threshold[current]
+            nodes[active] = np.where(go_left, left, self.right[current])
+        return nodes.reshape(n_samples, self.n_estimators)
+
+    def predict_proba(self, X):
+        leaves = self.apply(X)
+        proba = np.zeros((len(leaves), self.value.shape[1]))
+        for tree in range(self.n_estimators):
+            proba += self.value[leaves[:, tree]]
+        proba /= self.n_estimators
+        return proba
+
+    def predict(self, X):
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
+
+
+def _write_atomic(path, write):
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def publish(ml_models, directory=MODELS_DIR, keep=KEEP_VERSIONS):
+    """Write the models as a memory-mappable artifact and make it current; returns its path"""
+    import joblib
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    artifact = dict(ml_models)
+    for key in FOREST_KEYS:
+        if not isinstance(artifact[key], FlatForest):
+            artifact[key] = FlatForest.from_sklearn(artifact[key])
+    path = directory / f"model-{artifact['version']}.joblib"
+    _write_atomic(path, lambda f: joblib.dump(artifact, f))
+    _write_atomic(directory / CURRENT, lambda f: f.write(path.name.encode()))
+    prune(directory, keep)
+    return path
+
+
+@contextmanager
+def publish_lock(directory=MODELS_DIR):
+    """Exclusive lock of an artifact directory across processes, held while training and publishing"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / PUBLISH_LOCK, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def current_artifact(directory=MODELS_DIR):
+    """Path of the active artifact, or None before the first publish"""
+    try:
+        name = (Path(directory) / CURRENT).read_text().strip()
+    except FileNotFoundError:
+        return None
+    return Path(directory) / name if name else None
+
+
+def prune(directory=MODELS_DIR, keep=KEEP_VERSIONS):
+    """Delete all but the newest `keep` artifacts, never the current one
+
+    Workers still mapping a deleted file keep reading it until they reload.
+    """
+    current = current_artifact(directory)
+    artifacts = sorted(Path(directory).glob("model-*.joblib"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for path in artifacts[keep:]:
+        if path != current:
+            path.unlink(missing_ok=True)
+
+
+def load_artifact(path):
+    """Models from an artifact, with every array memory-mapped read-only"""
+    import joblib
+
+    ml_models = joblib.load(path, mmap_mode='r')
+    set_info("model", version=ml_models['version'], trained_at=ml_models['trained_at'],
+             training_seconds=ml_models['training_seconds'], samples=len(ml_models['dataset']))
+    return ml_models
+
+
+class ModelHandle:
+    """The current models of an artifact directory, reloaded when a new version is published"""
+
+    def __init__(self, directory=MODELS_DIR, check_interval=CHECK_INTERVAL):
+        self.directory = Path(directory)
+        self.check_interval = check_interval
+        self.error = None
+        self._lock = threading.Lock()
+        self._models = None
+        self._path = None
+        self._checked = 0.0
+
+    def ensure(self, train):
+        """Publish train()'s models when no artifact has been published yet, then load the current one
+
+        An existing artifact is never replaced, so a version an operator
+        published stays current across worker restarts. Training errors are
+        kept and reported by get().
+        """
+        with self._lock:
+            if current_artifact(self.directory) is None:
+                with publish_lock(self.directory):
+                    # Another worker may have published while this one waited for the lock
+                    if current_artifact(self.directory) is None:
+                        ml_models = train()
+                        if 'error' in ml_models:
+                            self.error = ml_models['error']
+                            return
+                        publish(ml_models, self.directory)
+        self.reload()
+
+    def reload(self):
+        """Load the current artifact if it changed; returns True when new models were swapped in"""
+        with self._lock:
+            self._checked = time.monotonic()
+            path = current_artifact(self.directory)
+            if path is None or path == self._path:
+                return False
+            self._models = load_artifact(path)
+            self._path = path
+            self.error = None
+            return True
+
+    def get(self):
+        """Current models, or {'error': ...} when none could be loaded"""
+        if time.monotonic() - self._checked >= self.check_interval:
+            try:
+                self.reload()
+            except Exception as e:
+                # A broken or incompatible artifact: keep serving the loaded version
+                if self._models is None:
+                    self.error = f"Model artifact could not be loaded: {e}"
+        if self._models is None:
+            return {'error': self.error or f"No model artifact published in {self.directory}"}
+        return self._models
+
+    @property
+    def version(self):
+        return self._models['version'] if self._models is not None else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Publish and inspect memory-mapped model artifacts")
+    parser.add_argument('command', choices=['publish', 'status'])
+    parser.add_argument('--dir', default=str(MODELS_DIR), help='artifact directory')
+    parser.add_argument('--csv', default=None, help='training data (default: disease.csv)')
+    args = parser.parse_args(argv)
+
+    if args.command == 'publish':
+        # Through the package module, so pickled FlatForests refer to portal.model_store, not __main__
+        from portal import model_store
+        from portal.ml import DISEASE_CSV, load_and_train_ml_model
+        with model_store.publish_lock(args.dir):
+            ml_models = load_and_train_ml_model(args.csv or DISEASE_CSV)
+            if 'error' in ml_models:
+                parser.exit(1, f"Training failed: {ml_models['error']}\n")
+            path = model_store.publish(ml_models, args.dir)
+        print(f"Published {path} ({path.stat().st_size / 1e6:.1f} MB); workers pick it up within {CHECK_INTERVAL}s")
+    else:
+        path = current_artifact(args.dir)
+        print(f"Current artifact: {path or 'none'}")
+        for artifact in sorted(Path(args.dir).glob("model-*.joblib")):
+            print(f"  {artifact.name}  {artifact.stat().st_size / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Page registry.
+Each page lives in its own module, imported the first time it is visited, so
+a rerun only loads and executes the page that is actually shown.
+"""
+
+import importlib
+from functools import lru_cache
+
+from portal.i18n import LANGUAGES
+from portal.telemetry import register_cache
+
+# (text key, module, page function) in sidebar order
+PAGES = [
+    ('home', 'home', 'home_page'),
+    ('risk_assessment', 'risk_assessment', 'risk_assessment_page'),
+    ('ml_predictor', 'ml_predictor', 'ml_predictor_page'),
+    ('emergency_response', 'emergency_response', 'emergency_response_page'),
+    ('smart_analytics', 'smart_analytics', 'smart_analytics_page'),
+    ('training', 'training_modules', 'training_modules_page'),
+    ('compliance', 'compliance_tracking', 'compliance_tracking_page'),
+    ('alerts', 'alerts', 'alerts_notifications_page'),
+    ('monitoring', 'monitoring', 'monitoring_dashboard_page'),
+    ('protection_hub', 'protection_hub', 'protection_hub_page'),
+    ('networking', 'farmer_network', 'farmer_network_page'),
+    ('data_export', 'data_export', 'data_export_page'),
+    ('performance_review', 'performance_review', 'performance_review_page'),
+]
+PAGE_KEYS = [key for key, _, _ in PAGES]
+_PAGE_TARGETS = {key: (module, function) for key, module, function in PAGES}
+
+
+@lru_cache(maxsize=None)
+def page_labels(language):
+    """Sidebar label of every page in one language"""
+    texts = LANGUAGES.get(language, LANGUAGES["English"])
+    return {key: texts.get(key, key) for key in PAGE_KEYS}
+
+
+register_cache("page_labels", lambda: page_labels.cache_info()[:2])
+
+
+def render_page(key):
+    """Import the page module on first use and render it; unknown keys fall back to home"""
+    module_name, function_name = _PAGE_TARGETS.get(key, _PAGE_TARGETS['home'])
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    getattr(module, function_name)()
@@ -0,0 +1,135 @@
+"""
+Alerts and notifications page.
+"""
+
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from portal.i18n import get_text
+from portal.storage import load_data, save_data
+
+
+def alerts_notifications_page():
+    """Alerts and notifications page"""
+    st.title("🚨 " + get_text("alerts"))
+    st.markdown("Real-time alerts and disease outbreak notifications")
+    
+    # Load user preferences
+    alert_prefs = load_data("alert_preferences.json")
+    user_id = st.text_input("User ID", value="farmer_001")
+    
+    if user_id not in alert_prefs:
+        alert_prefs[user_id] = {
+            'subscribed': False,
+            'alert_types': [],
+            'location': '',
+            'contact_method': 'email'
+        }
+    
+    user_prefs = alert_prefs[user_id]
+    
+    # Alert subscription
+    st.markdown("### Alert Subscription Settings")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        subscribed = st.checkbox("Subscribe to Alerts", value=user_prefs['subscribed'])
+        location = st.text_input("Your Location/District", value=user_prefs['location'])
+        
+    with col2:
+        contact_method = st.selectbox(
+            "Preferred Contact Method",
+            ["Email", "SMS", "App Notification"],
+            index=["email", "sms", "app"].index(user_prefs['contact_method'].lower()) if user_prefs['contact_method'].lower() in ["email", "sms", "app"] else 0
+        )
+    
+    # Alert types
+    st.markdown("#### Alert Types")
+    alert_types = st.multiselect(
+        "Select alert types to receive",
+        ["Disease Outbreaks", "Weather Warnings", "Market Prices", "Regulatory Updates", "Training Reminders"],
+        default=user_prefs['alert_types']
+    )
+    
+    if st.button("Save Preferences"):
+        user_prefs.update({
+            'subscribed': subscribed,
+            'alert_types': alert_types,
+            'location': location,
+            'contact_method': contact_method.lower(),
+            'last_updated': datetime.now().isoformat()
+        })
+        alert_prefs[user_id] = user_prefs
+        save_data("alert_preferences.json", alert_prefs)
+        st.success("Preferences saved successfully!")
+    
+    # Current alerts
+    st.markdown("### Current Alerts")
+    
+    # Simulated alerts
+    alerts = [
+        {
+            'id': 1,
+            'type': 'Disease Outbreak',
+            'severity': 'High',
+            'title': 'Avian Flu Outbreak Reported',
+            'description': 'H5N1 Avian Influenza detected in poultry farms in neighboring district. Implement immediate biosecurity measures.',
+            'date': (datetime.now() - timedelta(hours=2)).strftime('%Y-%m-%d %H:%M'),
+            'location': 'District XYZ (50 km away)',
+            'actions': ['Restrict farm access', 'Increase disinfection frequency', 'Monitor bird health closely']
+        },
+        {
+            'id': 2,
+            'type': 'Weather Warning',
+            'severity': 'Medium',
+            'title': 'Heavy Rainfall Expected',
+            'description': 'Monsoon rainfall predicted for next 3 days. Ensure proper drainage and feed storage.',
+            'date': (datetime.now() - timedelta(hours=6)).strftime('%Y-%m-%d %H:%M'),
+            'location': 'Regional Weather Center',
+            'actions': ['Check drainage systems', 'Secure feed storage', 'Prepare backup power']
+        },
+        {
+            'id': 3,
+            'type': 'Regulatory Update',
+            'severity': 'Low',
+            'title': 'New Vaccination Guidelines',
+            'description': 'Updated vaccination schedule released by Animal Husbandry Department.',
+            'date': (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d %H:%M'),
+            'location': 'State Animal Husbandry Dept',
+            'actions': ['Review new guidelines', 'Update vaccination records', 'Consult veterinarian']
+        }
+    ]
+    
+    for alert in alerts:
+        severity_color = {
+            'High': 'red',
+            'Medium': 'orange',
+            'Low': 'blue'
+        }
+        
+        with st.container():
+            st.markdown(f"#### :{severity_color[alert['severity']]}[{alert['severity']} Alert] {alert['title']}")
+            
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                st.write(f"**Type:** {alert['type']}")
+                st.write(f"**Description:** {alert['description']}")
+                st.write(f"**Location:** {alert['location']}")
+                st.write(f"**Date:** {alert['date']}")
+                
+                with st.expander("Recommended Actions"):
+                    for action in alert['actions']:
+                        st.write(f"• {action}")
+            
+            with col2:
+                if alert['severity'] == 'High':
+                    st.error("🚨 Immediate Action Required")
+                elif alert['severity'] == 'Medium':
+                    st.warning("⚠️ Monitor Closely")
+                else:
+                    st.info("ℹ️ For Your Information")
+            
+            st.markdown("---")
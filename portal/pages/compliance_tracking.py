@@ -0,0 +1,144 @@
+"""
+Compliance tracking page.
+"""
+
+from datetime import datetime
+
+import streamlit as st
+
+from portal.compliance import COMPLIANCE_ITEMS
+from portal.i18n import get_text
+from portal.resources import (
+    get_compliance_matrix,
+    set_compliance_status,
+    get_document_processor,
+    store_compliance_document,
+)
+from portal.storage import load_data
+
+
+def compliance_tracking_page():
+    """Compliance tracking page"""
+    st.title("📋 " + get_text("compliance"))
+    st.markdown("Track regulatory compliance and upload required documents")
+    
+    # Load compliance data
+    compliance_data = load_data("compliance_records.json")
+    
+    farm_id = st.text_input("Farm ID", value="farm_001")
+    
+    if farm_id not in compliance_data:
+        compliance_data[farm_id] = {
+            'documents': {},
+            'checklist': {},
+            'last_updated': datetime.now().isoformat()
+        }
+    
+    farm_compliance = compliance_data[farm_id]
+    compliance_matrix = get_compliance_matrix()
+    
+    # Compliance checklist
+    st.markdown("### Compliance Checklist")
+    
+    checklist_items = COMPLIANCE_ITEMS
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        farm_statuses = compliance_matrix.farm_statuses(farm_id)
+        for item in checklist_items:
+            status = farm_statuses[item['id']]
+            required_text = " (Required)" if item['required'] else " (Optional)"
+            
+            if status == 'Verified':
+                st.success(f"✅ {item['title']}{required_text}")
+            elif status == 'Submitted':
+                st.warning(f"⏳ {item['title']}{required_text} - Under Review")
+            else:
+                st.error(f"❌ {item['title']}{required_text} - Pending")
+    
+    with col2:
+        st.markdown("#### Status Summary")
+        summary = compliance_matrix.farm_summary(farm_id)
+        total_items = summary['total']
+        verified_items = summary['verified']
+        submitted_items = summary['submitted']
+        
+        st.metric("Verified", f"{verified_items}/{total_items}")
+        st.metric("Under Review", submitted_items)
+        st.metric("Completion Rate", f"{(verified_items/total_items)*100:.1f}%")
+    
+    # Document upload
+    st.markdown("### Document Upload")
+    
+    selected_doc = st.selectbox(
+        "Select Document Type",
+        options=[item['title'] for item in checklist_items]
+    )
+    
+    uploaded_file = st.file_uploader(
+        f"Upload {selected_doc}",
+        type=['pdf', 'jpg', 'jpeg', 'png', 'doc', 'docx'],
+        help="Supported formats: PDF, JPG, PNG, DOC, DOCX"
+    )
+    
+    # The uploader keeps its file across reruns, so only store each upload once
+    processed_uploads = st.session_state.setdefault('processed_uploads', set())
+    if uploaded_file is not None and (farm_id, selected_doc, uploaded_file.file_id) not in processed_uploads:
+        processed_uploads.add((farm_id, selected_doc, uploaded_file.file_id))
+        doc_id = next(item['id'] for item in checklist_items if item['title'] == selected_doc)
+        store_compliance_document(farm_id, doc_id, uploaded_file)
+        
+        st.success(f"✅ {selected_doc} uploaded successfully!")
+        st.rerun()
+    
+    # Admin verification section
+    if st.session_state.admin_logged_in:
+        st.markdown("---")
+        st.markdown("### Admin: Document Verification")
+        
+        farm_documents = farm_compliance.get('documents', {})
+        document_processor = get_document_processor()
+        for item in checklist_items:
+            if item['id'] in farm_documents:
+                doc_info = farm_documents[item['id']]
+                current_status = farm_statuses[item['id']]
+                
+                col1, col2, col3 = st.columns([2, 1, 1])
+                
+                with col1:
+                    st.write(f"**{item['title']}** - {doc_info['filename']}")
+                    st.write(f"Uploaded: {doc_info['upload_date'][:10]}")
+                    
+                    # Show the cached processing result instead of opening the original file
+                    digest = doc_info.get('content_hash')
+                    processed = document_processor.result(digest) if digest else None
+                    if processed is None:
+                        if digest:
+                            document_processor.submit(digest, doc_info['filename'])
+                        st.caption("⏳ Processing document...")
+                    else:
+                        if document_processor.thumbnail_path(digest).exists():
+                            st.image(str(document_processor.thumbnail_path(digest)))
+                        details = [f"Type: {(processed['detected_type'] or 'unknown').upper()}"]
+                        if processed['size'] is not None:
+                            details.append(f"{processed['size'] / 1024:.1f} KB")
+                        if 'page_count' in processed:
+                            details.append(f"{processed['page_count']} pages")
+                        if 'width' in processed:
+                            details.append(f"{processed['width']}×{processed['height']} px")
+                        st.caption(" · ".join(details))
+                        if 'error' in processed and processed['size'] is None:
+                            st.warning("⚠️ Stored file could not be read")
+                        elif not processed['valid']:
+                            st.warning("⚠️ File content does not match its type")
+                
+                with col2:
+                    if st.button(f"Verify", key=f"verify_{item['id']}"):
+                        set_compliance_status(farm_id, item['id'], 'Verified')
+                        st.rerun()
+                
+                with col3:
+                    if st.button(f"Reject", key=f"reject_{item['id']}"):
+                        set_compliance_status(farm_id, item['id'], 'Pending')
+                        st.rerun()
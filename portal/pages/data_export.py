@@ -0,0 +1,247 @@
+"""
+Data export and admin page.
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from portal.i18n import get_text
+from portal.resources import get_risk_rollups, get_training_rollups, get_compliance_matrix
+from portal.storage import load_data
+from portal.telemetry import TIMINGS
+
+
+def data_export_page():
+    """Data export and admin page"""
+    st.title("📥 " + get_text("data_export"))
+    st.markdown("Export farm data for policy analysis and administrative functions")
+    
+    # Admin login
+    if not st.session_state.admin_logged_in:
+        st.markdown("### Admin Login")
+        password = st.text_input("Enter admin password", type="password")
+        
+        if st.button("Login"):
+            if password == "admin123":  # Simple password for demo
+                st.session_state.admin_logged_in = True
+                st.success("Admin login successful!")
+                st.rerun()
+            else:
+                st.error("Invalid password")
+        
+        st.markdown("---")
+        st.markdown("### Public Data Export")
+        st.markdown("*Limited data export available without admin access*")
+        
+        # Basic export for farmers
+        if st.button("Export My Training Progress"):
+            training_data = load_data("training_progress.json")
+            if training_data:
+                csv = records_csv(training_data)
+                st.download_button(
+                    label="Download Training Data CSV",
+                    data=csv,
+                    file_name=f"training_progress_{datetime.now().strftime('%Y%m%d')}.csv",
+                    mime="text/csv"
+                )
+            else:
+                st.info("No training data available")
+        
+        return
+    
+    # Admin functions
+    st.success("🔐 Admin access granted")
+    
+    # Load all data
+    risk_data = load_data("risk_assessments.json")
+    training_data = load_data("training_progress.json")
+    training_rollups = get_training_rollups()
+    compliance_matrix = get_compliance_matrix()
+    farmers_data = load_data("farmers_directory.json")
+    alert_prefs = load_data("alert_preferences.json")
+    
+    # Admin dashboard
+    st.markdown("### Administrative Dashboard")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total Risk Assessments", len(risk_data))
+    
+    with col2:
+        st.metric("Registered Farmers", len(farmers_data))
+    
+    with col3:
+        st.metric("Completed Training", training_rollups.fully_completed)
+    
+    with col4:
+        st.metric("Verified Compliance", compliance_matrix.farms_with_verified())
+    
+    # Export options
+    st.markdown("### Data Export Options")
+    
+    export_tab1, export_tab2, export_tab3 = st.tabs(["Individual Datasets", "Aggregated Reports", "System Analytics"])
+    
+    with export_tab1:
+        st.markdown("#### Individual Dataset Export")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            if st.button("Export Risk Assessments"):
+                if risk_data:
+                    csv = records_csv(risk_data)
+                    st.download_button(
+                        label="Download Risk Assessment Data",
+                        data=csv,
+                        file_name=f"risk_assessments_{datetime.now().strftime('%Y%m%d')}.csv",
+                        mime="text/csv"
+                    )
+                else:
+                    st.info("No risk assessment data available")
+            
+            if st.button("Export Training Data"):
+                if training_data:
+                    csv = records_csv(training_data)
+                    st.download_button(
+                        label="Download Training Data",
+                        data=csv,
+                        file_name=f"training_data_{datetime.now().strftime('%Y%m%d')}.csv",
+                        mime="text/csv"
+                    )
+                else:
+                    st.info("No training data available")
+        
+        with col2:
+            if st.button("Export Compliance Data"):
+                if len(compliance_matrix):
+                    csv = compliance_csv(compliance_matrix)
+                    st.download_button(
+                        label="Download Compliance Data",
+                        data=csv,
+                        file_name=f"compliance_data_{datetime.now().strftime('%Y%m%d')}.csv",
+                        mime="text/csv"
+                    )
+                else:
+                    st.info("No compliance data available")
+            
+            if st.button("Export Farmers Directory"):
+                if farmers_data:
+                    csv = records_csv(farmers_data)
+                    st.download_button(
+                        label="Download Farmers Directory",
+                        data=csv,
+                        file_name=f"farmers_directory_{datetime.now().strftime('%Y%m%d')}.csv",
+                        mime="text/csv"
+                    )
+                else:
+                    st.info("No farmers directory data available")
+    
+    with export_tab2:
+        st.markdown("#### Aggregated Reports")
+        
+        # Generate summary report
+        if st.button("Generate Summary Report"):
+            risk_rollups = get_risk_rollups()
+            report_data = {
+                'report_date': datetime.now().isoformat(),
+                'total_farms': len(risk_data),
+                'total_farmers': len(farmers_data),
+                'total_training_users': len(training_rollups),
+                'total_compliance_records': len(compliance_matrix),
+                'avg_risk_score': risk_rollups.mean_score(),
+                'avg_training_completion': training_rollups.average_completion(),
+                'high_risk_farms': risk_rollups.risk_level_counts().get('High', 0),
+                'completed_training_users': training_rollups.fully_completed,
+                'verified_compliance_farms': compliance_matrix.farms_with_verified()
+            }
+            
+            report_df = pd.DataFrame([report_data])
+            csv = report_df.to_csv(index=False)
+            st.download_button(
+                label="Download Summary Report",
+                data=csv,
+                file_name=f"summary_report_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv"
+            )
+            
+            # Display summary
+            st.markdown("#### Report Summary")
+            st.json(report_data)
+    
+    with export_tab3:
+        st.markdown("#### System Analytics")
+        
+        # System usage analytics
+        total_records = len(risk_data) + len(training_rollups) + len(compliance_matrix) + len(farmers_data)
+        rerun_p95 = TIMINGS.percentile("rerun", 95)
+        
+        analytics_data = {
+            'total_system_records': total_records,
+            'risk_assessments_percentage': (len(risk_data) / total_records * 100) if total_records > 0 else 0,
+            'training_records_percentage': (len(training_rollups) / total_records * 100) if total_records > 0 else 0,
+            'compliance_records_percentage': (len(compliance_matrix) / total_records * 100) if total_records > 0 else 0,
+            'farmer_registrations_percentage': (len(farmers_data) / total_records * 100) if total_records > 0 else 0,
+            'rerun_p95_ms': round(rerun_p95 * 1000, 1) if rerun_p95 is not None else None,
+            'last_backup': datetime.now().isoformat()
+        }
+        
+        st.json(analytics_data)
+        
+        if st.button("Export System Analytics"):
+            analytics_df = pd.DataFrame([analytics_data])
+            csv = analytics_df.to_csv(index=False)
+            st.download_button(
+                label="Download System Analytics",
+                data=csv,
+                file_name=f"system_analytics_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv"
+            )
+        
+        diagnostics_panel()
+    
+    # Logout
+    st.markdown("---")
+    if st.button("Logout Admin"):
+        st.session_state.admin_logged_in = False
+        st.rerun()
+
+
+def records_csv(records):
+    """CSV export of a {record_id: record} collection, one row per record"""
+    return pd.DataFrame.from_dict(records, orient='index').to_csv(index=True)
+
+
+def compliance_csv(compliance_matrix):
+    """CSV export of the compliance status matrix, flattened to one row per farm and item"""
+    return pd.DataFrame(compliance_matrix.export_rows()).to_csv(index=False)
+
+
+def diagnostics_panel():
+    """Admin view of the timing spans, with an opt-in cProfile capture of one rerun"""
+    st.markdown("#### 🩺 Diagnostics")
+    st.caption("Durations of the instrumented sections in this process; percentiles cover the last 1024 runs of each span.")
+    
+    # Resetting only moves this session's baseline; the exported spans keep counting
+    timings = TIMINGS.summary(since=st.session_state.get('timings_mark'))
+    if timings:
+        st.dataframe(pd.DataFrame(timings).set_index('span').round(2), use_container_width=True)
+    else:
+        st.info("No timings recorded yet.")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("Profile Next Rerun"):
+            st.session_state.profile_next_rerun = True
+            st.info("The next page render will be profiled. Open the page to inspect, then come back here.")
+    with col2:
+        if st.button("Reset Timings"):
+            st.session_state.timings_mark = TIMINGS.mark()
+            st.rerun()
+    
+    last_profile = st.session_state.get('last_profile')
+    if last_profile:
+        with st.expander(f"cProfile: {last_profile['page']} at {last_profile['captured']}"):
+            st.code(last_profile['report'])
@@ -0,0 +1,76 @@
+"""
+Emergency Response page.
+"""
+
+import pandas as pd
+import streamlit as st
+
+
+def emergency_response_page():
+    """Emergency Response page"""
+    st.title("🚨 Emergency Response Center")
+    st.markdown("Rapid response protocols and emergency management")
+    
+    col1, col2 = st.columns([2,1])
+    
+    with col1:
+        st.markdown("### 🆘 Active Emergencies")
+        
+        # Mock emergency data
+        emergencies = pd.DataFrame({
+            'incident_id': ['EMG-001', 'EMG-002', 'EMG-003'],
+            'type': ['Disease Outbreak', 'Fire Hazard', 'Equipment Failure'],
+            'severity': ['High', 'Critical', 'Medium'],
+            'location': ['Farm A - Pen 3', 'Farm B - Storage', 'Farm A - Pen 1'],
+            'time': ['2 hours ago', '30 minutes ago', '1 day ago'],
+            'status': ['In Progress', 'Responding', 'Resolved']
+        })
+        
+        for _, emergency in emergencies.iterrows():
+            emergency_card(emergency)
+    
+    with col2:
+        st.markdown("### 📞 Quick Actions")
+        
+        if st.button("🚨 Report New Emergency", use_container_width=True):
+            st.error("Emergency reporting system activated!")
+        
+        if st.button("🏥 Contact Veterinarian", use_container_width=True):
+            st.info("Connecting to emergency veterinary services...")
+        
+        if st.button("🔥 Fire Department", use_container_width=True):
+            st.info("Contacting fire department...")
+        
+        if st.button("📋 View Protocols", use_container_width=True):
+            st.info("Loading emergency protocols...")
+        
+        st.markdown("### 📊 Response Stats")
+        st.metric("Response Time (Avg)", "12 minutes")
+        st.metric("Active Incidents", "2")
+        st.metric("Resolved Today", "5")
+
+
+@st.fragment
+def emergency_card(emergency):
+    """One incident with its actions; the buttons rerun only this card"""
+    severity_color = {"Critical": "🔴", "High": "🟠", "Medium": "🟡", "Low": "🟢"}
+    color = severity_color.get(emergency['severity'], "⚪")
+    
+    st.markdown(f"""
+    **{color} {emergency['incident_id']} - {emergency['type']}**
+    - Location: {emergency['location']}
+    - Severity: {emergency['severity']}
+    - Status: {emergency['status']}
+    - Time: {emergency['time']}
+    """)
+    
+    col_a, col_b = st.columns(2)
+    with col_a:
+        if st.button(f"View Details - {emergency['incident_id']}", key=f"view_{emergency['incident_id']}"):
+            st.info(f"Viewing details for {emergency['incident_id']}")
+    with col_b:
+        if emergency['status'] != 'Resolved':
+            if st.button(f"Mark Resolved - {emergency['incident_id']}", key=f"resolve_{emergency['incident_id']}"):
+                st.success(f"Marked {emergency['incident_id']} as resolved")
+    
+    st.markdown("---")
@@ -0,0 +1,145 @@
+"""
+Farmer networking page.
+"""
+
+from datetime import datetime
+
+import streamlit as st
+
+from portal.i18n import get_text
+from portal.storage import load_data, save_data
+
+
+def farmer_network_page():
+    """Farmer networking page"""
+    st.title("👥 " + get_text("networking"))
+    st.markdown("Connect with other farmers in your region")
+    
+    # Load farmers directory
+    farmers_data = load_data("farmers_directory.json")
+    
+    # Registration form
+    st.markdown("### Register Your Farm")
+    
+    with st.form("farmer_registration"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            farmer_name = st.text_input("Farmer Name")
+            farm_name = st.text_input("Farm Name")
+            location = st.text_input("Location/District")
+            
+        with col2:
+            contact_phone = st.text_input("Phone Number")
+            contact_email = st.text_input("Email Address")
+            farm_type = st.selectbox("Farm Type", ["Pig Farm", "Poultry Farm", "Mixed Farm"])
+        
+        farm_size = st.selectbox("Farm Size", ["Small (< 100 animals)", "Medium (100-500 animals)", "Large (> 500 animals)"])
+        
+        specializations = st.multiselect(
+            "Specializations/Interests",
+            ["Breeding", "Organic Farming", "Feed Production", "Disease Management", "Waste Management", "Technology Integration"]
+        )
+        
+        additional_info = st.text_area("Additional Information (Optional)", placeholder="Any additional information you'd like to share...")
+        
+        submitted = st.form_submit_button("Register")
+        
+        if submitted and farmer_name and farm_name and location:
+            farmer_id = f"farmer_{len(farmers_data) + 1:03d}"
+            
+            farmers_data[farmer_id] = {
+                'farmer_name': farmer_name,
+                'farm_name': farm_name,
+                'location': location,
+                'contact_phone': contact_phone,
+                'contact_email': contact_email,
+                'farm_type': farm_type,
+                'farm_size': farm_size,
+                'specializations': specializations,
+                'additional_info': additional_info,
+                'registration_date': datetime.now().isoformat(),
+                'verified': False
+            }
+            
+            save_data("farmers_directory.json", farmers_data)
+            st.success(f"Registration successful! Your Farmer ID is: {farmer_id}")
+            st.rerun()
+    
+    # Search and filter
+    st.markdown("### Farmer Directory")
+    
+    if farmers_data:
+        farmer_directory(farmers_data)
+    else:
+        st.info("No farmers registered yet. Be the first to register!")
+
+
+@st.fragment
+def farmer_directory(farmers_data):
+    """Filters, search and results; typing a search reruns only this fragment"""
+    # Filters
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        location_filter = st.selectbox(
+            "Filter by Location",
+            ["All"] + list(set(farmer['location'] for farmer in farmers_data.values()))
+        )
+    
+    with col2:
+        farm_type_filter = st.selectbox(
+            "Filter by Farm Type",
+            ["All"] + list(set(farmer['farm_type'] for farmer in farmers_data.values()))
+        )
+    
+    with col3:
+        search_term = st.text_input("Search by name or specialization")
+    
+    # Apply filters
+    filtered_farmers = filter_farmers(farmers_data, location_filter, farm_type_filter, search_term)
+    
+    # Display farmers
+    st.markdown(f"**{len(filtered_farmers)} farmers found**")
+    
+    for farmer_id, farmer in filtered_farmers.items():
+        with st.container():
+            col1, col2, col3 = st.columns([2, 1, 1])
+            
+            with col1:
+                verified_badge = " ✅" if farmer.get('verified', False) else ""
+                st.markdown(f"#### {farmer['farmer_name']}{verified_badge}")
+                st.write(f"**Farm:** {farmer['farm_name']}")
+                st.write(f"**Location:** {farmer['location']}")
+                st.write(f"**Type:** {farmer['farm_type']} ({farmer['farm_size']})")
+                
+                if farmer['specializations']:
+                    st.write(f"**Specializations:** {', '.join(farmer['specializations'])}")
+            
+            with col2:
+                if farmer['contact_phone']:
+                    st.write(f"📞 {farmer['contact_phone']}")
+                if farmer['contact_email']:
+                    st.write(f"📧 {farmer['contact_email']}")
+            
+            with col3:
+                if st.button(f"View Profile", key=f"profile_{farmer_id}"):
+                    st.info(f"**Registration Date:** {farmer['registration_date'][:10]}")
+                    if farmer['additional_info']:
+                        st.write(f"**Additional Info:** {farmer['additional_info']}")
+            
+            st.markdown("---")
+
+
+def filter_farmers(farmers_data, location="All", farm_type="All", search_term=""):
+    """Farmers matching the location and farm type filters and the name/specialization search"""
+    search_term = search_term.lower()
+    return {
+        k: v for k, v in farmers_data.items()
+        if (location == "All" or v['location'] == location) and
+           (farm_type == "All" or v['farm_type'] == farm_type) and
+           (not search_term or
+            search_term in v['farmer_name'].lower() or
+            search_term in v['farm_name'].lower() or
+            any(search_term in spec.lower() for spec in v['specializations']))
+    }
@@ -0,0 +1,74 @@
+"""
+Home dashboard page.
+"""
+
+import streamlit as st
+
+from portal.i18n import get_text
+from portal.resources import get_training_rollups, get_compliance_matrix
+from portal.storage import load_data
+from portal.theme import THEMES
+
+
+def home_page():
+    """Home dashboard page"""
+    st.title(get_text("app_title"))
+    st.markdown(f"## {get_text('welcome')} 👋")
+    st.markdown(f"### {get_text('description')}")
+    
+    # Theme-aware welcome message
+    theme_icon = "🌙" if st.session_state.theme_mode == "Dark" else "☀️"
+    st.markdown(f"""
+    <div style="
+        background: linear-gradient(135deg, {THEMES[st.session_state.theme_mode]['accent_color']} 0%, {THEMES[st.session_state.theme_mode]['secondary_bg']} 100%);
+        padding: 1rem;
+        border-radius: 12px;
+        text-align: center;
+        color: white;
+        margin: 1rem 0;
+    ">
+        <h4>{theme_icon} Welcome to {st.session_state.theme_mode} Mode Experience!</h4>
+        <p>Enjoy the enhanced {st.session_state.theme_mode.lower()} interface designed for optimal farming management.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Quick stats
+    col1, col2, col3, col4 = st.columns(4)
+    
+    # Load existing data for stats
+    risk_data = load_data("risk_assessments.json")
+    farmers_data = load_data("farmers_directory.json")
+    
+    with col1:
+        st.metric("Total Farms", len(risk_data))
+    
+    with col2:
+        st.metric("Completed Trainings", get_training_rollups().fully_completed)
+    
+    with col3:
+        st.metric("Registered Farmers", len(farmers_data))
+    
+    with col4:
+        st.metric("Verified Compliance", get_compliance_matrix().farms_with_verified())
+    
+    # Recent activity
+    st.markdown("### Recent Activity")
+    activity_col1, activity_col2 = st.columns(2)
+    
+    with activity_col1:
+        st.markdown("#### Latest Risk Assessments")
+        if risk_data:
+            recent_assessments = sorted(risk_data.items(), 
+                                      key=lambda x: x[1].get('timestamp', ''), 
+                                      reverse=True)[:5]
+            for farm_id, data in recent_assessments:
+                risk_level = data.get('risk_level', 'Unknown')
+                st.write(f"• **{farm_id}**: {risk_level} Risk")
+        else:
+            st.write("No risk assessments yet")
+    
+    with activity_col2:
+        st.markdown("#### System Alerts")
+        st.info("🦠 Avian Flu reported in nearby district - Check prevention measures")
+        st.warning("📊 Weekly compliance report due in 3 days")
+        st.success("✅ New training module available: Waste Management")
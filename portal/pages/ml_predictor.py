@@ -0,0 +1,232 @@
+"""
+Animal Health Predictor page.
+"""
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from portal.ingest import read_recent
+from portal.resources import cached_figure, get_ml_models, get_predictor, get_timeseries_store
+from portal.telemetry import span
+
+
+def ml_predictor_page():
+    """Animal Health Predictor page with ML functionality"""
+    st.title("🐄 Animal Health Prediction System")
+    st.markdown("AI-powered disease and risk prediction for livestock using real-time sensor data")
+    
+    # Models are trained on the first visit and shared across sessions afterwards
+    with st.spinner("Loading prediction models..."):
+        with span("ml_predictor.load_models"):
+            ml_models = get_ml_models()
+    
+    # Check if ML models loaded successfully
+    if 'error' in ml_models:
+        st.error(f"❌ ML Model Loading Error: {ml_models['error']}")
+        st.markdown("Please ensure the `disease.csv` file is in the same directory as this app.")
+    else:
+        # Display model performance
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Disease Model Accuracy", f"{ml_models['accuracy']['disease']:.1%}")
+        with col2:
+            st.metric("Risk Model Accuracy", f"{ml_models['accuracy']['risk']:.1%}")
+        with col3:
+            st.metric("Training Samples", len(ml_models['dataset']))
+        st.caption(f"Model version {ml_models['version']} · trained {ml_models['trained_at']} in {ml_models['training_seconds']:.1f}s")
+        
+        st.markdown("---")
+        
+        # Create tabs for different functionalities
+        tab1, tab2, tab3, tab4 = st.tabs(["🔮 Real-Time Prediction", "📊 Dataset Analysis", "📈 Model Performance",
+                                          "📡 Sensor Feed"])
+        
+        with tab1:
+            st.markdown("### Real-Time Animal Health Prediction")
+            
+            # Create input form
+            with st.form("prediction_form"):
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown("**Animal & Location Info:**")
+                    animal_type = st.selectbox("Animal Type", 
+                                             options=list(ml_models['encoders']['Animal_Type'].classes_))
+                    farm_id = st.selectbox("Farm ID", 
+                                         options=list(ml_models['encoders']['Farm_ID'].classes_))
+                    pen_id = st.selectbox("Pen ID", 
+                                        options=list(ml_models['encoders']['Pen_ID'].classes_))
+                    age_weeks = st.number_input("Age (Weeks)", min_value=1, max_value=50, value=10)
+                    weight_kg = st.number_input("Weight (Kg)", min_value=0.1, max_value=200.0, value=25.0, step=0.1)
+                
+                with col2:
+                    st.markdown("**Environmental Sensors:**")
+                    temp_c = st.number_input("Temperature (°C)", min_value=15.0, max_value=45.0, value=30.0, step=0.1)
+                    humidity = st.number_input("Humidity (%)", min_value=30.0, max_value=100.0, value=70.0, step=0.1)
+                    ammonia_ppm = st.number_input("Ammonia (ppm)", min_value=0.0, max_value=100.0, value=25.0, step=0.1)
+                
+                submitted = st.form_submit_button("🔍 Predict Health Status", use_container_width=True)
+            
+            if submitted:
+                # Prepare sensor input
+                sensor_input = {
+                    'Animal_Type': animal_type,
+                    'Farm_ID': farm_id,
+                    'Pen_ID': pen_id,
+                    'Age_Weeks': age_weeks,
+                    'Weight_Kg': weight_kg,
+                    'Temp_C': temp_c,
+                    'Humidity_%': humidity,
+                    'Ammonia_ppm': ammonia_ppm
+                }
+                
+                # Make prediction
+                with st.spinner("Analyzing sensor data..."):
+                    result = get_predictor().predict(sensor_input)
+                
+                if result.get("success"):
+                    pred = result["predictions"]
+                    
+                    # Display results
+                    st.markdown("### 🎯 Prediction Results")
+                    
+                    # Create result columns
+                    res_col1, res_col2 = st.columns(2)
+                    
+                    with res_col1:
+                        # Disease prediction
+                        disease_color = "🔴" if pred['disease'] != 'None' else "🟢"
+                        st.markdown(f"**Disease Status:** {disease_color} **{pred['disease']}**")
+                        st.markdown(f"**Confidence:** {pred['disease_confidence']}")
+                        
+                        if pred['disease'] != 'None':
+                            st.warning(f"⚠️ Disease detected: {pred['disease']}")
+                        else:
+                            st.success("✅ No disease detected")
+                    
+                    with res_col2:
+                        # Risk prediction
+                        risk_colors = {"High": "🔴", "Medium": "🟡", "Low": "🟢"}
+                        risk_color = risk_colors.get(pred['risk_level'], "⚪")
+                        st.markdown(f"**Risk Level:** {risk_color} **{pred['risk_level']}**")
+                        st.markdown(f"**Confidence:** {pred['risk_confidence']}")
+                        
+                        if pred['risk_level'] == "High":
+                            st.error("🚨 High risk detected!")
+                        elif pred['risk_level'] == "Medium":
+                            st.warning("⚠️ Medium risk level")
+                        else:
+                            st.success("✅ Low risk level")
+                    
+                    # Recommendations
+                    st.markdown("### 💡 Recommendations")
+                    if pred['disease'] != 'None':
+                        if pred['disease'] == 'Avian Influenza':
+                            st.markdown("- 🏥 Isolate affected animals immediately")
+                            st.markdown("- 💊 Consult veterinarian for antiviral treatment")
+                            st.markdown("- 🧼 Implement strict biosecurity measures")
+                        elif pred['disease'] == 'Coccidiosis':
+                            st.markdown("- 💊 Administer anticoccidial medication")
+                            st.markdown("- 🧽 Improve pen hygiene and sanitation")
+                            st.markdown("- 💧 Ensure clean water supply")
+                        elif pred['disease'] == 'Swine Flu':
+                            st.markdown("- 🏥 Quarantine affected pigs")
+                            st.markdown("- 💉 Consider vaccination for healthy animals")
+                            st.markdown("- 🌡️ Monitor temperature closely")
+                    else:
+                        st.markdown("- ✅ Continue current management practices")
+                        st.markdown("- 📊 Monitor environmental conditions")
+                        st.markdown("- 🔄 Regular health checkups recommended")
+                
+                else:
+                    st.error(f"❌ Prediction failed: {result.get('error')}")
+        
+        with tab2, span("ml_predictor.dataset_charts"):
+            st.markdown("### 📊 Dataset Analysis")
+            dataset = ml_models['dataset']
+            
+            # Dataset overview
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Total Records", len(dataset))
+            with col2:
+                st.metric("Disease Cases", len(dataset[dataset['Disease_Observed'] != 'None']))
+            with col3:
+                st.metric("Animal Types", dataset['Animal_Type'].nunique())
+            with col4:
+                st.metric("Farms", dataset['Farm_ID'].nunique())
+            
+            # Visualizations
+            fig_disease = cached_figure("ml_predictor.disease_distribution", ml_models['version'],
+                                        lambda: disease_distribution_chart(dataset))
+            st.plotly_chart(fig_disease, use_container_width=True)
+        
+        with tab3, span("ml_predictor.model_charts"):
+            st.markdown("### 📈 Model Performance")
+            
+            # Feature importance chart
+            fig_importance = cached_figure("ml_predictor.feature_importance", ml_models['version'],
+                                           lambda: feature_importance_chart(ml_models))
+            st.plotly_chart(fig_importance, use_container_width=True)
+        
+        with tab4, span("ml_predictor.sensor_feed"):
+            st.markdown("### 📡 Streaming Sensor Feed")
+            st.caption("Readings scored by the ingestion gateway: `python -m portal.ingest --tcp 127.0.0.1:8700`")
+            store = get_timeseries_store()
+            store.sync()
+            latest = store.latest()
+            if latest.empty:
+                st.info("No streamed readings yet. Sensors send one JSON object or disease.csv-style CSV row per line to the gateway.")
+            else:
+                st.markdown("#### Latest Reading per Pen")
+                st.dataframe(latest, use_container_width=True, hide_index=True)
+                
+                pens = store.pens()
+                col1, col2 = st.columns(2)
+                with col1:
+                    pen = st.selectbox("Pen", options=pens, format_func=lambda key: f"{key[0]} / {key[1]}")
+                with col2:
+                    window_label = st.selectbox("Window", options=["Last hour", "Last 6 hours", "Last 24 hours", "All buffered"])
+                seconds = {"Last hour": 3600, "Last 6 hours": 6 * 3600, "Last 24 hours": 24 * 3600}.get(window_label)
+                history = store.frame(pen[0], pen[1], seconds=seconds)
+                fig = px.line(history.melt(id_vars='Timestamp', var_name='Sensor', value_name='Value'),
+                              x='Timestamp', y='Value', facet_row='Sensor', height=600,
+                              title=f"{pen[0]} / {pen[1]}: {len(history)} readings")
+                fig.update_yaxes(matches=None)
+                fig.for_each_annotation(lambda a: a.update(text=a.text.split('=')[-1]))
+                st.plotly_chart(fig, use_container_width=True)
+                
+                readings = read_recent(limit=200)
+                if readings:
+                    st.markdown("#### Recent Predictions")
+                    feed = pd.DataFrame(readings)
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.metric("Pens Reporting", len(latest))
+                    with col2:
+                        st.metric("High Risk", int((feed['risk_level'] == 'High').sum()) if 'risk_level' in feed else 0)
+                    columns = [c for c in ['Timestamp', 'Farm_ID', 'Pen_ID', 'Animal_Type', 'Temp_C', 'Humidity_%',
+                                           'Ammonia_ppm', 'disease', 'risk_level', 'disease_confidence', 'error']
+                               if c in feed]
+                    st.dataframe(feed[columns].iloc[::-1], use_container_width=True, hide_index=True)
+
+
+def disease_distribution_chart(dataset):
+    """Bar chart of the disease labels in the training data"""
+    disease_counts = dataset['Disease_Observed'].value_counts()
+    return px.bar(x=disease_counts.index, y=disease_counts.values, 
+                  title="Disease Distribution in Dataset")
+
+
+def feature_importance_chart(ml_models):
+    """Feature importances of the disease and risk models side by side"""
+    feature_names = ['Animal_Type', 'Farm_ID', 'Pen_ID', 'Age_Weeks', 'Weight_Kg', 'Temp_C', 'Humidity_%', 'Ammonia_ppm']
+    importance_df = pd.DataFrame({
+        'Feature': feature_names,
+        'Disease_Model': ml_models['disease_model'].feature_importances_,
+        'Risk_Model': ml_models['risk_model'].feature_importances_
+    })
+    return px.bar(importance_df.melt(id_vars='Feature'), 
+                  x='Feature', y='value', color='variable',
+                  title="Feature Importance Comparison")
@@ -0,0 +1,274 @@
+"""
+Monitoring dashboard page.
+"""
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from portal.charts import bar_chart, histogram_chart, line_chart, scatter_chart
+from portal.figure_cache import data_version
+from portal.i18n import get_text
+from portal.resources import (
+    cached_figure,
+    get_risk_rollups,
+    get_training_rollups,
+    get_training_store,
+    get_compliance_matrix,
+    load_csv_upload,
+)
+from portal.telemetry import span
+from portal.training import TRAINING_MODULES
+
+
+def monitoring_dashboard_page():
+    """Monitoring dashboard page"""
+    st.title("📊 " + get_text("monitoring"))
+    st.markdown("Data visualization and farm monitoring dashboard")
+    
+    # Data upload section
+    st.markdown("### Upload Your Farm Data")
+    uploaded_csv = st.file_uploader(
+        "Upload CSV file with your farm data",
+        type=['csv'],
+        help="Upload your own data for custom visualizations"
+    )
+    
+    custom_upload = None
+    if uploaded_csv is not None:
+        try:
+            with st.spinner("Reading uploaded data..."):
+                custom_upload = load_csv_upload(uploaded_csv)
+            st.success(f"Data uploaded successfully! {custom_upload['rows']} records loaded.")
+            st.dataframe(custom_upload['head'])
+        except Exception as e:
+            st.error(f"Error loading data: {e}")
+    
+    # Dashboard sections
+    tab1, tab2, tab3, tab4 = st.tabs(["Risk Analysis", "Training Progress", "Compliance Status", "Custom Data"])
+    
+    with tab1, span("monitoring.risk_charts"):
+        st.markdown("#### Risk Assessment Analysis")
+        
+        risk_rollups = get_risk_rollups()
+        if len(risk_rollups):
+            # Charts are rebuilt only when the rollups change
+            risk_version = data_version(risk_rollups)
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Risk level distribution
+                fig_pie = cached_figure("monitoring.risk_levels", risk_version,
+                                        lambda: risk_level_pie(risk_rollups.risk_level_counts()))
+                st.plotly_chart(fig_pie, use_container_width=True)
+            
+            with col2:
+                # Risk scores by animal type, drawn from precomputed quartiles
+                fig_box = cached_figure("monitoring.risk_scores", risk_version,
+                                        lambda: risk_score_boxes(risk_rollups.score_box_stats()))
+                st.plotly_chart(fig_box, use_container_width=True)
+            
+            # Risk score trend
+            daily_scores = risk_rollups.daily_mean_scores()
+            
+            if len(daily_scores) > 1:
+                fig_line = cached_figure("monitoring.risk_trend", risk_version, lambda: px.line(
+                    pd.DataFrame(daily_scores, columns=['date', 'risk_score']),
+                    x='date',
+                    y='risk_score',
+                    title="Average Risk Score Trend",
+                    markers=True
+                ))
+                st.plotly_chart(fig_line, use_container_width=True)
+            
+            # Detailed risk factors analysis
+            st.markdown("#### Risk Factors Analysis")
+            factor_data = risk_rollups.practice_counts()
+            
+            if factor_data:
+                fig_factors = cached_figure("monitoring.risk_factors", risk_version,
+                                            lambda: practice_bars(factor_data))
+                st.plotly_chart(fig_factors, use_container_width=True)
+        else:
+            st.info("No risk assessment data available. Complete some assessments to see visualizations.")
+    
+    with tab2, span("monitoring.training_charts"):
+        st.markdown("#### Training Progress Analysis")
+        
+        training_rollups = get_training_rollups()
+        if len(training_rollups):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Completion rate distribution
+                fig_hist = cached_figure("monitoring.training_completion", data_version(training_rollups), lambda: px.bar(
+                    pd.DataFrame(training_rollups.completion_histogram()),
+                    x='Completion Rate (%)',
+                    y='Number of Users',
+                    title="Training Completion Rate Distribution"
+                ))
+                st.plotly_chart(fig_hist, use_container_width=True)
+            
+            with col2:
+                # Average completion rate over time
+                st.metric("Average Completion Rate", f"{training_rollups.average_completion():.1f}%")
+                st.metric("Fully Completed Users", f"{training_rollups.fully_completed}/{len(training_rollups)}")
+            
+            # Completion cohorts, answered with bitwise queries over all users
+            st.markdown("##### Completion Cohorts")
+            module_ids = {module['title']: module['id'] for module in TRAINING_MODULES}
+            cohort_col1, cohort_col2 = st.columns(2)
+            with cohort_col1:
+                finished = st.multiselect("Finished modules", list(module_ids), key="cohort_finished")
+            with cohort_col2:
+                not_finished = st.multiselect("Not finished modules", list(module_ids), key="cohort_not_finished")
+            cohort = get_training_store().cohort(
+                [module_ids[title] for title in finished],
+                [module_ids[title] for title in not_finished]
+            )
+            st.metric("Users in Cohort", f"{int(cohort.sum())}/{len(cohort)}")
+        else:
+            st.info("No training data available.")
+    
+    with tab3, span("monitoring.compliance_charts"):
+        st.markdown("#### Compliance Status Overview")
+        
+        compliance_matrix = get_compliance_matrix()
+        if len(compliance_matrix):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                fig_compliance = cached_figure("monitoring.compliance_rates", data_version(compliance_matrix), lambda: px.bar(
+                    pd.DataFrame({
+                        'farm_id': compliance_matrix.farm_ids,
+                        'completion_rate': compliance_matrix.completion_rates()
+                    }),
+                    x='farm_id',
+                    y='completion_rate',
+                    title="Compliance Completion Rate by Farm",
+                    labels={'completion_rate': 'Completion Rate (%)'}
+                ))
+                st.plotly_chart(fig_compliance, use_container_width=True)
+            
+            with col2:
+                st.metric("Average Compliance Rate", f"{compliance_matrix.fleet_average():.1f}%")
+                st.metric("Required Items Compliance", f"{compliance_matrix.fleet_average(required_only=True):.1f}%")
+                st.metric("Fully Compliant Farms", f"{compliance_matrix.fully_compliant_count()}/{len(compliance_matrix)}")
+        else:
+            st.info("No compliance data available.")
+    
+    with tab4, span("monitoring.custom_data"):
+        st.markdown("#### Custom Data Analysis")
+        
+        if custom_upload is not None:
+            st.markdown("##### Data Overview")
+            st.write(f"**Shape:** {custom_upload['rows']} rows, {len(custom_upload['columns'])} columns")
+            st.write(f"**Columns:** {', '.join(custom_upload['columns'])}")
+            
+            # Basic statistics, computed while the upload was read
+            if custom_upload['summary'] is not None:
+                st.markdown("##### Numerical Summary")
+                st.dataframe(custom_upload['summary'])
+                if custom_upload['frame'] is None:
+                    st.caption("Quartiles are estimated from a random sample of the rows.")
+            
+            # Visualization options
+            custom_chart_builder(custom_upload)
+        else:
+            st.info("Upload a CSV file to analyze your custom data.")
+
+
+def risk_level_pie(risk_counts):
+    """Pie chart of the number of farms per risk level"""
+    return px.pie(
+        values=list(risk_counts.values()),
+        names=list(risk_counts.keys()),
+        title="Risk Level Distribution",
+        color_discrete_map={
+            'Low': 'green',
+            'Medium': 'yellow',
+            'High': 'red'
+        }
+    )
+
+
+def risk_score_boxes(box_stats):
+    """Box plot of risk scores per animal type from precomputed quartiles"""
+    fig_box = go.Figure()
+    for animal_type, stats in box_stats.items():
+        fig_box.add_trace(go.Box(
+            name=animal_type,
+            q1=[stats['q1']],
+            median=[stats['median']],
+            q3=[stats['q3']],
+            lowerfence=[stats['lowerfence']],
+            upperfence=[stats['upperfence']],
+            mean=[stats['mean']]
+        ))
+    fig_box.update_layout(title="Risk Scores by Animal Type", xaxis_title="animal_type", yaxis_title="risk_score")
+    return fig_box
+
+
+def practice_bars(factor_data):
+    """Stacked bars of farm practices per risk factor"""
+    fig_factors = px.bar(
+        pd.DataFrame(factor_data),
+        x='Factor',
+        y='Count',
+        color='Practice',
+        title="Farm Practices Distribution",
+        text='Count'
+    )
+    fig_factors.update_traces(texttemplate='%{text}', textposition='outside')
+    return fig_factors
+
+
+@st.fragment
+def custom_chart_builder(custom_upload):
+    """Chart controls for uploaded data; interacting with them reruns only this fragment
+
+    Line, bar and histogram charts are built from every row when the upload
+    was kept in full; otherwise, and for scatter charts, from the upload's
+    random sample, with bar totals and histogram counts shown as estimates.
+    """
+    st.markdown("##### Create Visualizations")
+    
+    custom_data = custom_upload['sample']
+    full_frame = custom_upload['frame']
+    all_rows = full_frame if full_frame is not None else custom_data  # the sample when the file was too large to keep
+    numeric_columns = [column for column, dtype in custom_upload['dtypes'].items() if dtype == 'float64']
+    if custom_upload['sampled']:
+        if full_frame is not None:
+            st.caption(f"Scatter charts use a random sample of {len(custom_data):,} of {custom_upload['rows']:,} rows.")
+        else:
+            st.caption(f"Charts use a random sample of {len(custom_data):,} of {custom_upload['rows']:,} rows; "
+                       "bar totals and histogram counts are estimates.")
+    
+    if len(numeric_columns) > 0:
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            x_axis = st.selectbox("Select X-axis", custom_upload['columns'])
+            
+        with col2:
+            y_axis = st.selectbox("Select Y-axis", numeric_columns)
+        
+        chart_type = st.selectbox("Chart Type", ["Scatter Plot", "Line Chart", "Bar Chart", "Histogram"])
+        
+        if st.button("Generate Chart"):
+            try:
+                if chart_type == "Scatter Plot":
+                    fig = scatter_chart(custom_data, x=x_axis, y=y_axis, title=f"{y_axis} vs {x_axis}")
+                elif chart_type == "Line Chart":
+                    fig = line_chart(all_rows, x=x_axis, y=y_axis, title=f"{y_axis} over {x_axis}")
+                elif chart_type == "Bar Chart":
+                    fig = bar_chart(all_rows, x=x_axis, y=y_axis, total_rows=custom_upload['rows'],
+                                    title=f"{y_axis} by {x_axis}")
+                elif chart_type == "Histogram":
+                    fig = histogram_chart(all_rows, y_axis, total_rows=custom_upload['rows'],
+                                          title=f"Distribution of {y_axis}")
+                
+                st.plotly_chart(fig, use_container_width=True)
+            except Exception as e:
+                st.error(f"Error creating chart: {e}")
@@ -0,0 +1,65 @@
+"""
+Performance Review page.
+"""
+
+import plotly.express as px
+import streamlit as st
+
+from portal.resources import mock_dataset
+from portal.telemetry import span
+
+
+def performance_review_page():
+    """Performance Review page"""
+    st.title("📈 Performance Review & Insights")
+    st.markdown("Comprehensive performance analysis and recommendations")
+    
+    # Performance metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Overall Score", "85%", delta="5%")
+    with col2:
+        st.metric("Efficiency", "92%", delta="3%")
+    with col3:
+        st.metric("Cost Reduction", "₹2.5M", delta="12%")
+    with col4:
+        st.metric("Incidents Prevented", "47", delta="8")
+    
+    st.markdown("---")
+    
+    # Performance charts
+    col1, col2 = st.columns(2)
+    
+    with col1, span("performance_review.team_chart"):
+        # Team performance
+        teams = mock_dataset('team_performance', 5)
+        
+        fig_teams = px.bar(teams, x='team', y='resolved', 
+                          title='Incidents Resolved by Team')
+        st.plotly_chart(fig_teams, use_container_width=True)
+    
+    with col2, span("performance_review.monthly_chart"):
+        # Monthly trends
+        performance = mock_dataset('monthly_scores', 9)
+        
+        fig_monthly = px.line(performance, x='Month', y='Score', 
+                            title='Monthly Performance Trend')
+        st.plotly_chart(fig_monthly, use_container_width=True)
+    
+    # Recommendations
+    st.markdown("### 💡 Automated Recommendations")
+    recommendations = [
+        "Increase training frequency for Team 3 - suggested bi-weekly sessions",
+        "Implement automated alerts for compliance scores below 80%",
+        "Schedule quarterly emergency drills for high-risk units",
+        "Optimize resource allocation to reduce response time by 15%",
+        "Deploy additional sensors in areas with recurring incidents"
+    ]
+    
+    for i, rec in enumerate(recommendations, 1):
+        st.markdown(f"**{i}.** {rec}")
+    
+    # Performance table
+    st.markdown("### 📊 Detailed Performance Metrics")
+    st.dataframe(teams.round(2))
@@ -0,0 +1,55 @@
+"""
+Protection Hub page.
+"""
+
+import streamlit as st
+
+from portal.resources import mock_dataset
+
+
+def protection_hub_page():
+    """Protection Hub page"""
+    st.title("🛡️ Protection Hub")
+    st.markdown("Comprehensive protection protocols and security measures")
+    
+    entities = mock_dataset('entities', 80)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Protected Units", len(entities))
+        st.metric("Security Level", "High")
+    with col2:
+        st.metric("Avg Compliance", f"{entities['compliance_pct'].mean():.1f}%")
+        st.metric("Active Protocols", "12")
+    with col3:
+        st.metric("Avg Risk Score", f"{entities['risk_score'].mean():.1f}")
+        st.metric("Incidents Today", "3")
+    
+    st.markdown("---")
+    
+    # Protection protocols
+    st.markdown("### 🔐 Security Protocols")
+    
+    protocols = [
+        {"name": "Biosecurity Protocol", "status": "Active", "last_update": "2 hours ago"},
+        {"name": "Access Control", "status": "Active", "last_update": "1 day ago"},
+        {"name": "Quarantine Procedures", "status": "Standby", "last_update": "3 hours ago"},
+        {"name": "Emergency Lockdown", "status": "Standby", "last_update": "1 week ago"}
+    ]
+    
+    for protocol in protocols:
+        status_color = "🟢" if protocol["status"] == "Active" else "🟡"
+        st.markdown(f"""
+        **{status_color} {protocol['name']}**
+        - Status: {protocol['status']}
+        - Last Updated: {protocol['last_update']}
+        """)
+        
+        col_a, col_b = st.columns(2)
+        with col_a:
+            if st.button(f"View Details - {protocol['name']}", key=f"view_{protocol['name']}"):
+                st.info(f"Loading {protocol['name']} details...")
+        with col_b:
+            if st.button(f"Execute - {protocol['name']}", key=f"exec_{protocol['name']}"):
+                st.success(f"Executing {protocol['name']}...")
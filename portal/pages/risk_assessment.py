@@ -0,0 +1,62 @@
+"""
+Risk assessment tool page.
+"""
+
+from datetime import datetime
+
+import streamlit as st
+
+from portal.i18n import get_text
+from portal.resources import record_risk_assessment
+from portal.risk import calculate_risk_score, get_recommendations, get_risk_level
+
+
+def risk_assessment_page():
+    """Risk assessment tool page"""
+    st.title("🔍 " + get_text("risk_assessment"))
+    st.markdown("Assess your farm's biosecurity risk level")
+    
+    with st.form("risk_assessment_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            farm_id = st.text_input("Farm ID/Name", placeholder="Enter your farm identifier")
+            animal_type = st.selectbox("Animal Type", ["Pig", "Poultry", "Mixed"])
+            farm_size = st.selectbox("Farm Size", ["Small (< 100 animals)", "Medium (100-500 animals)", "Large (> 500 animals)"])
+        with col2:
+            hygiene_practices = st.selectbox("Hygiene Practices", ["Excellent", "Good", "Average", "Poor"])
+            vaccination_records = st.selectbox("Vaccination Records", ["Up to date", "Partially updated", "Outdated"])
+            waste_management = st.selectbox("Waste Management", ["Proper disposal system", "Basic disposal", "Minimal disposal", "No proper system"])
+        st.markdown("#### Additional Risk Factors")
+        col3, col4 = st.columns(2)
+        with col3:
+            visitor_control = st.selectbox("Visitor Control", ["Strict protocols", "Basic controls", "Minimal controls", "No controls"])
+            feed_storage = st.selectbox("Feed Storage", ["Proper storage", "Adequate storage", "Basic storage", "Poor storage"])
+        with col4:
+            water_quality = st.selectbox("Water Quality", ["Tested regularly", "Tested occasionally", "Rarely tested", "Never tested"])
+            disease_history = st.selectbox("Disease History (Past Year)", ["No diseases", "Minor issues", "Major outbreak", "Multiple outbreaks"])
+        submitted = st.form_submit_button(get_text("submit"))
+
+    if submitted and farm_id:
+        assessment = {
+            'farm_id': farm_id,
+            'animal_type': animal_type,
+            'farm_size': farm_size,
+            'hygiene_practices': hygiene_practices,
+            'vaccination_records': vaccination_records,
+            'waste_management': waste_management,
+            'visitor_control': visitor_control,
+            'feed_storage': feed_storage,
+            'water_quality': water_quality,
+            'disease_history': disease_history,
+        }
+        assessment['risk_score'] = calculate_risk_score(assessment)
+        assessment['risk_level'] = get_risk_level(assessment['risk_score'])
+        assessment['timestamp'] = datetime.now().isoformat()
+        record_risk_assessment(farm_id, assessment)
+
+        st.success(f"Risk Score = {assessment['risk_score']}/100 ({assessment['risk_level']} Risk)")
+        st.markdown("### Recommendations")
+        for recommendation in get_recommendations(assessment['risk_level'], assessment):
+            st.write(f"• {recommendation}")
+    elif submitted:
+        st.error("Please enter a Farm ID/Name")
@@ -0,0 +1,58 @@
+"""
+Training modules page.
+"""
+
+import streamlit as st
+
+from portal.i18n import get_text
+from portal.resources import get_training_store, set_module_completed
+from portal.training import TRAINING_CATALOG, TRAINING_MODULES
+
+
+def training_modules_page():
+    """Training modules page"""
+    st.title("📚 " + get_text("training"))
+    st.markdown("Interactive training modules for farm biosecurity best practices")
+    
+    # Load training progress
+    user_id = st.text_input("Enter your User ID", value="farmer_001")
+    user_mask = get_training_store().mask(user_id)
+    modules = TRAINING_MODULES
+    
+    # Progress overview
+    total_modules = len(modules)
+    completed_modules = user_mask.bit_count()
+    completion_rate = TRAINING_CATALOG.completion_rate(user_mask)
+    
+    st.markdown(f"### Progress Overview")
+    st.progress(completion_rate / 100)
+    st.markdown(f"**{completed_modules}/{total_modules} modules completed ({completion_rate:.1f}%)**")
+    
+    # Display modules
+    for module in modules:
+        is_completed = TRAINING_CATALOG.is_completed(user_mask, module['id'])
+        
+        with st.expander(f"{module['icon']} {module['title']}" + (" ✅" if is_completed else ""), expanded=not is_completed):
+            st.markdown(f"**{module['description']}**")
+            
+            st.markdown("#### Learning Objectives:")
+            for item in module['content']:
+                st.write(f"• {item}")
+            
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                if is_completed:
+                    st.success("✅ Module completed!")
+                else:
+                    st.info("📖 Click 'Mark as Completed' after studying the content")
+            
+            with col2:
+                if not is_completed:
+                    if st.button(f"Mark Completed", key=f"complete_{module['id']}"):
+                        set_module_completed(user_id, module['id'], completed=True)
+                        st.rerun()
+                else:
+                    if st.button(f"Reset", key=f"reset_{module['id']}"):
+                        set_module_completed(user_id, module['id'], completed=False)
+                        st.rerun()
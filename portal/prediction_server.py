@@ -0,0 +1,287 @@
+"""
+Standalone HTTP/JSON prediction service.
+Loads the models once and scores requests on a bounded worker pool, so sensor gateways can call the predictor
+without a Streamlit session and heavy batches never run on a UI worker. Results have the same shape as
+predict_animal_health and predict_animal_health_batch. Concurrent single predictions are coalesced into
+vectorized batches (see portal/batching.py).
+
+    python -m portal.prediction_server [--host 127.0.0.1] [--port 8600] [--workers 4]
+                                       [--coalesce-size 64] [--coalesce-wait-ms 5] [--models models/]
+
+    POST /predict        {"Animal_Type": "Pig", "Farm_ID": "F1", ...}  -> result
+    POST /predict/batch  {"inputs": [{...}, ...]} or [{...}, ...]        -> {"results": [...]}
+    GET  /health         model version, worker count, uptime
+    GET  /stats          request counts, in-flight requests, latency percentiles, batch sizes
+
+Models come from the memory-mapped artifact directory (see portal/model_store.py), so several servers and the
+app share one copy and pick up newly published versions without a restart. The Streamlit app uses
+PredictionClient when PORTAL_PREDICTION_URL points at a running server, and an in-process PredictionService
+otherwise.
+"""
+
+import argparse
+import json
+import threading
+import time
+import warnings
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from portal.batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT, MicroBatcher
+from portal.ml import (DISEASE_CSV, load_and_train_ml_model, predict_animal_health,
+                       predict_animal_health_batch)
+from portal.model_store import MODELS_DIR, ModelHandle
+from portal.telemetry import Timings
+
+DEFAULT_PORT = 8600
+DEFAULT_WORKERS = 4
+MAX_BATCH = 10_000
+MAX_BODY_BYTES = 16 * 1024 * 1024
+REQUEST_TIMEOUT = 60  # seconds a request may wait for its result
+
+
+class PredictionService:
+    """Loaded models plus a bounded scoring pool; thread-safe
+
+    ml_models is a models dict or a ModelHandle, whose current version is used for every request; by default
+    the artifact in models_dir, trained from csv_path first when none is published yet. Single predictions
+    arriving within coalesce_wait seconds of each other are scored together, up to coalesce_size at a time;
+    coalesce_size=1 scores every call on its own.
+    """
+
+    def __init__(self, ml_models=None, workers=DEFAULT_WORKERS, csv_path=DISEASE_CSV, max_batch=MAX_BATCH,
+                 coalesce_size=DEFAULT_MAX_BATCH_SIZE, coalesce_wait=DEFAULT_MAX_WAIT, models_dir=MODELS_DIR):
+        if ml_models is None:
+            ml_models = ModelHandle(models_dir)
+            ml_models.ensure(partial(load_and_train_ml_model, csv_path))
+        self._models = ml_models
+        self.workers = workers
+        self.max_batch = max_batch
+        self.timings = Timings()
+        self.started = time.time()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='predict')
+        self._batcher = None
+        if coalesce_size > 1:
+            self._batcher = MicroBatcher(self._score_batch, coalesce_size, coalesce_wait, executor=self._pool)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._errors = 0
+
+    @property
+    def ml_models(self):
+        """Models for the next request"""
+        return self._models.get() if isinstance(self._models, ModelHandle) else self._models
+
+    def _score_batch(self, sensor_inputs):
+        return predict_animal_health_batch(sensor_inputs, self.ml_models)
+
+    def _run(self, name, submit):
+        """Wait for the future returned by submit(), counting it as in flight"""
+        with self._lock:
+            self._in_flight += 1
+        try:
+            with self.timings.span(name):
+                return submit().result(timeout=REQUEST_TIMEOUT)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def predict(self, sensor_input):
+        """Score one sensor reading"""
+        if self._batcher is not None:
+            submit = partial(self._batcher.submit, sensor_input)
+        else:
+            submit = partial(self._pool.submit, predict_animal_health, sensor_input, self.ml_models)
+        try:
+            result = self._run('predict', submit)
+        except FutureTimeout:
+            result = {"error": f"Prediction timed out after {REQUEST_TIMEOUT}s"}
+        if 'error' in result:
+            with self._lock:
+                self._errors += 1
+        return result
+
+    def predict_batch(self, sensor_inputs):
+        """Score many sensor readings in one vectorized call"""
+        sensor_inputs = list(sensor_inputs)
+        if len(sensor_inputs) > self.max_batch:
+            return [{"error": f"Batch too large: {len(sensor_inputs)} inputs, at most {self.max_batch}"}
+                    for _ in sensor_inputs]
+        try:
+            results = self._run('predict_batch', partial(self._pool.submit, predict_animal_health_batch,
+                                                         sensor_inputs, self.ml_models))
+        except FutureTimeout:
+            results = [{"error": f"Prediction timed out after {REQUEST_TIMEOUT}s"} for _ in sensor_inputs]
+        failed = sum('error' in result for result in results)
+        if failed:
+            with self._lock:
+                self._errors += failed
+        return results
+
+    def health(self):
+        ml_models = self.ml_models
+        return {
+            'status': 'error' if 'error' in ml_models else 'ok',
+            'error': ml_models.get('error'),
+            'model_version': ml_models.get('version'),
+            'trained_at': ml_models.get('trained_at'),
+            'workers': self.workers,
+            'uptime_s': round(time.time() - self.started, 1),
+        }
+
+    def stats(self):
+        with self._lock:
+            in_flight, errors = self._in_flight, self._errors
+        return {
+            'in_flight': in_flight,
+            'errors': errors,
+            'latency': {row['span']: {key: round(value, 3) if isinstance(value, float) else value
+                                      for key, value in row.items() if key != 'span'}
+                        for row in self.timings.summary()},
+            'coalescing': self._batcher.stats() if self._batcher is not None else None,
+        }
+
+    def shutdown(self):
+        if self._batcher is not None:
+            self._batcher.close()
+        self._pool.shutdown(wait=True)
+
+
+class PredictionClient:
+    """Same interface as PredictionService, over HTTP to a running prediction server"""
+
+    def __init__(self, base_url, timeout=REQUEST_TIMEOUT):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def _call(self, path, payload=None):
+        data = None if payload is None else json.dumps(payload).encode('utf-8')
+        request = urllib.request.Request(self.base_url + path, data=data,
+                                         headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.load(response)
+        except urllib.error.HTTPError as e:
+            try:
+                return json.load(e)
+            except ValueError:  # not a JSON body, e.g. a proxy's HTML error page
+                return {"error": f"HTTP {e.code}"}
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            return {"error": f"Prediction service unavailable: {e}"}
+
+    def predict(self, sensor_input):
+        return self._call('/predict', sensor_input)
+
+    def predict_batch(self, sensor_inputs):
+        sensor_inputs = list(sensor_inputs)
+        response = self._call('/predict/batch', {'inputs': sensor_inputs})
+        if 'results' not in response:
+            return [{"error": response.get('error', 'Unexpected response')} for _ in sensor_inputs]
+        return response['results']
+
+    def health(self):
+        return self._call('/health')
+
+    def stats(self):
+        return self._call('/stats')
+
+
+class _PredictionHandler(BaseHTTPRequestHandler):
+    service = None  # set on the subclass made by make_server
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_BYTES:
+            raise ValueError(f"Request body too large: {length} bytes")
+        return json.loads(self.rfile.read(length) or b'null')
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if path == '/health':
+            health = self.service.health()
+            self._send(200 if health['status'] == 'ok' else 503, health)
+        elif path == '/stats':
+            self._send(200, self.service.stats())
+        else:
+            self._send(404, {"error": f"Unknown path '{path}'"})
+
+    def do_POST(self):
+        path = self.path.split('?', 1)[0]
+        try:
+            payload = self._read_json()
+        except (ValueError, UnicodeDecodeError) as e:
+            self._send(400, {"error": f"Invalid JSON body: {e}"})
+            return
+        if path == '/predict':
+            if not isinstance(payload, dict):
+                self._send(400, {"error": "Expected a JSON object of sensor inputs"})
+                return
+            self._send(200, self.service.predict(payload))
+        elif path == '/predict/batch':
+            inputs = payload.get('inputs') if isinstance(payload, dict) else payload
+            if not isinstance(inputs, list) or not all(isinstance(i, dict) for i in inputs):
+                self._send(400, {"error": "Expected a list of sensor input objects"})
+                return
+            if len(inputs) > self.service.max_batch:
+                self._send(413, {"error": f"Batch too large: {len(inputs)} inputs, at most {self.service.max_batch}"})
+                return
+            self._send(200, {'results': self.service.predict_batch(inputs)})
+        else:
+            self._send(404, {"error": f"Unknown path '{path}'"})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(service, host='127.0.0.1', port=DEFAULT_PORT):
+    """HTTP server bound to `service`; call serve_forever() on it"""
+    handler = type('PredictionHandler', (_PredictionHandler,), {'service': service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Standalone HTTP/JSON prediction service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    parser.add_argument('--coalesce-size', type=int, default=DEFAULT_MAX_BATCH_SIZE,
+                        help='most single predictions scored together (1 disables coalescing)')
+    parser.add_argument('--coalesce-wait-ms', type=float, default=DEFAULT_MAX_WAIT * 1000,
+                        help='longest a single prediction waits for others to join its batch')
+    parser.add_argument('--csv', default=DISEASE_CSV, help='training data, used when no current artifact exists')
+    parser.add_argument('--models', default=str(MODELS_DIR), help='model artifact directory')
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings('ignore', category=UserWarning, module='sklearn')
+    service = PredictionService(workers=args.workers, csv_path=args.csv, coalesce_size=args.coalesce_size,
+                                coalesce_wait=args.coalesce_wait_ms / 1000, models_dir=args.models)
+    if 'error' in service.ml_models:
+        parser.exit(1, f"Model loading failed: {service.ml_models['error']}\n")
+    server = make_server(service, args.host, args.port)
+    print(f"Serving predictions on http://{args.host}:{server.server_port} "
+          f"(model {service.ml_models['version']}, {args.workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+Long-lived shared services.
+Each accessor is a Streamlit resource singleton: it is built on first use and
+then shared by every session and rerun of the process.
+"""
+
+import logging
+import os
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from portal.anomaly import AnomalyEngine
+from portal.compliance import COMPLIANCE_ITEMS, ComplianceMatrix
+from portal.csv_profile import file_digest, profile_csv
+from portal.doc_pipeline import DocumentProcessor
+from portal.documents import DocumentStore
+from portal.figure_cache import FigureCache
+from portal.forecasting import Forecaster, farm_daily_series
+from portal.ml import DISEASE_CSV, load_and_train_ml_model
+from portal.mock_data import MAX_SCALE, SCALABLE_DATASETS, MockDataService
+from portal.model_store import ModelHandle
+from portal.rollups import RiskRollups, TrainingRollups
+from portal.storage import UPLOADS_DIR, load_data, save_data
+from portal.telemetry import register_cache
+from portal.timeseries import TimeSeriesStore
+from portal.training import TRAINING_CATALOG, TrainingProgressStore
+
+logger = logging.getLogger(__name__)
+
+
+# --------------------------- ML Models ---------------------------
+@st.cache_resource
+def get_model_handle():
+    """Memory-mapped prediction models, shared with other worker processes on the host
+
+    The models are trained on disease.csv and published on first use when
+    no artifact exists yet; newer versions come from `python -m
+    portal.model_store publish`.
+    """
+    handle = ModelHandle()
+    handle.ensure(load_and_train_ml_model)
+    return handle
+
+def get_ml_models():
+    """Current prediction models; a newly published version is picked up without a restart"""
+    return get_model_handle().get()
+
+@st.cache_resource
+def get_predictor():
+    """Prediction service: the HTTP server at PORTAL_PREDICTION_URL when set, else in-process"""
+    from portal.prediction_server import PredictionClient, PredictionService
+    if os.environ.get('PORTAL_PREDICTION_URL'):
+        return PredictionClient(os.environ['PORTAL_PREDICTION_URL'])
+    return PredictionService(get_model_handle(), workers=2)
+
+@st.cache_resource
+def get_timeseries_store():
+    """Per-pen ring buffers of recent sensor readings, warmed from the spilled segments
+
+    With PORTAL_INGEST_TCP (host:port) or PORTAL_INGEST_UNIX set, the
+    ingestion gateway runs in this process and feeds the store directly;
+    otherwise readers call sync() to pick up a standalone gateway's segments.
+    Either way a background task spills the store and saves the anomaly
+    engine's state every SPILL_INTERVAL seconds.
+    """
+    from portal.ingest import start_background_gateway, start_background_spill
+    store = TimeSeriesStore()
+    store.load_segments()
+    anomaly_engine = get_anomaly_engine()
+    tcp, unix = os.environ.get('PORTAL_INGEST_TCP'), os.environ.get('PORTAL_INGEST_UNIX')
+    if tcp or unix:
+        ml_models = get_ml_models()
+        if 'error' not in ml_models:
+            host, _, port = (tcp or '').rpartition(':')
+            try:
+                start_background_gateway(get_predictor().predict_batch, ml_models['feature_names'], store,
+                                         host=host or '127.0.0.1', port=int(port) if port else None, path=unix,
+                                         anomaly_engine=anomaly_engine)
+                return store
+            except OSError as e:
+                # e.g. the address is held by another server process; sync() still reads its segments
+                logger.warning("Embedded ingestion gateway not started on %s: %s", tcp or unix, e)
+    start_background_spill(store, anomaly_engine)
+    return store
+
+@st.cache_resource
+def get_anomaly_engine():
+    """Streaming anomaly detectors of every pen, farm and incident series, resumed from the saved state"""
+    return AnomalyEngine.load()
+
+@st.cache_resource
+def get_forecaster():
+    """Per-farm risk and incident forecasters, resumed from the saved parameters"""
+    return Forecaster(workers=2)
+
+def get_farm_forecaster():
+    """The forecaster, refreshed when a new model version brings new training data
+
+    The series are built from every row of disease.csv: the training dataset
+    has dropped the healthy readings (Disease_Observed "None" reads as NaN).
+    """
+    forecaster = get_forecaster()
+    ml_models = get_ml_models()
+    if 'error' not in ml_models:
+        forecaster.refresh(ml_models['version'], lambda: farm_daily_series(pd.read_csv(DISEASE_CSV)))
+    return forecaster
+
+# --------------------------- Incremental Rollups ---------------------------
+@st.cache_resource
+def get_risk_rollups():
+    """Process-wide risk rollups, seeded once from the stored assessments"""
+    return RiskRollups.from_records(load_data("risk_assessments.json"))
+
+def record_risk_assessment(farm_id, assessment):
+    """Store a risk assessment and fold it into the rollups"""
+    risk_data = load_data("risk_assessments.json")
+    risk_data[farm_id] = assessment
+    save_data("risk_assessments.json", risk_data)
+    get_risk_rollups().add(farm_id, assessment)
+
+@st.cache_resource
+def get_training_rollups():
+    """Process-wide training counters, seeded once from the stored progress"""
+    return TrainingRollups.from_records(load_data("training_progress.json"))
+
+# --------------------------- Training Progress ---------------------------
+@st.cache_resource
+def get_training_store():
+    """Process-wide completion bitmasks, seeded once from the stored progress"""
+    return TrainingProgressStore.from_records(TRAINING_CATALOG, load_data("training_progress.json"))
+
+def set_module_completed(user_id, module_id, completed=True):
+    """Mark a training module completed (or reset it) for a user"""
+    mask = get_training_store().set_completed(user_id, module_id, completed)
+    completion_rate = TRAINING_CATALOG.completion_rate(mask)
+    
+    training_data = load_data("training_progress.json")
+    training_data[user_id] = {
+        'modules_mask': mask,
+        'completion_rate': completion_rate,
+        'last_updated': datetime.now().isoformat()
+    }
+    save_data("training_progress.json", training_data)
+    get_training_rollups().update(user_id, completion_rate)
+
+# --------------------------- Compliance & Documents ---------------------------
+@st.cache_resource
+def get_compliance_matrix():
+    """Process-wide compliance status matrix, seeded once from the stored records"""
+    return ComplianceMatrix.from_records(COMPLIANCE_ITEMS, load_data("compliance_records.json"))
+
+def set_compliance_status(farm_id, item_id, status, document=None):
+    """Update one checklist item of a farm, optionally attaching its document"""
+    timestamp = datetime.now().isoformat()
+    compliance_data = load_data("compliance_records.json")
+    farm_compliance = compliance_data.setdefault(farm_id, {'documents': {}, 'checklist': {}})
+    farm_compliance.setdefault('documents', {})
+    farm_compliance.setdefault('checklist', {})
+    if document is not None:
+        farm_compliance['documents'][item_id] = document
+    farm_compliance['checklist'][item_id] = status
+    farm_compliance['last_updated'] = timestamp
+    save_data("compliance_records.json", compliance_data)
+    get_compliance_matrix().set_status(farm_id, item_id, status, timestamp)
+
+@st.cache_resource
+def get_document_store():
+    """Process-wide content-addressed store for compliance documents"""
+    return DocumentStore(UPLOADS_DIR)
+
+@st.cache_resource
+def get_document_processor():
+    """Process-wide worker pool deriving thumbnails and metadata from stored documents"""
+    return DocumentProcessor(get_document_store(), UPLOADS_DIR / "derived")
+
+def store_compliance_document(farm_id, item_id, uploaded_file):
+    """Store an uploaded compliance document and submit its checklist item
+
+    Identical content is stored once; re-uploading the document a farm
+    already holds for this item takes no extra space.
+    """
+    document_store = get_document_store()
+    uploaded_file.seek(0)
+    entry = document_store.put(uploaded_file, filename=uploaded_file.name, content_type=uploaded_file.type)
+    
+    compliance_data = load_data("compliance_records.json")
+    previous = compliance_data.get(farm_id, {}).get('documents', {}).get(item_id)
+    if previous and previous.get('content_hash') == entry['digest']:
+        # Same document again: keep the reference the record already holds
+        document_store.release(entry['digest'])
+        document = previous
+    else:
+        if previous and previous.get('content_hash'):
+            document_store.release(previous['content_hash'])
+        document = {
+            'filename': uploaded_file.name,
+            'upload_date': datetime.now().isoformat(),
+            'content_hash': entry['digest'],
+            'size': entry['size']
+        }
+    
+    set_compliance_status(farm_id, item_id, 'Submitted', document=document)
+    get_document_processor().submit(entry['digest'], uploaded_file.name)
+
+# --------------------------- Figures ---------------------------
+@st.cache_resource
+def get_figure_cache():
+    """Built Plotly figures shared by all sessions"""
+    cache = FigureCache()
+    register_cache("figures", cache.stats)
+    return cache
+
+def cached_figure(chart_id, version, build):
+    """Figure of a chart for a data version and the session's theme; build() runs only on a miss"""
+    key = (chart_id, version, st.session_state.get('theme_mode', 'Light'))
+    return get_figure_cache().get_or_build(key, build)
+
+# --------------------------- Uploads ---------------------------
+@st.cache_resource(max_entries=4, show_spinner=False)
+def get_csv_profile(digest, _uploaded_file):
+    """Parsed and profiled CSV upload, shared by every session uploading the same content"""
+    return profile_csv(_uploaded_file)
+
+def load_csv_upload(uploaded_file):
+    """Profile of an uploaded CSV (see profile_csv); the upload is hashed once and parsed once per content"""
+    digests = st.session_state.setdefault('upload_digests', {})
+    if uploaded_file.file_id not in digests:
+        digests[uploaded_file.file_id] = file_digest(uploaded_file)
+    digest = digests[uploaded_file.file_id]
+    return {**get_csv_profile(digest, uploaded_file), 'digest': digest}
+
+# --------------------------- Mock Data ---------------------------
+@st.cache_resource
+def get_mock_data():
+    """Seeded mock dataset service, shared by all sessions"""
+    service = MockDataService()
+    register_cache("mock_data", service.stats)
+    return service
+
+def mock_dataset(name, size):
+    """Mock dataset for a page
+
+    With PORTAL_LOAD_TEST set, the ?mock_scale=<factor> query parameter
+    (capped at MAX_SCALE) multiplies the size of volume datasets so the
+    dashboards can be load-tested at realistic volumes; ?mock_seed=<n>
+    draws a different but reproducible variant.
+    """
+    scale, seed = 1, None
+    try:
+        if os.environ.get('PORTAL_LOAD_TEST') and name in SCALABLE_DATASETS:
+            scale = min(max(float(st.query_params.get('mock_scale', 1)), 0), MAX_SCALE)
+        seed = int(st.query_params['mock_seed']) if 'mock_seed' in st.query_params else None
+    except ValueError:
+        scale, seed = 1, None
+    return get_mock_data().get(name, max(int(size * scale), 1), seed=seed)
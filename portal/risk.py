@@ -0,0 +1,85 @@
+"""
+Biosecurity risk scoring and recommendations.
+"""
+
+def get_risk_level(score):
+    """Map a risk score to its risk level"""
+    if score < 40:
+        return "Low"
+    if score < 70:
+        return "Medium"
+    return "High"
+
+def calculate_risk_score(data):
+    """Calculate risk score based on assessment data"""
+    score = 0
+    
+    # Farm size risk (larger farms = higher risk)
+    if data['farm_size'] == "Large (> 500 animals)":
+        score += 20
+    elif data['farm_size'] == "Medium (100-500 animals)":
+        score += 10
+    else:
+        score += 5
+    
+    # Hygiene practices
+    hygiene_scores = {"Poor": 20, "Average": 15, "Good": 8, "Excellent": 0}
+    score += hygiene_scores.get(data['hygiene_practices'], 15)
+    
+    # Vaccination records
+    vacc_scores = {"Outdated": 15, "Partially updated": 10, "Up to date": 0}
+    score += vacc_scores.get(data['vaccination_records'], 10)
+    
+    # Waste management
+    waste_scores = {"No proper system": 15, "Minimal disposal": 12, "Basic disposal": 8, "Proper disposal system": 0}
+    score += waste_scores.get(data['waste_management'], 10)
+    
+    # Visitor control
+    visitor_scores = {"No controls": 10, "Minimal controls": 8, "Basic controls": 5, "Strict protocols": 0}
+    score += visitor_scores.get(data['visitor_control'], 8)
+    
+    # Feed storage
+    feed_scores = {"Poor storage": 8, "Basic storage": 6, "Adequate storage": 3, "Proper storage": 0}
+    score += feed_scores.get(data['feed_storage'], 6)
+    
+    # Water quality
+    water_scores = {"Never tested": 8, "Rarely tested": 6, "Tested occasionally": 3, "Tested regularly": 0}
+    score += water_scores.get(data['water_quality'], 6)
+    
+    # Disease history
+    disease_scores = {"Multiple outbreaks": 15, "Major outbreak": 10, "Minor issues": 5, "No diseases": 0}
+    score += disease_scores.get(data['disease_history'], 5)
+    
+    return min(score, 100)  # Cap at 100
+
+def get_recommendations(risk_level, data):
+    """Get recommendations based on risk level and specific issues"""
+    recommendations = []
+    
+    if risk_level == "High":
+        recommendations.append("🚨 Immediate action required - Implement strict biosecurity measures")
+        recommendations.append("📞 Contact veterinarian for emergency consultation")
+        
+    if data['hygiene_practices'] in ["Poor", "Average"]:
+        recommendations.append("🧼 Improve daily cleaning and disinfection protocols")
+        
+    if data['vaccination_records'] in ["Outdated", "Partially updated"]:
+        recommendations.append("💉 Update vaccination schedules immediately")
+        
+    if data['waste_management'] in ["No proper system", "Minimal disposal"]:
+        recommendations.append("🗑️ Implement proper waste disposal and treatment system")
+        
+    if data['visitor_control'] in ["No controls", "Minimal controls"]:
+        recommendations.append("🚪 Establish strict visitor entry protocols")
+        
+    if data['water_quality'] in ["Never tested", "Rarely tested"]:
+        recommendations.append("💧 Implement regular water quality testing")
+        
+    if risk_level == "Medium":
+        recommendations.append("⚠️ Monitor closely and improve identified weak areas")
+        
+    if risk_level == "Low":
+        recommendations.append("✅ Good practices! Continue current protocols")
+        recommendations.append("📈 Consider advanced monitoring systems for optimization")
+    
+    return recommendations
@@ -0,0 +1,210 @@
+"""
+Incremental rollups over stored records.
+Dashboards read these small aggregates instead of rescanning whole collections.
+"""
+
+import threading
+from collections import Counter, defaultdict
+
+import numpy as np
+
+RISK_FACTORS = ['hygiene_practices', 'vaccination_records', 'waste_management', 'visitor_control']
+SCORE_BINS = 101  # risk scores are integers in [0, 100]
+
+
+def _score_bin(score):
+    """Map a risk score to its histogram bin, or None when missing"""
+    if score is None:
+        return None
+    try:
+        return int(min(max(round(float(score)), 0), SCORE_BINS - 1))
+    except (TypeError, ValueError):
+        return None
+
+
+def _quantile(cumulative, total, q):
+    """Score at quantile q from a cumulative histogram"""
+    return int(np.searchsorted(cumulative, q * total, side='left'))
+
+
+class RiskRollups:
+    """Running aggregates over risk assessments, keyed by farm
+
+    Re-assessing a farm replaces its previous contribution, so the rollups
+    always describe the latest assessment per farm like the stored records do.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._contributions = {}
+        self.level_counts = Counter()
+        self.score_histograms = defaultdict(lambda: np.zeros(SCORE_BINS, dtype=np.int64))
+        self.daily_totals = defaultdict(lambda: [0.0, 0])
+        self.factor_counts = {factor: Counter() for factor in RISK_FACTORS}
+        self.version = 0
+
+    @classmethod
+    def from_records(cls, risk_data):
+        """Build rollups from an existing risk collection (one pass)"""
+        rollups = cls()
+        for farm_id, assessment in risk_data.items():
+            rollups.add(farm_id, assessment)
+        return rollups
+
+    def __len__(self):
+        return len(self._contributions)
+
+    def add(self, farm_id, assessment):
+        """Record (or replace) the assessment of a farm in O(1)"""
+        contribution = (
+            assessment.get('risk_level'),
+            assessment.get('animal_type'),
+            _score_bin(assessment.get('risk_score')),
+            (assessment.get('timestamp') or '')[:10] or None,
+            tuple(assessment.get(factor) for factor in RISK_FACTORS),
+        )
+        with self._lock:
+            previous = self._contributions.get(farm_id)
+            if previous is not None:
+                self._apply(previous, -1)
+            self._contributions[farm_id] = contribution
+            self._apply(contribution, 1)
+            self.version += 1
+
+    def _apply(self, contribution, sign):
+        level, animal_type, score_bin, day, practices = contribution
+        if level is not None:
+            self.level_counts[level] += sign
+            if self.level_counts[level] == 0:
+                del self.level_counts[level]
+        if score_bin is not None:
+            if animal_type is not None:
+                self.score_histograms[animal_type][score_bin] += sign
+            if day is not None:
+                totals = self.daily_totals[day]
+                totals[0] += sign * score_bin
+                totals[1] += sign
+                if totals[1] == 0:
+                    del self.daily_totals[day]
+        for factor, practice in zip(RISK_FACTORS, practices):
+            if practice is not None:
+                self.factor_counts[factor][practice] += sign
+                if self.factor_counts[factor][practice] == 0:
+                    del self.factor_counts[factor][practice]
+
+    def risk_level_counts(self):
+        """Number of farms per risk level"""
+        with self._lock:
+            return dict(self.level_counts)
+
+    def score_box_stats(self):
+        """Box-plot statistics of risk scores per animal type"""
+        stats = {}
+        with self._lock:
+            histograms = {k: v.copy() for k, v in self.score_histograms.items()}
+        for animal_type, histogram in sorted(histograms.items()):
+            total = int(histogram.sum())
+            if total == 0:
+                continue
+            cumulative = np.cumsum(histogram)
+            present = np.flatnonzero(histogram)
+            q1 = _quantile(cumulative, total, 0.25)
+            q3 = _quantile(cumulative, total, 0.75)
+            iqr = q3 - q1
+            inside = present[(present >= q1 - 1.5 * iqr) & (present <= q3 + 1.5 * iqr)]
+            stats[animal_type] = {
+                'count': total,
+                'min': int(present[0]),
+                'q1': q1,
+                'median': _quantile(cumulative, total, 0.5),
+                'q3': q3,
+                'max': int(present[-1]),
+                'lowerfence': int(inside[0]),
+                'upperfence': int(inside[-1]),
+                'mean': float(np.dot(histogram, np.arange(SCORE_BINS)) / total),
+            }
+        return stats
+
+    def daily_mean_scores(self):
+        """Sorted (date, mean risk score) pairs"""
+        with self._lock:
+            return [(day, total / count) for day, (total, count) in sorted(self.daily_totals.items())]
+
+    def practice_counts(self):
+        """Rows of {'Factor', 'Practice', 'Count'} for the practices chart"""
+        rows = []
+        with self._lock:
+            for factor in RISK_FACTORS:
+                for practice, count in self.factor_counts[factor].items():
+                    rows.append({'Factor': factor.replace('_', ' ').title(), 'Practice': practice, 'Count': count})
+        return rows
+
+    def mean_score(self):
+        """Mean risk score over all scored farms"""
+        with self._lock:
+            total = sum(float(np.dot(h, np.arange(SCORE_BINS))) for h in self.score_histograms.values())
+            count = sum(int(h.sum()) for h in self.score_histograms.values())
+        return total / count if count else 0
+
+
+COMPLETION_BUCKETS = 10
+
+
+def _completion_bucket(rate):
+    """Histogram bucket of a completion rate in [0, 100]; 100% lands in the last bucket"""
+    return min(int(rate * COMPLETION_BUCKETS // 100), COMPLETION_BUCKETS - 1)
+
+
+class TrainingRollups:
+    """Running counters over per-user training completion rates"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rates = {}
+        self.rate_sum = 0.0
+        self.fully_completed = 0
+        self.buckets = np.zeros(COMPLETION_BUCKETS, dtype=np.int64)
+        self.version = 0
+
+    @classmethod
+    def from_records(cls, training_data):
+        """Build counters from an existing training collection (one pass)"""
+        rollups = cls()
+        for user_id, progress in training_data.items():
+            rollups.update(user_id, progress.get('completion_rate', 0))
+        return rollups
+
+    def __len__(self):
+        return len(self._rates)
+
+    def update(self, user_id, rate):
+        """Set a user's completion rate in O(1)"""
+        rate = float(min(max(rate, 0), 100))
+        with self._lock:
+            previous = self._rates.get(user_id)
+            if previous is not None:
+                self._apply(previous, -1)
+            self._rates[user_id] = rate
+            self._apply(rate, 1)
+            self.version += 1
+
+    def _apply(self, rate, sign):
+        self.rate_sum += sign * rate
+        self.buckets[_completion_bucket(rate)] += sign
+        if rate == 100:
+            self.fully_completed += sign
+
+    def average_completion(self):
+        """Mean completion rate over all users"""
+        with self._lock:
+            return self.rate_sum / len(self._rates) if self._rates else 0
+
+    def completion_histogram(self):
+        """Rows of {'Completion Rate (%)', 'Number of Users'} per bucket"""
+        width = 100 // COMPLETION_BUCKETS
+        with self._lock:
+            counts = self.buckets.tolist()
+        return [
+            {'Completion Rate (%)': f"{i * width}-{(i + 1) * width}", 'Number of Users': count}
+            for i, count in enumerate(counts)
+        ]
@@ -0,0 +1,53 @@
+"""
+JSON collection storage for the portal records.
+"""
+
+import copy
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from portal.telemetry import timed
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+UPLOADS_DIR = Path(__file__).resolve().parent.parent / "uploads"
+
+# Demo records served until a collection is first saved
+DEMO_DATA = {
+    "risk_assessments.json": {
+        "FarmA": {"farm_id": "FarmA", "animal_type": "Pig", "farm_size": "Medium (100-500 animals)", "hygiene_practices": "Good", "vaccination_records": "Up to date", "waste_management": "Basic disposal", "visitor_control": "Basic controls", "feed_storage": "Proper storage", "water_quality": "Tested regularly", "disease_history": "No diseases", "risk_score": 31, "risk_level": "Low", "timestamp": "2025-09-01T10:00:00"},
+        "FarmB": {"farm_id": "FarmB", "animal_type": "Poultry", "farm_size": "Large (> 500 animals)", "hygiene_practices": "Poor", "vaccination_records": "Outdated", "waste_management": "Minimal disposal", "visitor_control": "No controls", "feed_storage": "Basic storage", "water_quality": "Rarely tested", "disease_history": "Major outbreak", "risk_score": 99, "risk_level": "High", "timestamp": "2025-09-02T12:00:00"}
+    },
+    "training_progress.json": {
+        "farmer_001": {"modules_mask": 31, "completion_rate": 100, "last_updated": "2025-09-01T10:00:00"},
+        "farmer_002": {"modules_mask": 7, "completion_rate": 60, "last_updated": "2025-09-02T12:00:00"}
+    },
+    "farmers_directory.json": {
+        "farmer_001": {"farmer_name": "Amit", "location": "Kolkata", "farm_type": "Pig Farm", "farm_size": "Large (> 500 animals)", "specializations": ["Breeding"], "contact_phone": "1234567890", "contact_email": "amit@example.com", "farm_name": "Amit Farms", "additional_info": "", "registration_date": "2025-09-01T10:00:00", "verified": True},
+        "farmer_002": {"farmer_name": "Priya", "location": "Delhi", "farm_type": "Poultry Farm", "farm_size": "Medium (100-500 animals)", "specializations": ["Feed Production"], "contact_phone": "9876543210", "contact_email": "priya@example.com", "farm_name": "Priya Poultry", "additional_info": "", "registration_date": "2025-09-02T12:00:00", "verified": False}
+    },
+    "compliance_records.json": {
+        "farm_001": {"documents": {}, "checklist": {"vaccination_certificate": "Verified", "waste_disposal_permit": "Submitted"}},
+        "farm_002": {"documents": {}, "checklist": {"vaccination_certificate": "Pending"}}
+    },
+    "alert_preferences.json": {}
+}
+
+@timed("storage.load")
+def load_data(filename):
+    """Load a JSON collection from the data directory, falling back to the demo records"""
+    path = DATA_DIR / filename
+    if path.exists():
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    return copy.deepcopy(DEMO_DATA.get(filename, {}))
+
+@timed("storage.save")
+def save_data(filename, data):
+    """Atomically write a JSON collection to the data directory"""
+    DATA_DIR.mkdir(exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=DATA_DIR, suffix='.tmp')
+    with os.fdopen(fd, "w", encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, DATA_DIR / filename)
@@ -0,0 +1,198 @@
+"""
+In-process timing spans and counters.
+Code paths wrap themselves in span(name); every span keeps a count, a running
+total, histogram buckets and a bounded window of recent durations for
+percentiles. A single block, such as one rerun, can additionally be captured
+with cProfile. Counters, cache statistics, active sessions and model details
+are kept here too; portal/metrics.py exposes all of it to Prometheus.
+"""
+
+import cProfile
+import functools
+import io
+import pstats
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+WINDOW = 1024  # recent durations kept per span for percentiles
+PERCENTILES = (50, 90, 99)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # histogram upper bounds in seconds
+ACTIVE_SESSION_WINDOW = 300  # seconds since its last rerun for a session to count as active
+
+
+class Timings:
+    """Thread-safe duration statistics per span name"""
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._spans = {}
+
+    def record(self, name, seconds):
+        with self._lock:
+            span = self._spans.get(name)
+            if span is None:
+                span = self._spans[name] = {'count': 0, 'total': 0.0, 'max': 0.0, 'recent': deque(maxlen=self.window),
+                                            'buckets': [0] * (len(BUCKETS) + 1)}
+            span['count'] += 1
+            span['total'] += seconds
+            span['max'] = max(span['max'], seconds)
+            span['recent'].append(seconds)
+            span['buckets'][bisect_left(BUCKETS, seconds)] += 1
+
+    @contextmanager
+    def span(self, name):
+        """Time the enclosed block under `name`; failures are timed too"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def names(self):
+        with self._lock:
+            return sorted(self._spans)
+
+    def snapshot(self, name):
+        """Count, total, recent durations and per-bucket counts (last one above BUCKETS) of one span, or None"""
+        with self._lock:
+            span = self._spans.get(name)
+            if span is None:
+                return None
+            return {'count': span['count'], 'total': span['total'], 'max': span['max'],
+                    'recent': list(span['recent']), 'buckets': list(span['buckets'])}
+
+    def summary(self, since=None):
+        """One row per span: count, mean, percentiles over the recent window and max, in milliseconds
+
+        since is a mark(); only the runs recorded after it are summarized
+        (percentiles and max then cover those of them still in the window).
+        """
+        since = since or {}
+        rows = []
+        for name in self.names():
+            span = self.snapshot(name)
+            base_count, base_total = since.get(name, (0, 0.0))
+            runs = span['count'] - base_count
+            if runs <= 0:
+                continue
+            recent = span['recent'][-runs:]
+            row = {'span': name, 'count': runs, 'mean_ms': (span['total'] - base_total) / runs * 1000}
+            for q, value in zip(PERCENTILES, np.percentile(recent, PERCENTILES)):
+                row[f'p{q}_ms'] = value * 1000
+            row['max_ms'] = (max(recent) if base_count else span['max']) * 1000
+            rows.append(row)
+        return rows
+
+    def mark(self):
+        """{span: (count, total)} now, to summarize only later runs without touching the recorded data"""
+        with self._lock:
+            return {name: (span['count'], span['total']) for name, span in self._spans.items()}
+
+    def percentile(self, name, q):
+        """Percentile q of the recent durations of a span in seconds, or None"""
+        span = self.snapshot(name)
+        return float(np.percentile(span['recent'], q)) if span else None
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+
+
+class Counters:
+    """Thread-safe monotonic counters"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def increment(self, name, amount=1):
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + amount
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._values)
+
+
+class SessionTracker:
+    """Last rerun time per browser session"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seen = {}
+
+    def touch(self, session_id):
+        with self._lock:
+            self._seen[session_id] = time.monotonic()
+
+    def active(self, window=ACTIVE_SESSION_WINDOW):
+        """Number of sessions that reran within `window` seconds; older ones are forgotten"""
+        cutoff = time.monotonic() - window
+        with self._lock:
+            self._seen = {session_id: seen for session_id, seen in self._seen.items() if seen >= cutoff}
+            return len(self._seen)
+
+
+TIMINGS = Timings()
+span = TIMINGS.span
+COUNTERS = Counters()
+count = COUNTERS.increment
+SESSIONS = SessionTracker()
+
+# name -> callable returning (hits, misses), and name -> dict of descriptive values
+_caches = {}
+_info = {}
+
+
+def register_cache(name, stats):
+    """Report the hit/miss counts of a cache; stats() returns (hits, misses)"""
+    _caches[name] = stats
+
+
+def cache_stats():
+    return {name: tuple(stats()) for name, stats in sorted(_caches.items())}
+
+
+def set_info(name, **values):
+    """Record descriptive values, such as the version of the loaded model"""
+    _info[name] = values
+
+
+def get_info(name):
+    return dict(_info.get(name, {}))
+
+
+def timed(name):
+    """Decorator form of span()"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def profiled(limit=40):
+    """Profile the enclosed block with cProfile
+
+    The yielded dict receives a 'report' with the top functions by
+    cumulative time, also when the block raises.
+    """
+    capture = {}
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield capture
+    finally:
+        profiler.disable()
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).strip_dirs().sort_stats('cumulative').print_stats(limit)
+        capture['report'] = out.getvalue()
@@ -0,0 +1,301 @@
+"""
+Light/dark theme definitions and the generated stylesheet.
+"""
+
+import re
+from functools import lru_cache
+
+import streamlit as st
+
+from portal.telemetry import register_cache
+
+THEMES = {
+    'Light': {
+        'primary_bg': '#FFFFFF',
+        'secondary_bg': '#F8F9FA',
+        'sidebar_bg': '#E9ECEF',
+        'text_color': '#212529',
+        'accent_color': '#0D6EFD',
+        'border_color': '#DEE2E6',
+        'card_bg': '#FFFFFF',
+        'card_shadow': 'rgba(0,0,0,0.1)',
+        'success_color': '#198754',
+        'warning_color': '#FFC107',
+        'danger_color': '#DC3545',
+        'info_color': '#0DCAF0'
+    },
+    'Dark': {
+        'primary_bg': '#0E1117',
+        'secondary_bg': '#262730',
+        'sidebar_bg': '#1E1E1E',
+        'text_color': '#FAFAFA',
+        'accent_color': '#FF6B6B',
+        'border_color': '#3B3B3B',
+        'card_bg': '#1E1E1E',
+        'card_shadow': 'rgba(255,255,255,0.1)',
+        'success_color': '#4CAF50',
+        'warning_color': '#FF9800',
+        'danger_color': '#F44336',
+        'info_color': '#2196F3'
+    }
+}
+
+# Layout styles shared by both theme modes; emitted before the themed rules so those override them
+BASE_CSS = """
+    .main-header {
+        font-size: 2.5rem;
+        font-weight: bold;
+        color: #2E8B57;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    
+    .metric-card {
+        background-color: #f0f2f6;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid #2E8B57;
+    }
+    
+    .alert-high {
+        border-left: 4px solid #ff4b4b;
+        background-color: #ffebee;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin: 1rem 0;
+    }
+    
+    .alert-medium {
+        border-left: 4px solid #ff9800;
+        background-color: #fff3e0;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin: 1rem 0;
+    }
+    
+    .alert-low {
+        border-left: 4px solid #2196f3;
+        background-color: #e3f2fd;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin: 1rem 0;
+    }
+    
+    .stButton > button {
+        width: 100%;
+        background-color: #2E8B57;
+        color: white;
+        border: none;
+        border-radius: 0.5rem;
+        padding: 0.5rem 1rem;
+    }
+    
+    .stButton > button:hover {
+        background-color: #246B47;
+    }
+"""
+
+
+def _minify_css(css):
+    """Strip comments and insignificant whitespace from a stylesheet"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r' ?([{};,>]) ?|(?<=:) ', r'\1', css).strip()
+
+
+@lru_cache(maxsize=None)
+def theme_css(theme_mode):
+    """Minified stylesheet and theme indicator markup for one theme mode, built once per process"""
+    theme = THEMES[theme_mode]
+    
+    stylesheet = f"""
+    /* Main app styling */
+    .stApp {{
+        background-color: {theme['primary_bg']};
+        color: {theme['text_color']};
+    }}
+    
+    /* Sidebar styling */
+    .css-1d391kg, .css-1lcbmhc {{
+        background-color: {theme['sidebar_bg']};
+    }}
+    
+    /* Main content area */
+    .main .block-container {{
+        background-color: {theme['primary_bg']};
+        color: {theme['text_color']};
+        padding: 2rem;
+    }}
+    
+    /* Cards and containers */
+    .card, div[data-testid="metric-container"] {{
+        background-color: {theme['card_bg']};
+        border: 1px solid {theme['border_color']};
+        border-radius: 8px;
+        padding: 1rem;
+        margin: 0.5rem 0;
+        box-shadow: 0 2px 4px {theme['card_shadow']};
+    }}
+    
+    /* Headings */
+    h1, h2, h3, h4, h5, h6 {{
+        color: {theme['text_color']};
+    }}
+    
+    /* Buttons */
+    .stButton > button {{
+        background-color: {theme['accent_color']};
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 0.5rem 1rem;
+        font-weight: 500;
+        transition: all 0.3s ease;
+    }}
+    
+    .stButton > button:hover {{
+        opacity: 0.8;
+        transform: translateY(-1px);
+    }}
+    
+    /* Form inputs */
+    .stTextInput > div > div > input,
+    .stNumberInput > div > div > input,
+    .stSelectbox > div > div > div,
+    .stTextArea textarea {{
+        background-color: {theme['card_bg']};
+        color: {theme['text_color']};
+        border: 1px solid {theme['border_color']};
+    }}
+    
+    /* Metrics */
+    div[data-testid="metric-container"] {{
+        background: linear-gradient(135deg, {theme['card_bg']} 0%, {theme['secondary_bg']} 100%);
+    }}
+    
+    div[data-testid="metric-container"] > div > div > div[data-testid="metric-value"] {{
+        color: {theme['accent_color']};
+        font-size: 1.5rem;
+        font-weight: bold;
+    }}
+    
+    /* Success/Warning/Error styling */
+    .success-box {{
+        background-color: {theme['success_color']};
+        color: white;
+        padding: 0.75rem;
+        border-radius: 6px;
+        margin: 0.5rem 0;
+    }}
+    
+    .warning-box {{
+        background-color: {theme['warning_color']};
+        color: white;
+        padding: 0.75rem;
+        border-radius: 6px;
+        margin: 0.5rem 0;
+    }}
+    
+    .error-box {{
+        background-color: {theme['danger_color']};
+        color: white;
+        padding: 0.75rem;
+        border-radius: 6px;
+        margin: 0.5rem 0;
+    }}
+    
+    .info-box {{
+        background-color: {theme['info_color']};
+        color: white;
+        padding: 0.75rem;
+        border-radius: 6px;
+        margin: 0.5rem 0;
+    }}
+    
+    /* Tabs */
+    .stTabs > div > div > div > div {{
+        color: {theme['text_color']};
+    }}
+    
+    .stTabs > div > div > div > div[aria-selected="true"] {{
+        color: {theme['accent_color']};
+        font-weight: bold;
+    }}
+    
+    /* Charts and plots */
+    .js-plotly-plot .plotly {{
+        background-color: {theme['card_bg']};
+    }}
+    
+    /* Tables */
+    .stDataFrame {{
+        background-color: {theme['card_bg']};
+        color: {theme['text_color']};
+    }}
+    
+    /* Progress bars */
+    .stProgress > div > div > div {{
+        background-color: {theme['accent_color']};
+    }}
+    
+    /* Expandable sections */
+    .streamlit-expanderHeader {{
+        background-color: {theme['card_bg']};
+        color: {theme['text_color']};
+        border: 1px solid {theme['border_color']};
+    }}
+    
+    /* Custom theme indicator */
+    .theme-indicator {{
+        position: fixed;
+        top: 10px;
+        right: 10px;
+        background-color: {theme['accent_color']};
+        color: white;
+        padding: 0.25rem 0.5rem;
+        border-radius: 12px;
+        font-size: 0.75rem;
+        z-index: 999;
+    }}
+    
+    /* Animations */
+    .fade-in {{
+        animation: fadeIn 0.5s ease-in;
+    }}
+    
+    @keyframes fadeIn {{
+        from {{ opacity: 0; }}
+        to {{ opacity: 1; }}
+    }}
+    
+    /* Theme transition */
+    .stApp, .main, .sidebar {{
+        transition: all 0.3s ease;
+    }}
+    """
+    
+    return (
+        f"<style>{_minify_css(BASE_CSS + stylesheet)}</style>"
+        f'<div class="theme-indicator fade-in">🎨 {theme_mode} Mode</div>'
+    )
+
+
+@lru_cache(maxsize=None)
+def theme_preview_html(theme_mode):
+    """Sidebar swatch of the active theme"""
+    theme = THEMES[theme_mode]
+    style = (
+        f"background: linear-gradient(135deg, {theme['accent_color']} 0%, {theme['card_bg']} 100%);"
+        "padding: 0.5rem; border-radius: 8px; text-align: center;"
+        f"color: {theme['text_color']}; margin: 0.5rem 0;"
+    )
+    return f'<div style="{style}"><small>🌟 {theme_mode} Theme Active</small></div>'
+
+
+register_cache("theme_css", lambda: theme_css.cache_info()[:2])
+register_cache("theme_preview", lambda: theme_preview_html.cache_info()[:2])
+
+
+def apply_custom_theme():
+    """Apply custom CSS theme based on selected mode"""
+    st.markdown(theme_css(st.session_state.theme_mode), unsafe_allow_html=True)
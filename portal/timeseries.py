@@ -0,0 +1,247 @@
+"""
+Recent sensor history per pen in fixed-size NumPy ring buffers.
+Every (Farm_ID, Pen_ID) gets a ring of `capacity` readings: int64 timestamps
+(nanoseconds) and a float32 row per reading with one column per feature.
+Appends are O(1); window queries slice the ring and select by time with one
+vectorized search. Rows appended since the last spill are periodically
+written to compact .npz segments, which other processes load to catch up
+and which warm the store after a restart.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from portal.storage import DATA_DIR
+
+TIMESERIES_DIR = DATA_DIR / "timeseries"
+FEATURES = ('Temp_C', 'Humidity_%', 'Ammonia_ppm', 'Weight_Kg')
+DEFAULT_CAPACITY = 4096  # readings kept per pen
+SPILL_INTERVAL = 30  # seconds between spills / segment syncs
+SEGMENT_RETENTION = 7 * 24 * 3600  # seconds of segments kept on disk
+
+
+class PenRing:
+    """Ring buffer of one pen's readings"""
+
+    def __init__(self, capacity, n_features):
+        self.times = np.zeros(capacity, dtype=np.int64)
+        self.values = np.full((capacity, n_features), np.nan, dtype=np.float32)
+        self.head = 0  # next slot to write
+        self.size = 0
+        self.appended = 0  # total appends, for spill bookkeeping
+        self.spilled = 0
+        self.ordered = True  # timestamps non-decreasing, so windows can binary-search
+
+    @property
+    def capacity(self):
+        return len(self.times)
+
+    def append(self, timestamp, values):
+        if self.size and timestamp < self.times[self.head - 1]:
+            self.ordered = False
+        self.times[self.head] = timestamp
+        self.values[self.head] = values
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        self.appended += 1
+
+    def extend(self, times, values):
+        """append() of many readings at once; only the newest `capacity` of them are written"""
+        n = len(times)
+        if not n:
+            return
+        if (self.size and times[0] < self.times[self.head - 1]) or (np.diff(times) < 0).any():
+            self.ordered = False
+        kept = min(n, self.capacity)
+        index = (self.head + n - kept + np.arange(kept)) % self.capacity
+        self.times[index] = times[-kept:]
+        self.values[index] = values[-kept:]
+        self.head = (self.head + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+        self.appended += n
+
+    def last(self, n):
+        """The newest n readings in append order, as (times, values) copies"""
+        n = min(n, self.size)
+        start = (self.head - n) % self.capacity
+        if start + n <= self.capacity:
+            return self.times[start:start + n].copy(), self.values[start:start + n].copy()
+        index = np.arange(start, start + n) % self.capacity
+        return self.times[index], self.values[index]
+
+
+class TimeSeriesStore:
+    """Thread-safe per-pen ring buffers of recent sensor readings"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, features=FEATURES):
+        self.capacity = capacity
+        self.features = tuple(features)
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()  # one load_segments() at a time, so no segment is loaded twice
+        self._rings = {}
+        self._loaded_segments = set()
+        self._synced = 0.0
+
+    def _ring(self, key):
+        ring = self._rings.get(key)
+        if ring is None:
+            ring = self._rings[key] = PenRing(self.capacity, len(self.features))
+        return ring
+
+    def append(self, farm_id, pen_id, timestamp, values):
+        """Add one reading; timestamp is a datetime-like or int nanoseconds, values follow self.features"""
+        if not isinstance(timestamp, (int, np.integer)):
+            timestamp = pd.Timestamp(timestamp).value
+        with self._lock:
+            self._ring((farm_id, pen_id)).append(timestamp, values)
+
+    def append_readings(self, readings, results=None):
+        """Add reading dicts (Farm_ID, Pen_ID, Timestamp and the features); signature fits IngestGateway.subscribe"""
+        if not readings:
+            return
+        times = pd.to_datetime([r['Timestamp'] for r in readings], format='ISO8601').as_unit('ns').asi8
+        values = np.array([[r.get(f, np.nan) for f in self.features] for r in readings], dtype=np.float32)
+        with self._lock:
+            for reading, timestamp, row in zip(readings, times, values):
+                self._ring((reading['Farm_ID'], reading['Pen_ID'])).append(timestamp, row)
+
+    def pens(self):
+        with self._lock:
+            return sorted(self._rings)
+
+    def window(self, farm_id, pen_id, seconds=None, last=None, after=None):
+        """(times, values) of a pen, oldest first
+
+        `last` limits the number of readings; `seconds` keeps those within that
+        span of the pen's newest reading (sensor time, not wall time); `after`
+        keeps those stamped later than that many nanoseconds.
+        """
+        with self._lock:
+            ring = self._rings.get((farm_id, pen_id))
+            if ring is None:
+                return np.empty(0, dtype=np.int64), np.empty((0, len(self.features)), dtype=np.float32)
+            times, values = ring.last(ring.size if last is None else last)
+            ordered = ring.ordered
+        if seconds is not None and len(times):
+            times, values = self._since(times, values, times.max() - int(seconds * 1e9), 'left', ordered)
+        if after is not None:
+            times, values = self._since(times, values, after, 'right', ordered)
+        return times, values
+
+    @staticmethod
+    def _since(times, values, cutoff, side, ordered):
+        """Readings from cutoff on ('left') or strictly after it ('right')"""
+        if ordered:
+            start = np.searchsorted(times, cutoff, side=side)
+            return times[start:], values[start:]
+        keep = times >= cutoff if side == 'left' else times > cutoff
+        return times[keep], values[keep]
+
+    def frame(self, farm_id, pen_id, seconds=None, last=None):
+        """window() as a DataFrame with a Timestamp column and one column per feature"""
+        times, values = self.window(farm_id, pen_id, seconds=seconds, last=last)
+        frame = pd.DataFrame(values, columns=list(self.features))
+        frame.insert(0, 'Timestamp', pd.to_datetime(times))
+        return frame
+
+    def latest(self):
+        """Newest reading of every pen, one row per pen"""
+        with self._lock:
+            rows = [(farm_id, pen_id, ring.times[ring.head - 1], ring.values[ring.head - 1])
+                    for (farm_id, pen_id), ring in sorted(self._rings.items()) if ring.size]
+        frame = pd.DataFrame([row[3] for row in rows], columns=list(self.features))
+        frame.insert(0, 'Timestamp', pd.to_datetime([row[2] for row in rows]))
+        frame.insert(0, 'Pen_ID', [row[1] for row in rows])
+        frame.insert(0, 'Farm_ID', [row[0] for row in rows])
+        return frame
+
+    # ---- Segments ----
+    def spill(self, directory=TIMESERIES_DIR):
+        """Write readings appended since the last spill to a new segment; returns its path or None
+
+        Readings overwritten before they were spilled are lost, so spill at
+        least once per `capacity` readings of the busiest pen.
+        """
+        pen_labels, times, values, counts = [], [], [], []
+        with self._lock:
+            for key, ring in sorted(self._rings.items()):
+                pending = min(ring.appended - ring.spilled, ring.size)
+                if pending <= 0:
+                    continue
+                pen_times, pen_values = ring.last(pending)
+                pen_labels.append(f"{key[0]}/{key[1]}")
+                times.append(pen_times)
+                values.append(pen_values)
+                counts.append(pending)
+                ring.spilled = ring.appended
+        if not counts:
+            return None
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"segment-{time.time_ns()}-{os.getpid()}.npz"
+        with self._lock:
+            self._loaded_segments.add(path.name)  # already in memory; claimed before a loader can see the file
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            np.savez_compressed(
+                f,
+                pens=np.array(pen_labels),
+                pen_index=np.repeat(np.arange(len(counts), dtype=np.int32), counts),
+                times=np.concatenate(times),
+                values=np.concatenate(values),
+                features=np.array(self.features),
+            )
+        os.replace(tmp_path, path)
+        return path
+
+    def load_segments(self, directory=TIMESERIES_DIR):
+        """Append the readings of segments not loaded yet, oldest first; returns the number of readings"""
+        directory = Path(directory)
+        if not directory.exists():
+            return 0
+        loaded = 0
+        with self._load_lock:
+            for path in sorted(directory.glob("segment-*.npz"), key=lambda p: int(p.stem.split('-')[1])):
+                if path.name in self._loaded_segments:
+                    continue
+                with np.load(path) as segment:
+                    columns = [list(segment['features']).index(f) if f in segment['features'] else None
+                               for f in self.features]
+                    seg_values = segment['values']
+                    values = np.column_stack([seg_values[:, c] if c is not None
+                                              else np.full(len(seg_values), np.nan)
+                                              for c in columns]).astype(np.float32)
+                    pens = [tuple(label.split('/', 1)) for label in segment['pens']]
+                    pen_index, times = segment['pen_index'], segment['times']
+                    order = np.argsort(pen_index, kind='stable')  # rows of each pen, in segment order
+                    bounds = np.searchsorted(pen_index[order], np.arange(len(pens) + 1))
+                    with self._lock:
+                        for pen, (start, end) in enumerate(zip(bounds[:-1], bounds[1:])):
+                            rows = order[start:end]
+                            ring = self._ring(pens[pen])
+                            ring.extend(times[rows], values[rows])
+                            ring.spilled = ring.appended
+                        self._loaded_segments.add(path.name)
+                    loaded += len(values)
+        return loaded
+
+    def sync(self, directory=TIMESERIES_DIR, interval=SPILL_INTERVAL):
+        """load_segments() at most once per interval, for readers fed by another process"""
+        if time.monotonic() - self._synced < interval:
+            return 0
+        self._synced = time.monotonic()
+        return self.load_segments(directory)
+
+
+def prune_segments(directory=TIMESERIES_DIR, retention=SEGMENT_RETENTION):
+    """Delete segments older than `retention` seconds"""
+    cutoff = time.time_ns() - int(retention * 1e9)
+    for path in Path(directory).glob("segment-*.npz"):
+        if int(path.stem.split('-')[1]) < cutoff:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,245 @@
+"""
+Training progress stored as per-user module bitmasks.
+Each registered module owns one bit, so completion checks are bit tests and
+cohort questions are vectorized bitwise queries over a NumPy array.
+"""
+
+import threading
+
+import numpy as np
+
+MAX_MODULES = 64  # one uint64 word per user
+
+
+def popcount(masks):
+    """Number of set bits per element of a uint64 array"""
+    masks = np.asarray(masks, dtype=np.uint64)
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(masks)
+    bits = np.unpackbits(masks.reshape(-1, 1).view(np.uint8), axis=1)
+    return bits.sum(axis=1).reshape(masks.shape)
+
+
+class ModuleCatalog:
+    """Registry assigning a stable bit position to every training module"""
+
+    def __init__(self, module_ids=()):
+        self._positions = {}
+        for module_id in module_ids:
+            self.register(module_id)
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, module_id):
+        return module_id in self._positions
+
+    @property
+    def module_ids(self):
+        return list(self._positions)
+
+    @property
+    def full_mask(self):
+        return (1 << len(self._positions)) - 1
+
+    def register(self, module_id):
+        """Register a module and return its bit position"""
+        if module_id not in self._positions:
+            if len(self._positions) >= MAX_MODULES:
+                raise ValueError(f"Cannot register more than {MAX_MODULES} training modules")
+            self._positions[module_id] = len(self._positions)
+        return self._positions[module_id]
+
+    def bit(self, module_id):
+        """Bit of a registered module"""
+        try:
+            return 1 << self._positions[module_id]
+        except KeyError:
+            raise ValueError(f"Unknown training module '{module_id}'. Valid options: {self.module_ids}") from None
+
+    def mask_of(self, module_ids):
+        """Bitmask with the bits of the given modules set"""
+        mask = 0
+        for module_id in module_ids:
+            mask |= self.bit(module_id)
+        return mask
+
+    def ids_of(self, mask):
+        """Module ids whose bits are set in mask, in catalog order"""
+        return [module_id for module_id, position in self._positions.items() if mask >> position & 1]
+
+    def is_completed(self, mask, module_id):
+        return bool(mask & self.bit(module_id))
+
+    def completion_rate(self, mask):
+        """Completion percentage of a mask over the registered modules"""
+        if not self._positions:
+            return 0
+        return (mask & self.full_mask).bit_count() / len(self._positions) * 100
+
+
+class TrainingProgressStore:
+    """Completion bitmasks for every user in one contiguous uint64 array"""
+
+    def __init__(self, catalog, capacity=1024):
+        self.catalog = catalog
+        self._lock = threading.Lock()
+        self._rows = {}
+        self._user_ids = []
+        self._masks = np.zeros(capacity, dtype=np.uint64)
+
+    @classmethod
+    def from_records(cls, catalog, training_data):
+        """Build the store from stored progress records
+
+        Records carry a 'modules_mask'; older records listing
+        'modules_completed' are converted on load.
+        """
+        store = cls(catalog, capacity=max(1024, len(training_data)))
+        for user_id, progress in training_data.items():
+            if 'modules_mask' in progress:
+                mask = int(progress['modules_mask'])
+            else:
+                mask = catalog.mask_of(m for m in progress.get('modules_completed', []) if m in catalog)
+            store.set_mask(user_id, mask)
+        return store
+
+    def __len__(self):
+        return len(self._user_ids)
+
+    def __contains__(self, user_id):
+        return user_id in self._rows
+
+    @property
+    def masks(self):
+        """Read-only view of the masks of all users, in registration order"""
+        view = self._masks[:len(self._user_ids)]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def user_ids(self):
+        return list(self._user_ids)
+
+    def _row(self, user_id):
+        row = self._rows.get(user_id)
+        if row is None:
+            row = len(self._user_ids)
+            if row == len(self._masks):
+                grown = np.zeros(2 * len(self._masks), dtype=np.uint64)
+                grown[:row] = self._masks
+                self._masks = grown
+            self._rows[user_id] = row
+            self._user_ids.append(user_id)
+        return row
+
+    def mask(self, user_id):
+        """Completion mask of a user (0 for unknown users)"""
+        row = self._rows.get(user_id)
+        return 0 if row is None else int(self._masks[row])
+
+    def set_mask(self, user_id, mask):
+        with self._lock:
+            row = self._row(user_id)
+            self._masks[row] = mask
+
+    def set_completed(self, user_id, module_id, completed=True):
+        """Mark a module completed (or reset it) and return the new mask"""
+        bit = self.catalog.bit(module_id)
+        with self._lock:
+            row = self._row(user_id)
+            mask = int(self._masks[row])
+            mask = mask | bit if completed else mask & ~bit
+            self._masks[row] = mask
+        return mask
+
+    def completion_rates(self):
+        """Completion percentage of every user, vectorized"""
+        if not len(self.catalog):
+            return np.zeros(len(self), dtype=float)
+        full = np.uint64(self.catalog.full_mask)
+        return popcount(self.masks & full) * (100 / len(self.catalog))
+
+    def cohort(self, completed=(), not_completed=()):
+        """Boolean array over users who finished all of `completed` and none of `not_completed`"""
+        required = np.uint64(self.catalog.mask_of(completed))
+        excluded = np.uint64(self.catalog.mask_of(not_completed))
+        masks = self.masks
+        return ((masks & required) == required) & ((masks & excluded) == 0)
+
+    def cohort_users(self, completed=(), not_completed=()):
+        """User ids matching cohort()"""
+        rows = np.flatnonzero(self.cohort(completed, not_completed))
+        return [self._user_ids[row] for row in rows]
+
+
+# Training modules
+TRAINING_MODULES = [
+    {
+        'id': 'farm_hygiene',
+        'title': 'Farm Hygiene & Sanitation',
+        'icon': '🧼',
+        'description': 'Learn proper cleaning and disinfection protocols',
+        'content': [
+            'Daily cleaning schedules for different farm areas',
+            'Proper disinfectant selection and usage',
+            'Personal protective equipment (PPE) requirements',
+            'Hand washing and foot bath protocols',
+            'Equipment sanitization procedures'
+        ]
+    },
+    {
+        'id': 'feed_storage',
+        'title': 'Feed Storage & Management',
+        'icon': '🌾',
+        'description': 'Best practices for feed storage and handling',
+        'content': [
+            'Proper storage conditions (temperature, humidity)',
+            'Pest control in storage areas',
+            'Feed quality inspection procedures',
+            'FIFO (First In, First Out) rotation system',
+            'Contamination prevention measures'
+        ]
+    },
+    {
+        'id': 'worker_protocols',
+        'title': 'Worker Entry Protocols',
+        'icon': '👥',
+        'description': 'Staff and visitor biosecurity protocols',
+        'content': [
+            'Visitor registration and screening',
+            'Protective clothing requirements',
+            'Shower and changing procedures',
+            'Vehicle disinfection protocols',
+            'Emergency response procedures'
+        ]
+    },
+    {
+        'id': 'waste_management',
+        'title': 'Waste Management',
+        'icon': '♻️',
+        'description': 'Proper waste disposal and treatment',
+        'content': [
+            'Waste segregation and classification',
+            'Treatment and disposal methods',
+            'Composting procedures for organic waste',
+            'Liquid waste management',
+            'Record keeping and documentation'
+        ]
+    },
+    {
+        'id': 'disease_prevention',
+        'title': 'Disease Prevention',
+        'icon': '🛡️',
+        'description': 'Disease prevention and early detection',
+        'content': [
+            'Common disease symptoms identification',
+            'Vaccination schedules and protocols',
+            'Quarantine procedures for new animals',
+            'Early warning signs and reporting',
+            'Emergency response protocols'
+        ]
+    }
+]
+
+TRAINING_CATALOG = ModuleCatalog(module['id'] for module in TRAINING_MODULES)
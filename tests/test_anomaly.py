@@ -0,0 +1,23 @@
+import numpy as np
+
+from portal.anomaly import AnomalyEngine, series_key
+
+MINUTE = 60 * 10**9
+
+
+def test_stable_quantized_series_raises_no_flags():
+    rng = np.random.default_rng(0)
+    values = np.round(60 + rng.normal(0, 0.4, 2000))  # integer humidity: the rolling MAD is mostly 0
+    engine = AnomalyEngine()
+    results = engine.update_series(series_key('pen', 'F1', 'P1', 'Humidity_%'), np.arange(2000) * MINUTE, values)
+    assert len(results) == 2000
+    assert not any(result['anomaly'] for result in results)
+
+
+def test_quantized_series_still_flags_a_jump():
+    rng = np.random.default_rng(0)
+    values = np.round(60 + rng.normal(0, 0.4, 2000))
+    values[1500] = 70
+    engine = AnomalyEngine()
+    results = engine.update_series(series_key('pen', 'F1', 'P1', 'Humidity_%'), np.arange(2000) * MINUTE, values)
+    assert [i for i, result in enumerate(results) if result['anomaly']] == [1500]
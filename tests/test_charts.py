@@ -0,0 +1,18 @@
+import numpy as np
+import pandas as pd
+
+from portal.charts import bar_chart, histogram_chart
+
+
+def test_bar_and_histogram_keep_full_totals_when_drawn_from_a_sample():
+    rows = 100_000
+    frame = pd.DataFrame({'Pen': np.arange(rows) % 5, 'Birds': np.ones(rows)})
+    sample = frame.sample(20_000, random_state=0)
+
+    assert bar_chart(frame, x='Pen', y='Birds').data[0].y.sum() == rows
+    estimated = bar_chart(sample, x='Pen', y='Birds', total_rows=rows, title="Birds by Pen")
+    assert estimated.data[0].y.sum() == rows
+    assert 'estimated' in estimated.layout.title.text
+
+    assert histogram_chart(frame, 'Birds').data[0].y.sum() == rows
+    assert histogram_chart(sample, 'Birds', total_rows=rows).data[0].y.sum() == rows
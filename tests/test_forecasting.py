@@ -0,0 +1,13 @@
+import pandas as pd
+
+from portal.forecasting import farm_daily_series
+from portal.ml import DISEASE_CSV
+
+
+def test_farm_series_from_the_raw_csv_keeps_healthy_readings():
+    df = pd.read_csv(DISEASE_CSV)
+    series = farm_daily_series(df)
+    f1 = series['F1']
+    assert f1['risk_score'].nunique() > 1
+    readings = (df['Farm_ID'] == 'F1').sum()
+    assert 0 < f1['incidents'].sum() < readings
@@ -0,0 +1,20 @@
+import math
+
+import pytest
+
+from portal.ml import load_and_train_ml_model, predict_animal_health_batch
+
+
+@pytest.fixture(scope='module')
+def ml_models():
+    return load_and_train_ml_model()
+
+
+def test_batch_rejects_non_finite_input_on_its_own(ml_models):
+    row = ml_models['dataset'].iloc[0]
+    valid = {name: row[name].item() if hasattr(row[name], 'item') else row[name]
+             for name in ml_models['feature_names']}
+    inputs = [valid, {**valid, 'Temp_C': math.inf}, {**valid, 'Humidity_%': -math.inf}, valid]
+    results = predict_animal_health_batch(inputs, ml_models)
+    assert [result.get('success', False) for result in results] == [True, False, False, True]
+    assert 'non-finite' in results[1]['error']